@@ -5,9 +5,15 @@ Aplicación principal que integra todos los componentes modulares
 
 import sys
 import os
+from datetime import time
+from time import perf_counter
+
+# Inicio del proceso (aprox.) para medir el arranque con WTF_STARTUP_TIMING=1
+STARTUP_T0 = perf_counter()
+
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QHBoxLayout, 
                            QVBoxLayout, QSplitter, QStatusBar, QMessageBox, QFileDialog, 
-                           QDialog, QInputDialog)
+                           QDialog, QInputDialog, QTabWidget)
 from PyQt5.QtCore import Qt, QTimer, pyqtSlot
 from PyQt5.QtGui import QPalette, QColor, QIcon
 
@@ -16,22 +22,34 @@ from src.ui.main_menu import MainMenuBar
 from src.ui.trading_table import TradingTableWidget
 from src.ui.summary_panel import SummaryPanel
 from src.ui.enhanced_chart_widget import EnhancedChartWidget
+from src.ui.projection_chart_widget import ProjectionChartWidget
+from src.ui.history_chart_widget import HistoryChartWidget
+from src.ui.calendar_heatmap_widget import CalendarHeatmapWidget
+from src.ui.return_distribution_widget import ReturnDistributionWidget
+from src.ui.drawdown_chart_widget import DrawdownChartWidget
 from src.ui.capital_dialog import CapitalDialog
-from src.ui.export_dialog import show_export_dialog
 from src.models.trading_model_with_db import TradingDataModelWithDB
-from src.models.ai_analyzer import AIAnalyzer
+from src.models.analysis_pipeline import AnalysisPipeline
+from src.ui.analysis_worker import AnalysisWorker, BatchAnalysisWorker
+from src.ui.refresh_scheduler import RefreshScheduler
 from src.styles.themes import ThemeManager
-from src.utils.advice import get_daily_advice, get_weekly_summary_message
+from src.utils.advice import get_daily_advice, get_weekly_summary_message, AdviceCache, advice_snapshot
+from src.utils import i18n
 from src.utils.i18n import tr, set_language
 from src.ui.load_week_dialog import LoadWeekDialog
 
+# Día (0=Lunes ... 5=Sábado) y hora en que se cierra la semana y se crea la siguiente
+ROLLOVER_WEEKDAY = 5
+ROLLOVER_TIME = time(0, 0)
+
+
 class MainWindow(QMainWindow):
     """Ventana principal de la aplicación W-T-F Trading Manager"""
     
     def __init__(self):
         super().__init__()
         self.data_model = None
-        self.ai_analyzer = None
+        self.analysis_worker = None
         self.theme_manager = None
         self.dark_mode = False  # Agregar atributo dark_mode
         self.setup_ui()
@@ -57,7 +75,11 @@ class MainWindow(QMainWindow):
         
         # Crear modelo de datos
         self.data_model = TradingDataModelWithDB()
-        self.ai_analyzer = AIAnalyzer()
+        # Análisis y consejos en segundo plano (solo se aplica el resultado más reciente)
+        self.advice_cache = AdviceCache()
+        self.analysis_worker = AnalysisWorker(AnalysisPipeline(), self.advice_cache, self)
+        self.analysis_worker.analysis_ready.connect(self.on_analysis_ready)
+        self.analysis_worker.start()
         self.theme_manager = ThemeManager()
         
         # Crear menú principal
@@ -84,9 +106,41 @@ class MainWindow(QMainWindow):
         self.table_widget = TradingTableWidget(self.data_model)
         left_layout.addWidget(self.table_widget)
         
-        # Gráfico mejorado
+        # Pestañas de gráficos: semana actual, historial, calendario, distribución y proyección
+        self.chart_tabs = QTabWidget()
+        left_layout.addWidget(self.chart_tabs)
+
+        # Gráfico mejorado y, debajo, el drawdown del historial
         self.chart_widget = EnhancedChartWidget()
-        left_layout.addWidget(self.chart_widget)
+        self.drawdown_widget = DrawdownChartWidget()
+        self.drawdown_widget.set_data_model(self.data_model)
+        self.weekly_splitter = QSplitter(Qt.Vertical)
+        self.weekly_splitter.addWidget(self.chart_widget)
+        self.weekly_splitter.addWidget(self.drawdown_widget)
+        self.weekly_splitter.setStretchFactor(0, 3)
+        self.weekly_splitter.setStretchFactor(1, 1)
+        self.chart_tabs.addTab(self.weekly_splitter, tr("weekly_chart_tab"))
+
+        # Curva de saldo de todo el historial (se carga al abrir la pestaña)
+        self.history_widget = HistoryChartWidget()
+        self.history_widget.set_data_model(self.data_model)
+        self.chart_tabs.addTab(self.history_widget, tr("history_tab"))
+
+        # Mapa de calor de calendario con el resultado de cada jornada
+        self.heatmap_widget = CalendarHeatmapWidget()
+        self.heatmap_widget.set_data_model(self.data_model)
+        self.chart_tabs.addTab(self.heatmap_widget, tr("heatmap_tab"))
+
+        # Histograma de los resultados diarios (conteos incrementales)
+        self.distribution_widget = ReturnDistributionWidget()
+        self.distribution_widget.set_data_model(self.data_model)
+        self.chart_tabs.addTab(self.distribution_widget, tr("distribution_tab"))
+
+        # Gráfico de abanico con la proyección Monte Carlo
+        self.projection_widget = ProjectionChartWidget()
+        self.projection_widget.set_data_model(self.data_model)
+        self.chart_tabs.addTab(self.projection_widget, tr("projection_tab"))
+        self.chart_tabs.currentChanged.connect(self.on_chart_tab_changed)
         
         # Panel derecho: Resumen y análisis
         self.summary_panel = SummaryPanel()
@@ -112,6 +166,12 @@ class MainWindow(QMainWindow):
         
         # Cargar datos iniciales
         self.load_initial_data()
+        
+        # Refrescos por tiempo: consejo a medianoche y rollover el día configurado
+        self.refresh_scheduler = RefreshScheduler(ROLLOVER_WEEKDAY, ROLLOVER_TIME, self)
+        self.refresh_scheduler.day_changed.connect(self.on_day_changed)
+        self.refresh_scheduler.rollover_due.connect(self.on_rollover_due)
+        self.refresh_scheduler.start()
         # Actualizar título con la semana actual tras cargar datos
         try:
             self.update_window_title_with_week()
@@ -144,10 +204,12 @@ class MainWindow(QMainWindow):
         self.menu_bar.show_daily_advice_triggered.connect(self.show_daily_advice)
         self.menu_bar.daily_advice_visibility_changed.connect(self.on_toggle_daily_advice_visibility)
         self.menu_bar.show_weekly_summary_triggered.connect(self.show_weekly_summary_notification)
+        self.menu_bar.batch_analysis_triggered.connect(self.run_batch_analysis)
         self.menu_bar.start_new_week_triggered.connect(self.start_new_week_reset)
         self.menu_bar.export_excel_triggered.connect(self.export_to_excel)
         self.menu_bar.export_csv_triggered.connect(self.export_to_csv)
         self.menu_bar.export_json_triggered.connect(self.export_to_json)
+        self.menu_bar.export_week_charts_triggered.connect(self.export_week_charts)
         # Visibilidad de leyenda del gráfico
         self.menu_bar.legend_visibility_changed.connect(self.on_toggle_legend)
         # Cambio de idioma desde la barra de menú
@@ -178,10 +240,15 @@ class MainWindow(QMainWindow):
         
         # Actualizar gráfico
         self.chart_widget.set_theme(is_dark)
+        self.drawdown_widget.set_theme(is_dark)
+        self.history_widget.set_theme(is_dark)
+        self.heatmap_widget.set_theme(is_dark)
+        self.distribution_widget.set_theme(is_dark)
+        self.projection_widget.set_theme(is_dark)
         # Forzar refresco del gráfico para aplicar nuevos colores
         try:
             if self.data_model:
-                self.chart_widget.update_chart(self.data_model)
+                self.chart_widget.request_redraw(self.data_model)
         except Exception:
             pass
         
@@ -211,6 +278,14 @@ class MainWindow(QMainWindow):
             if isinstance(widget, (QDialog, QFileDialog, QInputDialog, QMessageBox)):
                 widget.setStyleSheet(self.theme_manager.get_widget_styles(is_dark))
 
+    def on_chart_tab_changed(self, index: int):
+        """Calcular la proyección al abrir su pestaña (evita trabajo si no se consulta)."""
+        try:
+            if self.chart_tabs.widget(index) is self.projection_widget:
+                self.projection_widget.refresh()
+        except Exception as e:
+            print(f"Error al actualizar la proyección: {e}")
+
     def on_toggle_legend(self, visible: bool):
         """Mostrar u ocultar la leyenda del gráfico desde el menú."""
         try:
@@ -229,15 +304,8 @@ class MainWindow(QMainWindow):
                 self.status_bar.showMessage("✅ " + tr("initial_data_loaded_db"), 3000)
                 # Consejos al cargar datos
                 self.show_daily_advice()
-                # Si es sábado, mostrar resumen semanal
-                try:
-                    from datetime import datetime
-                    if datetime.now().weekday() == 5:
-                        self.show_weekly_summary_notification()
-                        # Realizar rollover automático a la nueva semana
-                        self.perform_saturday_rollover()
-                except Exception:
-                    pass
+                # Si ya es día de rollover, mostrar resumen y crear la nueva semana
+                self._rollover_if_due()
             else:
                 # Si no hay datos, preguntar por el capital inicial
                 self.ask_for_initial_capital()
@@ -245,15 +313,7 @@ class MainWindow(QMainWindow):
                 self.update_chart()
                 self.status_bar.showMessage("ℹ️ " + tr("no_previous_data_new_week"), 3000)
                 self.show_daily_advice()
-                # Si es sábado, mostrar resumen semanal
-                try:
-                    from datetime import datetime
-                    if datetime.now().weekday() == 5:
-                        self.show_weekly_summary_notification()
-                        # Realizar rollover automático a la nueva semana
-                        self.perform_saturday_rollover()
-                except Exception:
-                    pass
+                self._rollover_if_due()
                 
         except Exception as e:
             QMessageBox.warning(self, tr("warning"), 
@@ -262,6 +322,30 @@ class MainWindow(QMainWindow):
             # Asegurar que el gráfico se actualice incluso si hay error
             self.update_chart()
     
+    def _rollover_if_due(self):
+        """Mostrar el resumen semanal y hacer el rollover si hoy es el día configurado"""
+        try:
+            from datetime import datetime
+            if datetime.now().weekday() == ROLLOVER_WEEKDAY and datetime.now().time() >= ROLLOVER_TIME:
+                self.show_weekly_summary_notification()
+                # Realizar rollover automático a la nueva semana
+                self.perform_saturday_rollover()
+        except Exception as e:
+            print(f"Error en el rollover semanal: {e}")
+
+    @pyqtSlot()
+    def on_day_changed(self):
+        """Medianoche: el consejo cacheado deja de ser válido"""
+        self.advice_cache.clear()
+        self.update_summary()
+
+    @pyqtSlot()
+    def on_rollover_due(self):
+        """Llegó el día/hora de rollover con la ventana abierta"""
+        self.advice_cache.clear()
+        self._rollover_if_due()
+        self.update_summary()
+
     @pyqtSlot()
     def on_data_changed(self):
         """Manejar cambios en los datos"""
@@ -279,21 +363,25 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, tr("error"), f"{tr('operation_failed')}: {str(e)}")
     
     def update_chart(self):
-        """Actualizar el gráfico con datos actuales"""
+        """Pedir el repintado del gráfico (se agrupa con otros del mismo ciclo de eventos)"""
         try:
-            self.chart_widget.update_chart(self.data_model)
+            self.chart_widget.request_redraw(self.data_model)
+            # El motor de riesgo ya recalculó la cola al guardar: solo se repinta lo que cambió
+            self.drawdown_widget.request_refresh()
+            # Diferido al próximo ciclo: se recarga ya guardado (y solo si su pestaña está visible)
+            self.history_widget.request_refresh()
+            # En el mapa de calor solo cambia la celda editada
+            self.heatmap_widget.update_from_model(self.data_model)
+            self.distribution_widget.update_from_model(self.data_model)
         except Exception as e:
             print(f"Error al actualizar gráfico: {e}")
     
     def update_summary(self):
-        """Actualizar el panel de resumen con análisis AI"""
+        """Actualizar el panel de resumen; el análisis AI y el consejo se calculan en segundo plano"""
         try:
             # Obtener resumen de datos
             summary_data = self.data_model.get_weekly_summary()
             
-            # Generar análisis AI
-            ai_analysis = self.ai_analyzer.analyze_weekly_performance(summary_data, self.data_model.data)
-            
             # Preparar datos del capital
             capital_data = {
                 'initial_capital': self.data_model.initial_capital,
@@ -301,15 +389,25 @@ class MainWindow(QMainWindow):
                 'total_profit_loss': self.data_model.get_total_profit_loss(),
                 'profit_loss_percentage': self.data_model.get_profit_loss_percentage()
             }
+            # Métricas incrementales y cacheadas por cuenta: baratas, se aplican al instante
+            risk_metrics = self.data_model.get_risk_metrics()
+            self.summary_panel.update_risk_metrics(risk_metrics)
+            self.summary_panel.update_anomalies(getattr(self.data_model, 'anomalies', {}))
+            self.summary_panel.update_forecast(self.data_model.get_forecast())
+            self.summary_panel.update_regime(self.data_model.get_current_regime())
             
-            # Actualizar panel
-            self.summary_panel.update_summary(summary_data, ai_analysis, capital_data)
-            # Actualizar consejo del día
-            try:
-                advice = get_daily_advice(self.data_model)
-                self.summary_panel.update_daily_advice(advice)
-            except Exception:
-                pass
+            # Analizadores y consejo del día en el worker (con copia de los datos de la semana:
+            # totales, saldo y retiro recomendado se calculan aquí, en el hilo de la UI)
+            weekday_stats = self.data_model.get_weekday_stats()
+            self.analysis_worker.submit({
+                'summary': summary_data,
+                'daily_data': {day: dict(values) for day, values in self.data_model.data.items()},
+                'capital_data': capital_data,
+                'risk_metrics': risk_metrics,
+                'weekday_stats': weekday_stats,
+                'language': i18n.current_language,
+                'advice': advice_snapshot(self.data_model, risk_metrics, weekday_stats),
+            })
             
         except Exception as e:
             print(f"Error al actualizar resumen: {e}")
@@ -329,10 +427,24 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
 
+    @pyqtSlot(int, dict)
+    def on_analysis_ready(self, generation: int, payload: dict):
+        """Aplicar el resultado del worker solo si corresponde a la última edición"""
+        if not self.analysis_worker.is_current(generation):
+            return
+        try:
+            self.summary_panel.update_summary(payload['summary'], payload['ai_analysis'], payload['capital_data'])
+            if payload.get('advice'):
+                self.summary_panel.update_daily_advice(payload['advice'])
+        except Exception as e:
+            print(f"Error al aplicar el análisis: {e}")
+
     def show_daily_advice(self):
         """Mostrar consejo del día en el panel y en la barra de estado."""
         try:
-            advice = get_daily_advice(self.data_model)
+            # Mismas entradas que el worker: ambos comparten la entrada de la caché
+            advice = self.advice_cache.get(advice_snapshot(self.data_model, self.data_model.get_risk_metrics(),
+                                                           self.data_model.get_weekday_stats()))
             self.summary_panel.update_daily_advice(advice)
             self.status_bar.showMessage("📌 " + tr("daily_advice"), 3000)
         except Exception as e:
@@ -355,6 +467,60 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.warning(self, tr("warning"), f"{tr('operation_failed')}: {e}")
 
+    def run_batch_analysis(self):
+        """Analizar todas las semanas guardadas en segundo plano (omite las que no cambiaron)"""
+        if getattr(self, 'batch_worker', None) is not None and self.batch_worker.isRunning():
+            return
+        self.update_save_status(tr('batch_analysis_running'))
+        self.batch_worker = BatchAnalysisWorker(self.data_model.db_manager, self)
+        self.batch_worker.batch_completed.connect(self.on_batch_analysis_completed)
+        self.batch_worker.batch_error.connect(
+            lambda error: QMessageBox.warning(self, tr("warning"), f"{tr('operation_failed')}: {error}"))
+        self.batch_worker.start()
+
+    def on_batch_analysis_completed(self, stats: dict):
+        """Informar del resultado del análisis por lotes"""
+        self.update_save_status(tr('batch_analysis_done'))
+        QMessageBox.information(self, tr('batch_analysis'), tr('batch_analysis_result').format(**stats))
+
+    def export_week_charts(self):
+        """Exportar el gráfico de cada semana guardada (o de un rango) a una carpeta, en segundo plano"""
+        if getattr(self, 'chart_export_worker', None) is not None and self.chart_export_worker.isRunning():
+            return
+        fmt, ok = QInputDialog.getItem(self, tr('export_week_charts'), tr('chart_export_format_prompt'),
+                                       ['png', 'svg'], 0, False)
+        if not ok:
+            return
+        ranges = [tr('chart_export_range_all'), tr('chart_export_range_year'), tr('chart_export_range_52')]
+        scope, ok = QInputDialog.getItem(self, tr('export_week_charts'), tr('chart_export_range_prompt'),
+                                         ranges, 0, False)
+        if not ok:
+            return
+        out_dir = QFileDialog.getExistingDirectory(self, tr('export_week_charts'))
+        if not out_dir:
+            return
+        from datetime import datetime, timedelta
+        today = datetime.now().date()
+        start_date = None
+        if scope == ranges[1]:
+            start_date = today.replace(month=1, day=1).isoformat()
+        elif scope == ranges[2]:
+            start_date = (today - timedelta(weeks=52)).isoformat()
+
+        self.update_save_status(tr('chart_export_running'))
+        from src.ui.export_dialog import BatchChartExportWorker
+        self.chart_export_worker = BatchChartExportWorker(self.data_model.db_manager, out_dir, fmt,
+                                                          start_date=start_date, is_dark=self.dark_mode, parent=self)
+        self.chart_export_worker.export_completed.connect(self.on_week_charts_exported)
+        self.chart_export_worker.export_error.connect(
+            lambda error: QMessageBox.warning(self, tr("warning"), f"{tr('export_error')}: {error}"))
+        self.chart_export_worker.start()
+
+    def on_week_charts_exported(self, stats: dict):
+        """Informar del resultado de la exportación de gráficos"""
+        self.update_save_status(tr('chart_export_done_status'))
+        QMessageBox.information(self, tr('export_week_charts'), tr('chart_export_result').format(**stats))
+
     def perform_saturday_rollover(self):
         """Si es sábado, crea automáticamente la nueva semana para el lunes próximo con capital actualizado.
         Evita sobreescribir la semana previa creando un nuevo registro y archivo con datos en cero.
@@ -372,10 +538,9 @@ class MainWindow(QMainWindow):
             if self.data_model.week_start_date >= next_monday_date:
                 return
 
-            # Calcular retiro recomendado y nuevo capital
-            total = float(self.data_model.get_total_profit_loss())
+            # Calcular retiro recomendado (según la política activa) y nuevo capital
             balance = float(self.data_model.get_current_balance())
-            withdraw = max(0.0, total) * 0.30
+            withdraw = float(self.data_model.get_recommended_withdrawal())
             new_initial = max(0.0, balance - withdraw)
 
             # Crear nueva semana en el modelo/BD
@@ -435,9 +600,8 @@ class MainWindow(QMainWindow):
                 QMessageBox.information(self, tr("information"), tr("operation_completed"))
                 return
 
-            total = float(self.data_model.get_total_profit_loss())
             balance = float(self.data_model.get_current_balance())
-            withdraw = max(0.0, total) * 0.30
+            withdraw = float(self.data_model.get_recommended_withdrawal())
             new_initial = max(0.0, balance - withdraw)
 
             created = self.data_model.start_new_week(next_monday_date, new_initial)
@@ -482,6 +646,18 @@ class MainWindow(QMainWindow):
         # Retraducir gráfico
         if hasattr(self.chart_widget, 'apply_language'):
             self.chart_widget.apply_language()
+        self.drawdown_widget.apply_language()
+        self.history_widget.apply_language()
+        self.heatmap_widget.apply_language()
+        self.distribution_widget.apply_language()
+        self.projection_widget.apply_language()
+        # Regenerar análisis en el nuevo idioma (la huella incluye el idioma)
+        self.update_summary()
+        self.chart_tabs.setTabText(self.chart_tabs.indexOf(self.weekly_splitter), tr("weekly_chart_tab"))
+        self.chart_tabs.setTabText(self.chart_tabs.indexOf(self.history_widget), tr("history_tab"))
+        self.chart_tabs.setTabText(self.chart_tabs.indexOf(self.heatmap_widget), tr("heatmap_tab"))
+        self.chart_tabs.setTabText(self.chart_tabs.indexOf(self.distribution_widget), tr("distribution_tab"))
+        self.chart_tabs.setTabText(self.chart_tabs.indexOf(self.projection_widget), tr("projection_tab"))
     
     @pyqtSlot(str)
     def update_save_status(self, status):
@@ -671,7 +847,8 @@ class MainWindow(QMainWindow):
             # Número de semana basado en fecha de inicio
             week_number = self.data_model.week_start_date.isocalendar()[1]
             
-            # Mostrar diálogo de exportación
+            # Mostrar diálogo de exportación (importado al usarlo: carga pandas y matplotlib)
+            from src.ui.export_dialog import show_export_dialog
             show_export_dialog(weekly_data, week_number, self)
             
         except Exception as e:
@@ -689,7 +866,8 @@ class MainWindow(QMainWindow):
             weekly_data = self.data_model.get_weekly_data()
             week_number = self.data_model.week_start_date.isocalendar()[1]
             
-            # Mostrar diálogo de exportación
+            # Mostrar diálogo de exportación (importado al usarlo: carga pandas y matplotlib)
+            from src.ui.export_dialog import show_export_dialog
             show_export_dialog(weekly_data, week_number, self)
             
         except Exception as e:
@@ -707,7 +885,8 @@ class MainWindow(QMainWindow):
             weekly_data = self.data_model.get_weekly_data()
             week_number = self.data_model.week_start_date.isocalendar()[1]
             
-            # Mostrar diálogo de exportación
+            # Mostrar diálogo de exportación (importado al usarlo: carga pandas y matplotlib)
+            from src.ui.export_dialog import show_export_dialog
             show_export_dialog(weekly_data, week_number, self)
             
         except Exception as e:
@@ -719,12 +898,17 @@ class MainWindow(QMainWindow):
         try:
             # Guardar estado actual antes de cerrar
             self.data_model.save_current_week()
+            self.refresh_scheduler.stop()
+            self.analysis_worker.stop()
+            self.projection_widget.shutdown()
             event.accept()
         except Exception as e:
             reply = QMessageBox.question(self, tr("confirm_close_title"),
                                        f"{tr('save_error')}: {str(e)}\n{tr('close_anyway_question')}",
                                        QMessageBox.Yes | QMessageBox.No)
             if reply == QMessageBox.Yes:
+                self.analysis_worker.stop()
+                self.projection_widget.shutdown()
                 event.accept()
             else:
                 event.ignore()
@@ -752,6 +936,15 @@ def main():
     # Crear y mostrar ventana principal
     window = MainWindow()
     window.show()
+    startup_timing = os.environ.get('WTF_STARTUP_TIMING')
+    if startup_timing:
+        # Se ejecuta tras el primer ciclo de eventos: la ventana ya está pintada.
+        # Con WTF_STARTUP_TIMING=exit se cierra al medir (para repetir la medida en bucle)
+        def report_startup():
+            print(f"Arranque hasta la primera ventana: {(perf_counter() - STARTUP_T0) * 1000:.0f} ms", flush=True)
+            if startup_timing == 'exit':
+                window.close()  # Cierre normal: guarda la semana y detiene los hilos
+        QTimer.singleShot(0, report_startup)
     
     sys.exit(app.exec_())
 
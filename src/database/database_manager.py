@@ -52,6 +52,16 @@ class DatabaseManager:
                     )
                 ''')
                 
+                # Crear tabla de caché de análisis por semana (clave: semana + hash de sus datos)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS analysis_cache (
+                        week_start_date TEXT PRIMARY KEY,
+                        data_hash TEXT NOT NULL,
+                        result TEXT NOT NULL,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+                
                 conn.commit()
         except sqlite3.Error as e:
             print(f"Error al inicializar la base de datos: {e}")
@@ -189,4 +199,100 @@ class DatabaseManager:
                 
         except sqlite3.Error as e:
             print(f"Error al obtener todas las semanas: {e}")
-            return []
\ No newline at end of file
+            return []
+
+    def get_config(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Leer un valor de la tabla de configuración"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT value FROM app_config WHERE key = ?', (key,))
+                row = cursor.fetchone()
+                return row[0] if row else default
+
+        except sqlite3.Error as e:
+            print(f"Error al leer configuración '{key}': {e}")
+            return default
+
+    def set_config(self, key: str, value: str) -> bool:
+        """Guardar (o reemplazar) un valor en la tabla de configuración"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    INSERT INTO app_config (key, value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = CURRENT_TIMESTAMP
+                ''', (key, value))
+                conn.commit()
+                return True
+
+        except sqlite3.Error as e:
+            print(f"Error al guardar configuración '{key}': {e}")
+            return False
+
+    def get_history_rows(self, start_date: Optional[str] = None,
+                         end_date: Optional[str] = None) -> List[tuple]:
+        """Obtener el historial en bruto (una fila por semana) en orden cronológico.
+        Cada fila: (week_start_date, lunes, martes, miercoles, jueves, viernes, initial_capital).
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+
+                query = '''
+                    SELECT week_start_date, lunes_amount, martes_amount, miercoles_amount,
+                           jueves_amount, viernes_amount, initial_capital
+                    FROM trading_weeks
+                    WHERE (? IS NULL OR week_start_date >= ?)
+                      AND (? IS NULL OR week_start_date <= ?)
+                    ORDER BY week_start_date ASC
+                '''
+                cursor.execute(query, (start_date, start_date, end_date, end_date))
+                return cursor.fetchall()
+
+        except sqlite3.Error as e:
+            print(f"Error al obtener el historial: {e}")
+            return []
+
+    def get_analysis_hashes(self) -> Dict[str, str]:
+        """Hash de datos de cada semana con análisis cacheado"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT week_start_date, data_hash FROM analysis_cache')
+                return dict(cursor.fetchall())
+
+        except sqlite3.Error as e:
+            print(f"Error al leer la caché de análisis: {e}")
+            return {}
+
+    def save_analysis_results(self, results: List[tuple]) -> bool:
+        """Guardar en bloque filas (week_start_date, data_hash, resultado JSON) en la caché de análisis"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.executemany('''
+                    INSERT INTO analysis_cache (week_start_date, data_hash, result, updated_at)
+                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT(week_start_date) DO UPDATE SET
+                        data_hash = excluded.data_hash, result = excluded.result,
+                        updated_at = CURRENT_TIMESTAMP
+                ''', results)
+                conn.commit()
+                return True
+
+        except sqlite3.Error as e:
+            print(f"Error al guardar la caché de análisis: {e}")
+            return False
+
+    def get_cached_analyses(self) -> List[tuple]:
+        """Análisis cacheados (week_start_date, resultado JSON) en orden cronológico"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT week_start_date, result FROM analysis_cache ORDER BY week_start_date ASC')
+                return cursor.fetchall()
+
+        except sqlite3.Error as e:
+            print(f"Error al leer la caché de análisis: {e}")
+            return []
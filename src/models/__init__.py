@@ -2,5 +2,26 @@
 from .trading_model import TradingDataModel
 from .trading_model_with_db import TradingDataModelWithDB
 from .ai_analyzer import AIAnalyzer
+from .history import TradingHistory
+from .projection import CapitalProjector, project_capital
+from .withdrawal_policy import (WithdrawalPolicy, FixedPercentPolicy, TieredPolicy, DrawdownAwarePolicy,
+                                get_withdrawal_policy, set_withdrawal_policy)
+from .policy_backtester import backtest_policies, backtest_from_db
+from .risk_metrics import RiskMetricsEngine, get_risk_engine
+from .weekday_analytics import WeekdayAnalytics, get_weekday_analytics
+from .return_distribution import ReturnDistribution
+from .forecaster import IncrementalForecaster, get_forecaster
+from .regimes import RegimeModel, get_regime_model
+from .analysis_pipeline import AnalyzerPlugin, AnalysisPipeline, register_analyzer
+from .batch_analysis import run_batch_analysis, load_batch_analysis
+from .anomaly_detector import StreamingAnomalyDetector, get_anomaly_detector
 
-__all__ = ['TradingDataModel', 'TradingDataModelWithDB', 'AIAnalyzer']
\ No newline at end of file
+__all__ = ['TradingDataModel', 'TradingDataModelWithDB', 'AIAnalyzer', 'TradingHistory',
+           'CapitalProjector', 'project_capital', 'WithdrawalPolicy', 'FixedPercentPolicy',
+           'TieredPolicy', 'DrawdownAwarePolicy', 'get_withdrawal_policy', 'set_withdrawal_policy',
+           'backtest_policies', 'backtest_from_db', 'RiskMetricsEngine', 'get_risk_engine',
+           'StreamingAnomalyDetector', 'get_anomaly_detector', 'WeekdayAnalytics',
+           'get_weekday_analytics', 'ReturnDistribution', 'IncrementalForecaster', 'get_forecaster',
+           'RegimeModel', 'get_regime_model',
+           'AnalyzerPlugin', 'AnalysisPipeline', 'register_analyzer',
+           'run_batch_analysis', 'load_batch_analysis']
\ No newline at end of file
@@ -1,43 +1,89 @@
 """
 Analizador AI para interpretar resultados de trading
-Proporciona análisis inteligente de patrones y recomendaciones
+Proporciona análisis de patrones y recomendaciones derivados de estadísticas
+reales de la semana y del historial. El resultado es determinista y se memoiza.
 """
 
-import random
-from typing import Dict, List
+from collections import OrderedDict
+from typing import Dict, Optional
+from ..utils import i18n
+from .weekday_analytics import stop_day_from_stats
+
+# Clave de traducción de cada día del modelo
+DAY_KEYS = {'Lunes': 'monday', 'Martes': 'tuesday', 'Miércoles': 'wednesday',
+            'Jueves': 'thursday', 'Viernes': 'friday'}
+
 
 class AIAnalyzer:
     """Analizador AI para interpretar resultados de trading"""
-    
-    def __init__(self):
-        self.insights = [
-            "Tu rendimiento muestra una tendencia positiva consistente.",
-            "Considera aumentar tu capital de trading gradualmente.",
-            "Los días con pérdidas parecen estar bien controlados.",
-            "Tu estrategia de reinversión está funcionando eficientemente.",
-            "Podrías considerar diversificar tus operaciones.",
-            "El patrón de ganancias sugiere buena gestión de riesgo.",
-            "Tus días de reinversión muestran resultados prometedores.",
-            "Considera establecer metas semanales más ambiciosas.",
-            "Tu consistencia es clave para el crecimiento a largo plazo.",
-            "Los días con ganancias altas indican buen timing de mercado."
-        ]
-        
-        self.recommendations = [
-            "Mantén tu estrategia actual - está funcionando bien.",
-            "Considera aumentar tu tamaño de posición gradualmente.",
-            "Asegúrate de mantener un diario de trading.",
-            "Revisa y ajusta tu estrategia cada semana.",
-            "No te confíes demasiado tras semanas ganadoras.",
-            "Considera tomar descansos entre sesiones de trading.",
-            "Mantén disciplina con tus reglas de entrada/salida.",
-            "Aprende de los días con pérdidas para mejorar.",
-            "Considera establecer stop-loss más estrictos.",
-            "No inviertas más de lo que puedes permitirte perder."
-        ]
-    
-    def analyze_weekly_performance(self, summary: Dict, daily_data: Dict) -> Dict:
-        """Analizar el rendimiento semanal y proporcionar insights"""
+
+    def __init__(self, cache_size: int = 128):
+        # Memoización LRU: huella de (semana, capital, idioma, historial) -> análisis
+        self._cache = OrderedDict()
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @staticmethod
+    def fingerprint(daily_data: Dict, capital_data: Optional[Dict], language: str,
+                    history_metrics: Optional[Dict] = None,
+                    weekday_stats: Optional[Dict] = None) -> tuple:
+        """Huella hashable de todas las entradas que afectan al análisis"""
+        week = tuple(
+            (day, round(float(values.get('amount', 0) or 0), 6), values.get('destination', ''))
+            for day, values in (daily_data or {}).items()
+        )
+        capital = round(float((capital_data or {}).get('initial_capital', 0) or 0), 6)
+        history = ()
+        if history_metrics:
+            history = tuple(
+                round(float(history_metrics.get(key) or 0), 6)
+                for key in ('weeks', 'mean_weekly_return', 'volatility', 'current_drawdown',
+                            'max_drawdown', 'profit_factor', 'current_streak', 'win_rate')
+            )
+        weekdays = ()
+        if weekday_stats and weekday_stats.get('days'):
+            weekdays = tuple(
+                (day, values['traded'], round(values['mean'], 6), round(values['hit_rate'], 6),
+                 round(values['contribution'], 6))
+                for day, values in weekday_stats['days'].items()
+            )
+        return (week, capital, language, history, weekdays)
+
+    def analyze_weekly_performance(self, summary: Dict, daily_data: Dict,
+                                   capital_data: Optional[Dict] = None,
+                                   history_metrics: Optional[Dict] = None,
+                                   weekday_stats: Optional[Dict] = None, language: Optional[str] = None) -> Dict:
+        """Analizar el rendimiento semanal y proporcionar insights (memoizado).
+        language fija el idioma de los textos (por defecto, el idioma actual)
+        """
+        language = language or i18n.current_language
+        language = language if language in i18n.TRANSLATIONS else 'es'
+        key = self.fingerprint(daily_data, capital_data, language, history_metrics, weekday_stats)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return cached
+
+        self.cache_misses += 1
+        analysis = self._analyze(summary, daily_data, capital_data or {}, history_metrics or {},
+                                 weekday_stats or {}, language)
+        self._cache[key] = analysis
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return analysis
+
+    @staticmethod
+    def _day_name(day: str, language: str) -> str:
+        return i18n.tr(DAY_KEYS.get(day, day), language=language)
+
+    def _analyze(self, summary: Dict, daily_data: Dict, capital_data: Dict,
+                 history: Dict, weekdays: Dict, language: str) -> Dict:
+        """Construir el análisis a partir de estadísticas de la semana y del historial"""
+        def text(key: str) -> str:
+            return i18n.tr(f'analysis_{key}', language=language)
+
         analysis = {
             'summary': '',
             'insights': [],
@@ -45,67 +91,126 @@ class AIAnalyzer:
             'risk_assessment': '',
             'performance_rating': ''
         }
-        
-        # Generar resumen basado en el rendimiento
+
         total_weekly = summary['total_weekly']
         performance_percentage = summary['performance_percentage']
         positive_days = summary['positive_days']
         negative_days = summary['negative_days']
-        
+
         # Análisis de rendimiento
         if total_weekly > 0:
             if performance_percentage > 20:
-                analysis['summary'] = "🚀 ¡Excelente semana! Rendimiento superior al 20%."
-                analysis['performance_rating'] = "A+"
+                analysis['summary'], analysis['performance_rating'] = text('summary_excellent'), "A+"
             elif performance_percentage > 10:
-                analysis['summary'] = "📈 Buena semana con rendimiento positivo sólido."
-                analysis['performance_rating'] = "A"
+                analysis['summary'], analysis['performance_rating'] = text('summary_good'), "A"
             else:
-                analysis['summary'] = "✅ Semana positiva con ganancias consistentes."
-                analysis['performance_rating'] = "B+"
+                analysis['summary'], analysis['performance_rating'] = text('summary_positive'), "B+"
         elif total_weekly == 0:
-            analysis['summary'] = "➖ Semana neutral sin ganancias ni pérdidas significativas."
-            analysis['performance_rating'] = "C"
+            analysis['summary'], analysis['performance_rating'] = text('summary_neutral'), "C"
         else:
             if performance_percentage < -20:
-                analysis['summary'] = "📉 Semana difícil con pérdidas significativas."
-                analysis['performance_rating'] = "D"
+                analysis['summary'], analysis['performance_rating'] = text('summary_hard'), "D"
             else:
-                analysis['summary'] = "⚠️ Semana con pérdidas moderadas."
-                analysis['performance_rating'] = "C-"
-        
+                analysis['summary'], analysis['performance_rating'] = text('summary_moderate_loss'), "C-"
+
+        insights = analysis['insights']
+
         # Análisis de consistencia
         if positive_days >= 4:
-            analysis['insights'].append("Gran consistencia con 4+ días positivos.")
+            insights.append(text('consistency_great'))
         elif positive_days >= 3:
-            analysis['insights'].append("Buena consistencia con mayoría de días positivos.")
+            insights.append(text('consistency_good'))
         elif negative_days >= 3:
-            analysis['insights'].append("Varios días negativos - revisa tu estrategia.")
-        
-        # Análisis de patrones diarios
-        if daily_data:
-            wednesday_amount = daily_data.get('Miércoles', {}).get('amount', 0)
-            if wednesday_amount > 0:
-                analysis['insights'].append("Tus días de reinversión están generando resultados positivos.")
-            elif wednesday_amount < 0:
-                analysis['insights'].append("Considera revisar tu estrategia de reinversión.")
-        
-        # Agregar insights aleatorios relevantes
-        analysis['insights'].extend(random.sample(self.insights, 2))
-        
-        # Generar recomendaciones basadas en el rendimiento
+            insights.append(text('consistency_bad'))
+
+        # Mejor / peor día y concentración de las ganancias
+        amounts = {day: float(values.get('amount', 0) or 0) for day, values in (daily_data or {}).items()}
+        traded = {day: amount for day, amount in amounts.items() if amount != 0}
+        if len(traded) >= 2:
+            best = max(traded, key=traded.get)
+            worst = min(traded, key=traded.get)
+            insights.append(text('best_worst').format(
+                best=self._day_name(best, language), best_amount=traded[best],
+                worst=self._day_name(worst, language), worst_amount=traded[worst]))
+            gross_profit = sum(a for a in traded.values() if a > 0)
+            if gross_profit > 0 and traded[best] > 0 and traded[best] / gross_profit >= 0.6 and positive_days >= 2:
+                insights.append(text('concentration').format(share=traded[best] / gross_profit * 100,
+                                                              day=self._day_name(best, language)))
+
+        # Día de reinversión
+        wednesday_amount = amounts.get('Miércoles', 0)
+        if wednesday_amount > 0:
+            insights.append(text('reinvest_positive'))
+        elif wednesday_amount < 0:
+            insights.append(text('reinvest_negative'))
+
+        # Comparación con el historial
+        capital = float(capital_data.get('initial_capital', 0) or 0)
+        week_return = total_weekly / capital if capital > 0 else 0.0
+        mean = history.get('mean_weekly_return')
+        volatility = history.get('volatility') or 0.0
+        z_score = 0.0
+        if mean is not None and history.get('weeks', 0) >= 4 and capital > 0:
+            if volatility > 0:
+                z_score = (week_return - mean) / volatility
+            if abs(z_score) >= 2:
+                insights.append(text('vs_history_unusual').format(z=abs(z_score)))
+            key = 'vs_history_above' if week_return >= mean else 'vs_history_below'
+            insights.append(text(key).format(week=week_return * 100, mean=mean * 100))
+
+        streak = history.get('current_streak', 0)
+        if streak >= 3:
+            insights.append(text('streak_win').format(n=streak))
+        elif streak <= -3:
+            insights.append(text('streak_loss').format(n=-streak))
+
+        current_drawdown = history.get('current_drawdown', 0.0) or 0.0
+        if current_drawdown >= 0.05:
+            insights.append(text('in_drawdown').format(dd=current_drawdown * 100))
+
+        # Patrones por día de la semana sobre todo el historial
+        day_stats = weekdays.get('days', {})
+        worst_day, best_day = weekdays.get('worst_day'), weekdays.get('best_day')
+        if worst_day and day_stats[worst_day]['mean'] < 0:
+            worst = day_stats[worst_day]
+            insights.append(text('weekday_worst').format(day=self._day_name(worst_day, language), mean=worst['mean'],
+                                                          hit=worst['hit_rate'] * 100, n=worst['traded']))
+        # Misma regla que WeekdayAnalytics.day_to_stop()
+        stop_day = stop_day_from_stats(weekdays) if day_stats else None
+        if best_day and weekdays.get('total', 0) > 0 and day_stats[best_day]['contribution'] > 0:
+            insights.append(text('weekday_best').format(day=self._day_name(best_day, language),
+                                                         share=day_stats[best_day]['contribution'] * 100))
+
+        # Recomendaciones según los datos
+        recommendations = analysis['recommendations']
+        if stop_day:
+            recommendations.append(text('rec_stop_day').format(day=self._day_name(stop_day, language)))
         if total_weekly < 0:
-            analysis['recommendations'].append("Considera reducir el tamaño de tus operaciones temporalmente.")
-            analysis['recommendations'].append("Revisa y ajusta tu estrategia antes de continuar.")
-        else:
-            analysis['recommendations'].extend(random.sample(self.recommendations, 2))
-        
-        # Evaluación de riesgo
-        if performance_percentage > 30 or performance_percentage < -30:
-            analysis['risk_assessment'] = "Alto riesgo detectado - considera ajustar tu gestión de riesgo."
-        elif performance_percentage > 20 or performance_percentage < -20:
-            analysis['risk_assessment'] = "Riesgo moderado - monitorea de cerca tus operaciones."
+            recommendations.append(text('rec_reduce_size'))
+            recommendations.append(text('rec_review'))
+        if abs(z_score) >= 2:
+            recommendations.append(text('rec_volatility'))
+        profit_factor = history.get('profit_factor')
+        if profit_factor is not None and profit_factor < 1:
+            recommendations.append(text('rec_profit_factor'))
+        if current_drawdown >= 0.10:
+            recommendations.append(text('rec_drawdown'))
+        if total_weekly > 0:
+            if history.get('win_rate', 0) >= 0.55 or positive_days >= 3:
+                recommendations.append(text('rec_keep'))
+            if performance_percentage > 20:
+                recommendations.append(text('rec_protect'))
+        if not recommendations:
+            recommendations.append(text('rec_journal'))
+        del recommendations[3:]
+
+        # Evaluación de riesgo: semana actual + historial
+        max_drawdown = history.get('max_drawdown', 0.0) or 0.0
+        if abs(performance_percentage) > 30 or current_drawdown >= 0.20 or abs(z_score) >= 3:
+            analysis['risk_assessment'] = text('risk_high')
+        elif abs(performance_percentage) > 20 or current_drawdown >= 0.10 or max_drawdown >= 0.30:
+            analysis['risk_assessment'] = text('risk_moderate')
         else:
-            analysis['risk_assessment'] = "Riesgo controlado - buena gestión de riesgo."
-        
-        return analysis
\ No newline at end of file
+            analysis['risk_assessment'] = text('risk_low')
+
+        return analysis
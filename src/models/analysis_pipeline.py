@@ -0,0 +1,196 @@
+"""
+Pipeline de analizadores enchufables
+Cada analizador se registra, declara las entradas que necesita y produce
+insights. El ejecutor los lanza en un pool de hilos (uno por analizador),
+respeta un presupuesto de tiempo por analizador contado desde que empieza a
+ejecutarse, descarta resultados obsoletos cuando llegan datos más nuevos y
+registra los tiempos de cada uno. Un analizador secundario que sigue ocupado
+con una ejecución anterior no se vuelve a lanzar; el principal se lanza siempre
+con las entradas actuales y se espera, para que el panel nunca muestre el
+resumen de datos anteriores. Una ejecución que sigue en cola cuando ya llegaron
+datos más nuevos no llega a analizar.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Dict, List, Optional, Type
+
+from .ai_analyzer import AIAnalyzer
+
+
+class AnalyzerPlugin(ABC):
+    """Interfaz base de un analizador"""
+
+    name = 'base'
+    inputs = ()          # claves del diccionario de entradas que necesita
+    budget_ms = 100.0    # presupuesto de tiempo; si se supera, el resultado se descarta
+
+    @abstractmethod
+    def analyze(self, inputs: Dict) -> Dict:
+        """Producir insights a partir de las entradas declaradas"""
+
+
+# Registro de analizadores: nombre -> clase
+_registry: Dict[str, Type[AnalyzerPlugin]] = {}
+
+
+def register_analyzer(plugin_class: Type[AnalyzerPlugin]) -> Type[AnalyzerPlugin]:
+    """Registrar una clase de analizador (usable como decorador)"""
+    _registry[plugin_class.name] = plugin_class
+    return plugin_class
+
+
+def registered_analyzers() -> List[Type[AnalyzerPlugin]]:
+    return list(_registry.values())
+
+
+@register_analyzer
+class WeeklyPerformancePlugin(AnalyzerPlugin):
+    """Análisis semanal (AIAnalyzer) como analizador del pipeline"""
+
+    name = 'ai_analysis'
+    inputs = ('summary', 'daily_data', 'capital_data', 'risk_metrics', 'weekday_stats', 'language')
+    budget_ms = 50.0
+
+    def __init__(self):
+        self.analyzer = AIAnalyzer()
+        self._lock = threading.Lock()  # la caché LRU del analizador no es segura entre hilos
+
+    def analyze(self, inputs: Dict) -> Dict:
+        with self._lock:
+            return self.analyzer.analyze_weekly_performance(
+                inputs['summary'], inputs['daily_data'], inputs.get('capital_data'),
+                inputs.get('risk_metrics'), inputs.get('weekday_stats'), language=inputs.get('language'))
+
+
+def merge_results(results: Dict[str, Dict], primary: str = 'ai_analysis') -> Dict:
+    """Combinar los resultados: el análisis principal más los insights y recomendaciones del resto"""
+    merged = dict(results.get(primary) or {})
+    merged['insights'] = list(merged.get('insights', []))
+    merged['recommendations'] = list(merged.get('recommendations', []))
+    for name, result in results.items():
+        if name == primary or not result:
+            continue
+        merged['insights'].extend(result.get('insights', []))
+        merged['recommendations'].extend(result.get('recommendations', []))
+    return merged
+
+
+# Cuánto esperar a que un analizador empiece antes de darlo por agotado
+START_TIMEOUT_S = 1.0
+# Cada cuánto se comprueba si llegaron datos nuevos mientras se espera al analizador principal
+POLL_S = 0.05
+
+
+class AnalysisPipeline:
+    """Ejecutor de analizadores con presupuestos de tiempo y descarte de resultados obsoletos"""
+
+    def __init__(self, plugins: Optional[List[AnalyzerPlugin]] = None, max_workers: Optional[int] = None,
+                 timing_window: int = 50, primary: str = 'ai_analysis'):
+        self.plugins = plugins if plugins is not None else [cls() for cls in registered_analyzers()]
+        self.primary = primary
+        # Un hilo por analizador, más uno para relanzar el principal mientras termina el anterior
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or len(self.plugins) + 1,
+                                            thread_name_prefix='analyzer')
+        self._lock = threading.Lock()
+        self._generation = 0
+        # Última ejecución lanzada por analizador (para no relanzar uno que sigue ocupado)
+        self._inflight: Dict[str, Future] = {}
+        # Tiempos recientes (ms), presupuestos agotados y ejecuciones omitidas, por analizador
+        self.timings: Dict[str, deque] = {p.name: deque(maxlen=timing_window) for p in self.plugins}
+        self.timeouts: Dict[str, int] = {p.name: 0 for p in self.plugins}
+        self.skipped: Dict[str, int] = {p.name: 0 for p in self.plugins}
+
+    def next_generation(self) -> int:
+        """Marcar que hay datos nuevos: los resultados de ejecuciones anteriores pasan a ser obsoletos"""
+        with self._lock:
+            self._generation += 1
+            return self._generation
+
+    def is_current(self, generation: int) -> bool:
+        with self._lock:
+            return generation == self._generation
+
+    def _timed(self, plugin: AnalyzerPlugin, inputs: Dict, started: Dict, generation: int):
+        # El presupuesto se cuenta desde aquí, no desde que se encoló
+        started['at'] = time.perf_counter()
+        started['event'].set()
+        if not self.is_current(generation):
+            return None  # Llegaron datos más nuevos mientras esperaba en cola
+        try:
+            return plugin.analyze(inputs)
+        finally:
+            self.timings[plugin.name].append((time.perf_counter() - started['at']) * 1000.0)
+
+    def _wait(self, plugin: AnalyzerPlugin, future: Future, started: Dict, generation: int):
+        """Esperar el resultado dentro del presupuesto. El principal se sigue esperando al agotarlo
+        (solo se contabiliza) mientras sus datos sean los actuales; los demás se abandonan.
+        Lanza FutureTimeout si se abandona.
+        """
+        if started['event'].wait(START_TIMEOUT_S):
+            remaining = plugin.budget_ms / 1000.0 - (time.perf_counter() - started['at'])
+            try:
+                return future.result(timeout=max(0.0, remaining))
+            except FutureTimeout:
+                pass
+        self.timeouts[plugin.name] += 1
+        if plugin.name != self.primary:
+            raise FutureTimeout()
+        while self.is_current(generation):
+            try:
+                return future.result(timeout=POLL_S)
+            except FutureTimeout:
+                continue
+        raise FutureTimeout()
+
+    def run(self, inputs: Dict, generation: Optional[int] = None) -> Optional[Dict[str, Dict]]:
+        """Ejecutar todos los analizadores. Devuelve {nombre: resultado} o None si los
+        resultados quedaron obsoletos (llegaron datos más nuevos durante la ejecución).
+        """
+        if generation is None:
+            generation = self.next_generation()
+        futures = {}
+        for plugin in self.plugins:
+            previous = self._inflight.get(plugin.name)
+            if plugin.name != self.primary and previous is not None and not previous.done():
+                # Sigue ocupado con una ejecución anterior que agotó su presupuesto: no encolar detrás
+                self.skipped[plugin.name] += 1
+                continue
+            plugin_inputs = {key: inputs.get(key) for key in plugin.inputs}
+            started = {'event': threading.Event(), 'at': None}
+            future = self._executor.submit(self._timed, plugin, plugin_inputs, started, generation)
+            self._inflight[plugin.name] = future
+            futures[plugin.name] = (plugin, started, future)
+
+        results = {}
+        for name, (plugin, started, future) in futures.items():
+            try:
+                results[name] = self._wait(plugin, future, started, generation)
+            except FutureTimeout:
+                # El hilo sigue hasta terminar, pero su resultado ya no se usa
+                pass
+            except Exception as e:
+                print(f"Error en el analizador '{name}': {e}")
+            if not self.is_current(generation):
+                return None
+        return results
+
+    def timing_report(self) -> Dict[str, Dict]:
+        """Tiempo medio y máximo (ms) y presupuestos agotados por analizador"""
+        report = {}
+        for name, samples in self.timings.items():
+            values = list(samples)
+            report[name] = {
+                'runs': len(values),
+                'mean_ms': sum(values) / len(values) if values else 0.0,
+                'max_ms': max(values) if values else 0.0,
+                'timeouts': self.timeouts.get(name, 0),
+                'skipped': self.skipped.get(name, 0),
+            }
+        return report
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
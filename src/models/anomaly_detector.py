@@ -0,0 +1,209 @@
+"""
+Detector de anomalías en línea para los montos diarios
+Mantiene estadísticas robustas exponenciales (media recortada y desviación
+absoluta media) por día de la semana y puntúa cada monto nuevo en O(1).
+El estado son sumas ponderadas por semana (el peso decae con las semanas de
+calendario transcurridas) y cada celda recuerda su aportación: editar cualquier
+semana, también una anterior, deshace la aportación vieja y aplica la nueva en
+O(1), sin recorrer el historial.
+"""
+
+import json
+from datetime import date
+from typing import Dict, Optional
+
+# Factor para convertir la desviación absoluta media en una desviación estándar equivalente
+MEAN_ABS_TO_STD = 1.2533
+
+# Versión del estado persistido (los estados anteriores se reconstruyen desde el historial)
+STATE_VERSION = 2
+
+
+def _week_number(week: str) -> int:
+    """Número de semana de calendario de una fecha ISO (para los pesos exponenciales)"""
+    return date.fromisoformat(week).toordinal() // 7
+
+
+class StreamingAnomalyDetector:
+    """Detector de montos atípicos por día de la semana con estado persistible"""
+
+    def __init__(self, alpha: float = 0.1, threshold: float = 4.0, min_samples: int = 5,
+                 clip: float = 3.0):
+        self.alpha = alpha              # peso de cada observación nueva
+        self.threshold = threshold      # puntuación a partir de la cual se marca como anomalía
+        self.min_samples = min_samples  # observaciones mínimas antes de puntuar
+        self.clip = clip                # recorte (en desviaciones) al actualizar la media
+        # Por día: observaciones, suma de pesos, suma ponderada de montos recortados y de desviaciones
+        self.state: Dict[str, Dict] = {}
+        # Aportación de cada celda ("semana:día"): [monto recortado, desviación]
+        self.cells: Dict[str, list] = {}
+        self.latest_week: Optional[str] = None  # semana más reciente observada (ISO)
+
+    def _day_state(self, day: str) -> Dict:
+        return self.state.setdefault(day, {'count': 0, 'weight': 0.0, 'sum': 0.0, 'dev': 0.0})
+
+    def _weight(self, week: Optional[str]) -> float:
+        """Peso de una semana relativo a la más reciente (1 para la más reciente)"""
+        if week is None or self.latest_week is None:
+            return 1.0
+        return (1.0 - self.alpha) ** max(_week_number(self.latest_week) - _week_number(week), 0)
+
+    def _advance_to(self, week: str):
+        """Hacer de week la semana más reciente: atenuar todas las sumas en una sola pasada por día"""
+        if self.latest_week is not None and week <= self.latest_week:
+            return
+        if self.latest_week is not None:
+            decay = (1.0 - self.alpha) ** (_week_number(week) - _week_number(self.latest_week))
+            for st in self.state.values():
+                st['weight'] *= decay
+                st['sum'] *= decay
+                st['dev'] *= decay
+        self.latest_week = week
+
+    @staticmethod
+    def _stats(st: Optional[Dict]) -> Optional[tuple]:
+        """(observaciones, media, desviación absoluta media) de un estado"""
+        if not st or st['count'] <= 0 or st['weight'] <= 0:
+            return None
+        return st['count'], st['sum'] / st['weight'], st['dev'] / st['weight']
+
+    def _apply(self, day: str, cell: list, weight: float, sign: int):
+        st = self._day_state(day)
+        st['count'] += sign
+        st['weight'] += sign * weight
+        st['sum'] += sign * weight * cell[0]
+        st['dev'] += sign * weight * cell[1]
+        if st['count'] <= 0:
+            # Sin observaciones: limpiar el error de redondeo acumulado
+            st.update({'count': 0, 'weight': 0.0, 'sum': 0.0, 'dev': 0.0})
+
+    def _without(self, day: str, key: Optional[str]) -> Optional[Dict]:
+        """Estado del día sin la aportación de una celda (puntuación fuera de muestra)"""
+        st = self.state.get(day)
+        cell = self.cells.get(key) if key is not None else None
+        if st is None or cell is None:
+            return st
+        weight = self._weight(key.split(':', 1)[0])
+        return {'count': st['count'] - 1, 'weight': st['weight'] - weight,
+                'sum': st['sum'] - weight * cell[0], 'dev': st['dev'] - weight * cell[1]}
+
+    def score(self, day: str, amount: float, st: Optional[Dict] = None) -> float:
+        """Puntuación (en desviaciones equivalentes) de un monto frente al estado actual (o st)"""
+        stats = self._stats(self.state.get(day) if st is None else st)
+        if stats is None or stats[0] < self.min_samples or amount == 0:
+            return 0.0
+        _, mean, mad = stats
+        scale = mad * MEAN_ABS_TO_STD
+        if scale <= 0:
+            return 0.0
+        return abs(amount - mean) / scale
+
+    def is_anomaly(self, score: float) -> bool:
+        return score >= self.threshold
+
+    def observe(self, day: str, amount: float, key: Optional[str] = None) -> float:
+        """Puntuar un monto y luego incorporarlo al estado (O(1) para cualquier semana).
+        key identifica la celda (semana + día): si la celda ya tenía un monto, se deshace
+        primero su aportación, de modo que editarla varias veces no la cuenta dos veces.
+        """
+        week = key.split(':', 1)[0] if key is not None else None
+        old = self.cells.pop(key, None) if key is not None else None
+        if old is not None:
+            self._apply(day, old, self._weight(week), -1)
+
+        result = self.score(day, amount)
+        if amount == 0:
+            # Día sin operar: no aporta información
+            return result
+
+        if week is not None:
+            self._advance_to(week)
+        stats = self._stats(self.state.get(day))
+        if stats is None:
+            cell = [float(amount), abs(float(amount)) * 0.5]
+        else:
+            _, mean, mad = stats
+            scale = mad * MEAN_ABS_TO_STD
+            if scale > 0:
+                # Recortar la contribución de valores extremos a la media (robustez)
+                low, high = mean - self.clip * scale, mean + self.clip * scale
+                cell = [min(max(amount, low), high), min(abs(amount - mean), self.clip * scale)]
+            else:
+                cell = [float(amount), abs(amount - mean)]
+        self._apply(day, cell, self._weight(week), 1)
+        if key is not None:
+            self.cells[key] = cell
+        return result
+
+    def score_week(self, amounts: Dict[str, float], week: Optional[str] = None) -> Dict[str, float]:
+        """Puntuaciones de anomalía de una semana completa (solo las que superan el umbral).
+        Con week, cada día se puntúa contra el estado sin su propia aportación (fuera de muestra).
+        """
+        scores = {}
+        for day, amount in amounts.items():
+            st = self._without(day, f"{week}:{day}") if week is not None else None
+            value = self.score(day, amount, st)
+            if self.is_anomaly(value):
+                scores[day] = value
+        return scores
+
+    def to_dict(self) -> Dict:
+        return {'version': STATE_VERSION, 'alpha': self.alpha, 'threshold': self.threshold,
+                'min_samples': self.min_samples, 'clip': self.clip, 'state': self.state,
+                'cells': self.cells, 'latest_week': self.latest_week}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> Optional['StreamingAnomalyDetector']:
+        """Restaurar un estado persistido (None si es de una versión anterior)"""
+        if data.get('version') != STATE_VERSION:
+            return None
+        detector = cls(data.get('alpha', 0.1), data.get('threshold', 4.0),
+                       data.get('min_samples', 5), data.get('clip', 3.0))
+        detector.state = data.get('state', {})
+        detector.cells = data.get('cells', {})
+        detector.latest_week = data.get('latest_week')
+        return detector
+
+    @classmethod
+    def from_history(cls, history, **kwargs) -> 'StreamingAnomalyDetector':
+        """Inicializar el estado recorriendo el historial una única vez"""
+        from .history import HISTORY_DAYS
+        detector = cls(**kwargs)
+        for week_date, row in zip(history.week_dates, history.amounts):
+            for day, amount in zip(HISTORY_DAYS, row):
+                detector.observe(day, float(amount), f"{week_date}:{day}")
+        return detector
+
+
+# Clave de configuración donde se persiste el estado del detector
+ANOMALY_STATE_KEY = 'anomaly_detector_state'
+
+# Detectores cargados por cuenta (ruta de la base de datos)
+_detectors: Dict[str, StreamingAnomalyDetector] = {}
+
+
+def get_anomaly_detector(db_manager) -> StreamingAnomalyDetector:
+    """Obtener el detector de una cuenta: desde el estado persistido o, la primera vez, desde el historial"""
+    detector = _detectors.get(db_manager.db_path)
+    if detector is not None:
+        return detector
+    try:
+        raw = db_manager.get_config(ANOMALY_STATE_KEY)
+        if raw:
+            detector = StreamingAnomalyDetector.from_dict(json.loads(raw))
+    except (ValueError, TypeError) as e:
+        print(f"Error al leer el estado del detector de anomalías: {e}")
+    if detector is None:
+        from .history import TradingHistory
+        detector = StreamingAnomalyDetector.from_history(TradingHistory.from_db(db_manager))
+        save_anomaly_detector(db_manager, detector)
+    _detectors[db_manager.db_path] = detector
+    return detector
+
+
+def save_anomaly_detector(db_manager, detector: Optional[StreamingAnomalyDetector] = None) -> bool:
+    """Persistir el estado del detector en la tabla de configuración"""
+    detector = detector or _detectors.get(db_manager.db_path)
+    if detector is None:
+        return False
+    return db_manager.set_config(ANOMALY_STATE_KEY, json.dumps(detector.to_dict(), separators=(',', ':')))
@@ -0,0 +1,98 @@
+"""
+Análisis por lotes de todas las semanas guardadas
+Ejecuta AIAnalyzer y métricas básicas sobre cada semana de la BD en un pool de
+procesos (por bloques) y guarda el resultado en la tabla analysis_cache, con
+clave semana + hash de sus datos, para que las re-ejecuciones omitan las
+semanas que no cambiaron.
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from .history import HISTORY_DAYS
+from .trading_model import TradingDataModel
+from .ai_analyzer import AIAnalyzer
+from ..utils import i18n
+
+# Cambiar al modificar el análisis para invalidar toda la caché
+ANALYSIS_VERSION = 1
+
+
+def week_data_hash(row: tuple, language: str) -> str:
+    """Hash de los datos de una semana (montos, capital) más idioma y versión del análisis"""
+    payload = f"{ANALYSIS_VERSION}|{language}|" + "|".join(repr(value) for value in row)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def _analyze_row(row: tuple, analyzer: AIAnalyzer, language: str) -> Dict:
+    """Análisis de una semana a partir de su fila del historial"""
+    week_start_date, capital = row[0], row[6] if row[6] is not None else 100.0
+    model = TradingDataModel()
+    for day, amount in zip(HISTORY_DAYS, row[1:6]):
+        model.data[day]['amount'] = float(amount or 0.0)
+    summary = model.get_weekly_summary()
+    capital_data = {'initial_capital': capital}
+    analysis = analyzer.analyze_weekly_performance(summary, model.data, capital_data, language=language)
+
+    amounts = {day: model.data[day]['amount'] for day in HISTORY_DAYS}
+    return {
+        'week_start_date': week_start_date,
+        'summary': summary,
+        'analysis': analysis,
+        'metrics': {
+            'initial_capital': capital,
+            'weekly_return': summary['total_weekly'] / capital if capital > 0 else 0.0,
+            'best_day': max(amounts, key=amounts.get),
+            'worst_day': min(amounts, key=amounts.get),
+        },
+    }
+
+
+def _analyze_chunk(rows: List[tuple], language: str) -> List[tuple]:
+    """Trabajo de un proceso: analizar un bloque de semanas. Devuelve filas para analysis_cache.
+    El idioma se pasa al analizador; no se cambia el idioma de la aplicación.
+    """
+    analyzer = AIAnalyzer(cache_size=0)
+    return [(row[0], week_data_hash(row, language),
+             json.dumps(_analyze_row(row, analyzer, language), ensure_ascii=False))
+            for row in rows]
+
+
+def run_batch_analysis(db_manager, workers: Optional[int] = None, chunk_size: int = 52,
+                       language: Optional[str] = None, force: bool = False) -> Dict:
+    """Analizar todas las semanas cambiadas desde la última ejecución.
+    Devuelve {'total', 'analyzed', 'skipped'}.
+    """
+    language = language or i18n.current_language
+    rows = db_manager.get_history_rows()
+    cached = {} if force else db_manager.get_analysis_hashes()
+    pending = [row for row in rows if cached.get(row[0]) != week_data_hash(row, language)]
+
+    chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+    if len(chunks) <= 1 or workers == 1:
+        # Pocos datos: el arranque de procesos cuesta más que el propio análisis
+        results = [_analyze_chunk(chunk, language) for chunk in chunks]
+    else:
+        workers = workers or min(len(chunks), os.cpu_count() or 1)
+        # 'spawn': hacer fork de un proceso Qt con hilos activos puede bloquear a los hijos
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+            results = list(executor.map(_analyze_chunk, chunks, [language] * len(chunks)))
+
+    for chunk_result in results:
+        db_manager.save_analysis_results(chunk_result)
+    return {'total': len(rows), 'analyzed': len(pending), 'skipped': len(rows) - len(pending)}
+
+
+def load_batch_analysis(db_manager) -> List[Dict]:
+    """Resultados cacheados de todas las semanas en orden cronológico"""
+    results = []
+    for _, result in db_manager.get_cached_analyses():
+        try:
+            results.append(json.loads(result))
+        except ValueError as e:
+            print(f"Error al leer un análisis cacheado: {e}")
+    return results
@@ -0,0 +1,171 @@
+"""
+Pronóstico ligero de resultados diarios y semanales
+Modelo autorregresivo lineal sobre los rendimientos diarios (fracción del
+capital), ajustado con mínimos cuadrados y actualizado de forma incremental
+con mínimos cuadrados recursivos (RLS) cada vez que se completa una semana.
+"""
+
+import json
+from typing import Dict, List, Optional
+import numpy as np
+
+from .history import TradingHistory, HISTORY_DAYS
+
+# Cuantil normal para un intervalo central del 90%
+Z_90 = 1.6449
+
+# Clave de configuración donde se persisten los parámetros
+FORECASTER_STATE_KEY = 'forecaster_state'
+
+
+class IncrementalForecaster:
+    """AR(p) con intercepto sobre rendimientos diarios, actualizable en O(p²)"""
+
+    def __init__(self, lags: int = 5, forgetting: float = 0.995, delta: float = 100.0):
+        self.lags = lags
+        self.forgetting = forgetting    # factor de olvido de RLS (da más peso a lo reciente)
+        self.delta = delta              # escala inicial de la covarianza de parámetros
+        size = lags + 1
+        self.theta = np.zeros(size)
+        self.P = np.eye(size) * delta
+        self.resid_var = 0.0
+        self.n_obs = 0
+        self.tail: List[float] = []     # últimos rendimientos ya incorporados (contexto de los lags)
+        self.fitted_until: Optional[str] = None  # última semana incorporada al ajuste
+
+    def _features(self, recent) -> np.ndarray:
+        """Vector [1, r(t-1), ..., r(t-p)] a partir de los rendimientos más recientes"""
+        lagged = list(recent)[-self.lags:][::-1]
+        lagged += [0.0] * (self.lags - len(lagged))
+        return np.concatenate(([1.0], lagged))
+
+    def fit(self, returns) -> 'IncrementalForecaster':
+        """Ajuste completo por mínimos cuadrados (solo al crear o ante ediciones antiguas)"""
+        series = np.asarray(returns, dtype=float).reshape(-1)
+        size = self.lags + 1
+        self.theta, self.P = np.zeros(size), np.eye(size) * self.delta
+        self.resid_var, self.n_obs = 0.0, 0
+        if series.size > self.lags:
+            # Matriz de diseño con ventanas deslizantes: fila t = [1, r(t-1), ..., r(t-p)]
+            windows = np.lib.stride_tricks.sliding_window_view(series[:-1], self.lags)[:, ::-1]
+            X = np.hstack([np.ones((windows.shape[0], 1)), windows])
+            y = series[self.lags:]
+            self.theta = np.linalg.lstsq(X, y, rcond=None)[0]
+            self.P = np.linalg.pinv(X.T @ X + np.eye(size) / self.delta)
+            residuals = y - X @ self.theta
+            self.resid_var = float(np.mean(residuals ** 2))
+            self.n_obs = int(y.size)
+        self.tail = series[-self.lags:].tolist()
+        return self
+
+    def update(self, value: float):
+        """Incorporar un rendimiento diario nuevo (RLS)"""
+        x = self._features(self.tail)
+        error = value - float(x @ self.theta)
+        Px = self.P @ x
+        gain = Px / (self.forgetting + float(x @ Px))
+        self.theta = self.theta + gain * error
+        self.P = (self.P - np.outer(gain, Px)) / self.forgetting
+        weight = max(1.0 - self.forgetting, 1.0 / (self.n_obs + 1))
+        self.resid_var += weight * (error ** 2 - self.resid_var)
+        self.n_obs += 1
+        self.tail = (self.tail + [float(value)])[-self.lags:]
+
+    def forecast(self, recent, capital: float, z: float = Z_90) -> Dict:
+        """Pronóstico del próximo día y de los próximos 5 días, en dinero.
+        recent: rendimientos de la semana en curso ya introducidos (se anexan al contexto).
+        """
+        context = list(self.tail) + list(recent)
+        sigma = self.resid_var ** 0.5
+        next_day = float(self._features(context) @ self.theta)
+
+        # Semana: iterar el modelo 5 pasos hacia delante
+        path, total = list(context), 0.0
+        for _ in HISTORY_DAYS:
+            step = float(self._features(path) @ self.theta)
+            path.append(step)
+            total += step
+        week_sigma = sigma * len(HISTORY_DAYS) ** 0.5
+
+        return {
+            'next_day': {'mean': next_day * capital, 'low': (next_day - z * sigma) * capital,
+                         'high': (next_day + z * sigma) * capital},
+            'next_week': {'mean': total * capital, 'low': (total - z * week_sigma) * capital,
+                          'high': (total + z * week_sigma) * capital},
+            'observations': self.n_obs,
+        }
+
+    def to_dict(self) -> Dict:
+        return {'lags': self.lags, 'forgetting': self.forgetting, 'delta': self.delta,
+                'theta': self.theta.tolist(), 'P': self.P.tolist(), 'resid_var': self.resid_var,
+                'n_obs': self.n_obs, 'tail': self.tail, 'fitted_until': self.fitted_until}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'IncrementalForecaster':
+        forecaster = cls(data.get('lags', 5), data.get('forgetting', 0.995), data.get('delta', 100.0))
+        forecaster.theta = np.asarray(data['theta'], dtype=float)
+        forecaster.P = np.asarray(data['P'], dtype=float)
+        forecaster.resid_var = float(data.get('resid_var', 0.0))
+        forecaster.n_obs = int(data.get('n_obs', 0))
+        forecaster.tail = list(data.get('tail', []))
+        forecaster.fitted_until = data.get('fitted_until')
+        return forecaster
+
+
+def _refit(db_manager, forecaster: IncrementalForecaster, before: Optional[str]):
+    """Ajuste completo con las semanas anteriores a before (por defecto, todas salvo la última,
+    que es la semana en curso)"""
+    history = TradingHistory.from_db(db_manager)
+    if before is None:
+        keep = list(range(len(history) - 1))
+    else:
+        keep = [i for i, week in enumerate(history.week_dates) if week < before]
+    forecaster.fit(history.daily_returns[keep].reshape(-1))
+    forecaster.fitted_until = history.week_dates[keep[-1]] if keep else None
+
+
+def sync_forecaster(db_manager, forecaster: IncrementalForecaster, current_week: str) -> bool:
+    """Incorporar las semanas completas anteriores a current_week.
+    Devuelve True si el estado cambió (y debe persistirse).
+    """
+    if forecaster.fitted_until is not None and current_week <= forecaster.fitted_until:
+        # Se editó una semana ya incorporada: reajustar desde cero (mínimos cuadrados)
+        _refit(db_manager, forecaster, current_week)
+        return True
+    rows = db_manager.get_history_rows(forecaster.fitted_until, current_week)
+    pending = [row for row in rows if row[0] != forecaster.fitted_until and row[0] < current_week]
+    if not pending:
+        return False
+    for daily in TradingHistory.from_rows(pending).daily_returns:
+        for value in daily:
+            forecaster.update(float(value))
+    forecaster.fitted_until = pending[-1][0]
+    return True
+
+
+# Pronosticadores cargados por cuenta (ruta de la base de datos)
+_forecasters: Dict[str, IncrementalForecaster] = {}
+
+
+def get_forecaster(db_manager) -> IncrementalForecaster:
+    """Obtener el pronosticador de una cuenta (parámetros persistidos o ajuste inicial)"""
+    forecaster = _forecasters.get(db_manager.db_path)
+    if forecaster is not None:
+        return forecaster
+    try:
+        raw = db_manager.get_config(FORECASTER_STATE_KEY)
+        if raw:
+            forecaster = IncrementalForecaster.from_dict(json.loads(raw))
+    except (ValueError, TypeError, KeyError) as e:
+        print(f"Error al leer los parámetros del pronóstico: {e}")
+    if forecaster is None:
+        forecaster = IncrementalForecaster()
+        _refit(db_manager, forecaster, None)
+        save_forecaster(db_manager, forecaster)
+    _forecasters[db_manager.db_path] = forecaster
+    return forecaster
+
+
+def save_forecaster(db_manager, forecaster: IncrementalForecaster) -> bool:
+    """Persistir los parámetros del pronosticador en la tabla de configuración"""
+    return db_manager.set_config(FORECASTER_STATE_KEY, json.dumps(forecaster.to_dict()))
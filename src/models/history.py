@@ -0,0 +1,106 @@
+"""
+Historial columnar de semanas de trading
+Expone todas las semanas guardadas como arreglos NumPy para análisis vectorizado
+"""
+
+import bisect
+from typing import List, Optional
+import numpy as np
+
+# Orden de columnas tal como se guardan en la tabla trading_weeks
+HISTORY_DAYS = ['Lunes', 'Martes', 'Miércoles', 'Jueves', 'Viernes']
+
+
+class TradingHistory:
+    """Vista columnar (NumPy) del historial completo de semanas"""
+
+    def __init__(self, week_dates: List[str], amounts, initial_capital):
+        self.week_dates = list(week_dates)
+        # Matriz (semanas, 5) con los montos diarios
+        self.amounts = np.asarray(amounts, dtype=float).reshape(-1, len(HISTORY_DAYS))
+        # Vector (semanas,) con el capital inicial de cada semana
+        self.initial_capital = np.asarray(initial_capital, dtype=float).reshape(-1)
+
+    @classmethod
+    def from_rows(cls, rows: List[tuple]) -> 'TradingHistory':
+        """Construir desde filas devueltas por DatabaseManager.get_history_rows"""
+        if not rows:
+            return cls([], np.empty((0, len(HISTORY_DAYS))), np.empty(0))
+        week_dates = [row[0] for row in rows]
+        amounts = np.array([[value or 0.0 for value in row[1:6]] for row in rows], dtype=float)
+        capital = np.array([row[6] if row[6] is not None else 100.0 for row in rows], dtype=float)
+        return cls(week_dates, amounts, capital)
+
+    @classmethod
+    def from_db(cls, db_manager, start_date: Optional[str] = None,
+                end_date: Optional[str] = None) -> 'TradingHistory':
+        """Cargar el historial (o un rango) con una única consulta"""
+        return cls.from_rows(db_manager.get_history_rows(start_date, end_date))
+
+    def __len__(self):
+        return len(self.week_dates)
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self.week_dates) == 0
+
+    @property
+    def weekly_totals(self):
+        """Resultado neto de cada semana"""
+        return self.amounts.sum(axis=1)
+
+    @property
+    def daily_returns(self):
+        """Montos diarios como fracción del capital inicial de su semana"""
+        capital = np.where(self.initial_capital > 0, self.initial_capital, np.nan)
+        returns = self.amounts / capital[:, None]
+        return np.nan_to_num(returns, nan=0.0, posinf=0.0, neginf=0.0)
+
+    @property
+    def weekly_returns(self):
+        """Rendimiento semanal como fracción del capital inicial"""
+        return self.daily_returns.sum(axis=1)
+
+    def day_dates(self):
+        """Fechas (datetime64[D]) de cada celda diaria, con la misma forma que amounts"""
+        if self.is_empty:
+            return np.empty((0, len(HISTORY_DAYS)), dtype='datetime64[D]')
+        mondays = np.array(self.week_dates, dtype='datetime64[D]')
+        return mondays[:, None] + np.arange(len(HISTORY_DAYS))
+
+    def daily_balance(self):
+        """Saldo al cierre de cada día (capital inicial de la semana + acumulado), aplanado en orden"""
+        balance = self.initial_capital[:, None] + np.cumsum(self.amounts, axis=1)
+        return self.day_dates().reshape(-1), balance.reshape(-1)
+
+    def index_of(self, week_start_date) -> int:
+        """Índice de una semana en el historial, o -1 si no existe"""
+        key = week_start_date.isoformat() if hasattr(week_start_date, 'isoformat') else str(week_start_date)
+        try:
+            return self.week_dates.index(key)
+        except ValueError:
+            return -1
+
+    def upsert_week(self, week_start_date, amounts, initial_capital: float) -> int:
+        """Actualizar (o insertar en orden) una semana sin recargar de la BD.
+        Devuelve el índice de la semana modificada.
+        """
+        key = week_start_date.isoformat() if hasattr(week_start_date, 'isoformat') else str(week_start_date)
+        row = np.asarray(amounts, dtype=float).reshape(len(HISTORY_DAYS))
+        idx = self.index_of(key)
+        if idx >= 0:
+            self.amounts[idx] = row
+            self.initial_capital[idx] = initial_capital
+            return idx
+        # Insertar manteniendo el orden cronológico (el caso típico es añadir al final)
+        idx = bisect.bisect_left(self.week_dates, key)
+        self.week_dates.insert(idx, key)
+        self.amounts = np.insert(self.amounts, idx, row, axis=0)
+        self.initial_capital = np.insert(self.initial_capital, idx, initial_capital)
+        return idx
+
+
+def week_amounts_from_model(model) -> List[float]:
+    """Montos diarios del modelo en el orden de columnas del historial"""
+    return [float(model.data.get(day, {}).get('amount', 0.0) or 0.0) for day in HISTORY_DAYS]
+
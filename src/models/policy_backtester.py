@@ -0,0 +1,68 @@
+"""
+Backtester de políticas de retiro
+Reproduce el historial completo bajo muchas políticas candidatas a la vez:
+cada paso semanal opera sobre vectores con una posición por política.
+"""
+
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+
+from .history import TradingHistory
+from .withdrawal_policy import WithdrawalPolicy, capital_drawdown, stack_policies, default_candidate_policies
+
+
+def backtest_policies(history: TradingHistory, policies: Sequence[WithdrawalPolicy],
+                      initial_capital: Optional[float] = None) -> List[Dict]:
+    """Reproducir el historial bajo cada política.
+    Se aplica el rendimiento semanal histórico (resultado / capital inicial de esa semana)
+    al capital simulado de cada política. Devuelve, por política: capital final,
+    total retirado y drawdown máximo, en el mismo orden recibido.
+    """
+    policies = list(policies)
+    if not policies:
+        return []
+    if initial_capital is None:
+        initial_capital = float(history.initial_capital[0]) if len(history) else 100.0
+
+    params = stack_policies(policies)
+    weekly_returns = history.weekly_returns  # (T,)
+    n_policies = len(policies)
+
+    # Tasa por tramo para cada (política, semana): no depende de la trayectoria
+    tier_idx = (params['thresholds'][:, None, :] <= weekly_returns[None, :, None]).sum(axis=2) - 1
+    tier_rates = np.take_along_axis(params['rates'], np.clip(tier_idx, 0, None), axis=1)  # (P, T)
+
+    capital = np.full(n_policies, float(initial_capital))
+    peak = capital.copy()
+    withdrawn = np.zeros(n_policies)
+    max_drawdown = np.zeros(n_policies)
+    dd_threshold = params['drawdown_threshold']
+    dd_rate = params['drawdown_rate']
+
+    for t, weekly_return in enumerate(weekly_returns):
+        drawdown = capital_drawdown(capital, peak)
+        rate = np.where(drawdown >= dd_threshold, dd_rate, tier_rates[:, t])
+        profit = capital * weekly_return
+        withdrawal = np.maximum(profit, 0.0) * rate
+        capital = np.maximum(capital + profit - withdrawal, 0.0)
+        withdrawn += withdrawal
+        np.maximum(peak, capital, out=peak)
+        np.maximum(max_drawdown, capital_drawdown(capital, peak), out=max_drawdown)
+
+    return [
+        {
+            'policy': policy,
+            'label': policy.label(),
+            'final_capital': float(capital[i]),
+            'total_withdrawn': float(withdrawn[i]),
+            'max_drawdown': float(max_drawdown[i]),
+        }
+        for i, policy in enumerate(policies)
+    ]
+
+
+def backtest_from_db(db_manager, policies: Optional[Sequence[WithdrawalPolicy]] = None,
+                     initial_capital: Optional[float] = None) -> List[Dict]:
+    """Backtest sobre todo el historial guardado (por defecto con las políticas candidatas)"""
+    history = TradingHistory.from_db(db_manager)
+    return backtest_policies(history, policies or default_candidate_policies(), initial_capital)
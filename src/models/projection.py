@@ -0,0 +1,129 @@
+"""
+Motor de proyección de capital por Monte Carlo
+Simula miles de trayectorias de capital a partir del historial de P&L diario
+aplicando la política de retiro semanal, de forma vectorizada con NumPy
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Sequence
+import numpy as np
+
+from .history import TradingHistory
+from .withdrawal_policy import WithdrawalPolicy, capital_drawdown, get_withdrawal_policy
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def _simulate_chunk(daily_returns, method: str, weeks: int, n_paths: int,
+                    initial_capital: float, policy: WithdrawalPolicy, seed) -> np.ndarray:
+    """Simular un bloque de trayectorias. Devuelve una matriz (n_paths, weeks + 1).
+    Función de módulo para poder ejecutarse en un ProcessPoolExecutor.
+    """
+    rng = np.random.default_rng(seed)
+    n_days = daily_returns.shape[1]
+
+    if method == 'normal':
+        # Distribución ajustada: normal por día de la semana
+        mean = daily_returns.mean(axis=0)
+        std = daily_returns.std(axis=0, ddof=1) if daily_returns.shape[0] > 1 else np.zeros(n_days)
+        sampled = rng.normal(mean, std, size=(n_paths, weeks, n_days))
+    else:
+        # Bootstrap por día de la semana: cada día se remuestrea de su propia columna
+        rows = rng.integers(0, daily_returns.shape[0], size=(n_paths, weeks, n_days))
+        sampled = daily_returns[rows, np.arange(n_days)]
+
+    weekly_return = sampled.sum(axis=2)
+
+    paths = np.empty((n_paths, weeks + 1))
+    paths[:, 0] = initial_capital
+    capital = paths[:, 0].copy()
+    peak = capital.copy()
+    # Bucle sobre semanas (pocas), vectorizado sobre todas las trayectorias
+    for week in range(weeks):
+        drawdown = capital_drawdown(capital, peak)
+        profit = capital * weekly_return[:, week]
+        capital = np.maximum(capital + profit - policy.withdrawal(profit, capital, drawdown), 0.0)
+        np.maximum(peak, capital, out=peak)
+        paths[:, week + 1] = capital
+    return paths
+
+
+class CapitalProjector:
+    """Proyección de capital semanal a partir del historial guardado"""
+
+    def __init__(self, history: TradingHistory, policy: Optional[WithdrawalPolicy] = None):
+        self.history = history
+        # Por defecto, la política de retiro activa en la aplicación
+        self.policy = policy or get_withdrawal_policy()
+
+    @classmethod
+    def from_db(cls, db_manager, **kwargs) -> 'CapitalProjector':
+        """Crear el proyector cargando el historial completo de la BD"""
+        return cls(TradingHistory.from_db(db_manager), **kwargs)
+
+    def _sample_source(self) -> np.ndarray:
+        """Rendimientos diarios usados como fuente del muestreo"""
+        returns = self.history.daily_returns
+        # Ignorar semanas totalmente vacías (sin operar) para no sesgar hacia cero
+        active = np.any(self.history.amounts != 0, axis=1)
+        if np.any(active):
+            returns = returns[active]
+        return returns
+
+    def simulate(self, initial_capital: float, weeks: int = 12, n_paths: int = 20000,
+                 method: str = 'bootstrap', seed: Optional[int] = None,
+                 workers: int = 0) -> np.ndarray:
+        """Simular trayectorias de capital. Devuelve una matriz (n_paths, weeks + 1).
+        method: 'bootstrap' (remuestreo del historial) o 'normal' (distribución ajustada).
+        workers: número de procesos; 0 o 1 ejecuta en el proceso actual.
+        """
+        returns = self._sample_source()
+        if returns.shape[0] == 0:
+            # Sin historial: el capital se mantiene constante
+            return np.full((n_paths, weeks + 1), float(initial_capital))
+
+        if workers and workers > 1:
+            seeds = np.random.SeedSequence(seed).spawn(workers)
+            sizes = [n_paths // workers + (1 if i < n_paths % workers else 0) for i in range(workers)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_simulate_chunk, returns, method, weeks, size,
+                                float(initial_capital), self.policy, chunk_seed)
+                    for size, chunk_seed in zip(sizes, seeds) if size > 0
+                ]
+                return np.vstack([future.result() for future in futures])
+
+        return _simulate_chunk(returns, method, weeks, n_paths, float(initial_capital),
+                               self.policy, seed)
+
+    def project(self, initial_capital: float, weeks: int = 12, n_paths: int = 20000,
+                percentiles: Sequence[float] = DEFAULT_PERCENTILES, method: str = 'bootstrap',
+                seed: Optional[int] = None, workers: int = 0) -> Dict:
+        """Proyectar el capital y devolver bandas de percentiles por semana"""
+        paths = self.simulate(initial_capital, weeks, n_paths, method, seed, workers)
+        bands = np.percentile(paths, percentiles, axis=0)
+        final = paths[:, -1]
+        return {
+            'weeks': np.arange(weeks + 1),
+            'percentiles': {p: bands[i] for i, p in enumerate(percentiles)},
+            'mean': paths.mean(axis=0),
+            'initial_capital': float(initial_capital),
+            'probability_of_loss': float(np.mean(final < initial_capital)),
+            'n_paths': int(paths.shape[0]),
+            'method': method,
+            'history_weeks': len(self.history),
+        }
+
+
+def project_capital(db_manager, initial_capital: float, weeks: int = 12, n_paths: int = 20000,
+                    method: str = 'bootstrap', seed: Optional[int] = None,
+                    workers: Optional[int] = None, policy: Optional[WithdrawalPolicy] = None) -> Dict:
+    """API sin interfaz gráfica: proyectar el capital a partir de la BD.
+    workers=None usa un proceso por CPU cuando el número de trayectorias lo justifica.
+    """
+    if workers is None:
+        workers = min(os.cpu_count() or 1, 8) if n_paths >= 200000 else 0
+    projector = CapitalProjector.from_db(db_manager, policy=policy)
+    return projector.project(initial_capital, weeks=weeks, n_paths=n_paths, method=method,
+                             seed=seed, workers=workers)
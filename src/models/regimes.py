@@ -0,0 +1,185 @@
+"""
+Detección de regímenes semanales
+Representa cada semana como un vector de características (montos diarios
+normalizados por el capital inicial, volatilidad, días positivos/negativos),
+las agrupa con k-means en NumPy y etiqueta la semana en curso por el
+centroide más cercano usando solo los días ya introducidos (el resumen de
+volatilidad y días positivos/negativos solo cuenta con la semana completa).
+"""
+
+import json
+from typing import Dict, Optional
+import numpy as np
+
+from .history import TradingHistory, HISTORY_DAYS
+
+# Clave de configuración donde se cachean los centroides
+REGIME_STATE_KEY = 'regime_state'
+
+N_DAYS = len(HISTORY_DAYS)
+
+
+def week_features(amounts, capital) -> np.ndarray:
+    """Matriz (semanas, 8): 5 rendimientos diarios, volatilidad, fracción de días positivos y negativos"""
+    amounts = np.atleast_2d(np.asarray(amounts, dtype=float))
+    capital = np.atleast_1d(np.asarray(capital, dtype=float))
+    safe = np.where(capital > 0, capital, 1.0)
+    returns = amounts / safe[:, None]
+    return np.column_stack([
+        returns,
+        returns.std(axis=1),
+        (amounts > 0).mean(axis=1),
+        (amounts < 0).mean(axis=1),
+    ])
+
+
+def kmeans(X: np.ndarray, k: int, n_iter: int = 50, seed: int = 0,
+           init: Optional[np.ndarray] = None):
+    """k-means vectorizado (inicialización k-means++ o centroides dados). Devuelve (centroides, etiquetas)"""
+    n = X.shape[0]
+    k = min(k, n)
+    if init is not None and init.shape == (k, X.shape[1]):
+        centroids = init.copy()
+    else:
+        rng = np.random.default_rng(seed)
+        centroids = np.empty((k, X.shape[1]))
+        centroids[0] = X[rng.integers(n)]
+        closest = np.square(X - centroids[0]).sum(axis=1)
+        for j in range(1, k):
+            total = closest.sum()
+            index = rng.choice(n, p=closest / total) if total > 0 else rng.integers(n)
+            centroids[j] = X[index]
+            closest = np.minimum(closest, np.square(X - centroids[j]).sum(axis=1))
+
+    labels = np.zeros(n, dtype=int)
+    for iteration in range(n_iter):
+        # Distancias (n, k) con ||x||² - 2 x·c + ||c||²
+        distances = (np.square(X).sum(axis=1)[:, None] - 2 * X @ centroids.T
+                     + np.square(centroids).sum(axis=1)[None, :])
+        new_labels = distances.argmin(axis=1)
+        if iteration > 0 and np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        counts = np.bincount(labels, minlength=k)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, X)
+        occupied = counts > 0
+        centroids[occupied] = sums[occupied] / counts[occupied, None]
+    return centroids, labels
+
+
+class RegimeModel:
+    """Centroides de regímenes semanales y etiquetado de la semana en curso"""
+
+    def __init__(self, k: int = 4):
+        self.k = k
+        self.centroids = np.empty((0, N_DAYS + 3))   # en escala estandarizada
+        self.mean = np.zeros(N_DAYS + 3)
+        self.scale = np.ones(N_DAYS + 3)
+        self.counts = np.zeros(0, dtype=int)
+        self.names = []
+        self.weeks = 0
+
+    def fit(self, history: TradingHistory, warm_start: bool = True) -> 'RegimeModel':
+        """Agrupar todas las semanas del historial"""
+        self.weeks = len(history)
+        if self.weeks < self.k:
+            self.centroids, self.counts, self.names = np.empty((0, N_DAYS + 3)), np.zeros(0, dtype=int), []
+            return self
+        features = week_features(history.amounts, history.initial_capital)
+        self.mean = features.mean(axis=0)
+        self.scale = np.where(features.std(axis=0) > 0, features.std(axis=0), 1.0)
+        X = (features - self.mean) / self.scale
+        init = self.centroids if warm_start and len(self.centroids) == self.k else None
+        self.centroids, labels = kmeans(X, self.k, init=init)
+        self.counts = np.bincount(labels, minlength=len(self.centroids))
+        self.names = self._name_clusters()
+        return self
+
+    def _name_clusters(self):
+        """Nombre (clave de traducción) de cada centroide según rendimiento y volatilidad"""
+        raw = self.centroids * self.scale + self.mean
+        week_return = raw[:, :N_DAYS].sum(axis=1)
+        volatility = raw[:, N_DAYS]
+        calm = volatility <= np.median(volatility)
+        names = []
+        for ret, is_calm in zip(week_return, calm):
+            if ret > 0:
+                names.append('regime_steady_gain' if is_calm else 'regime_volatile_gain')
+            else:
+                names.append('regime_flat' if is_calm else 'regime_volatile_loss')
+        return names
+
+    def label(self, amounts, capital: float) -> Optional[Dict]:
+        """Régimen más cercano de una semana (parcial): solo cuentan los días ya introducidos.
+        Volatilidad y fracciones de días positivos/negativos se ajustaron sobre semanas de cinco
+        días: con menos días no son comparables y se dejan fuera hasta completar la semana.
+        """
+        if not len(self.centroids):
+            return None
+        amounts = np.asarray(amounts, dtype=float)
+        filled = int(np.flatnonzero(amounts)[-1]) + 1 if np.any(amounts) else 0
+        if filled == 0:
+            return None
+        # Misma definición que en fit (días pendientes a 0); la máscara decide qué se compara
+        features = week_features(amounts, capital)[0]
+        mask = np.concatenate([np.arange(N_DAYS) < filled, np.full(3, filled == N_DAYS)])
+        x = (features[mask] - self.mean[mask]) / self.scale[mask]
+        distances = np.square(self.centroids[:, mask] - x).sum(axis=1)
+        cluster = int(distances.argmin())
+        return {'cluster': cluster, 'regime': self.names[cluster], 'distance': float(distances[cluster] ** 0.5),
+                'weeks_in_regime': int(self.counts[cluster]), 'days_used': filled}
+
+    def to_dict(self) -> Dict:
+        return {'k': self.k, 'centroids': self.centroids.tolist(), 'mean': self.mean.tolist(),
+                'scale': self.scale.tolist(), 'counts': self.counts.tolist(), 'names': self.names,
+                'weeks': self.weeks}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'RegimeModel':
+        model = cls(data.get('k', 4))
+        model.centroids = np.asarray(data['centroids'], dtype=float).reshape(-1, N_DAYS + 3)
+        model.mean = np.asarray(data['mean'], dtype=float)
+        model.scale = np.asarray(data['scale'], dtype=float)
+        model.counts = np.asarray(data['counts'], dtype=int)
+        model.names = list(data['names'])
+        model.weeks = int(data.get('weeks', 0))
+        return model
+
+
+# Modelos de regímenes cargados por cuenta (ruta de la base de datos)
+_models: Dict[str, RegimeModel] = {}
+
+
+def get_regime_model(db_manager) -> RegimeModel:
+    """Obtener los centroides de una cuenta (cacheados en la BD o agrupando el historial)"""
+    model = _models.get(db_manager.db_path)
+    if model is not None:
+        return model
+    try:
+        raw = db_manager.get_config(REGIME_STATE_KEY)
+        if raw:
+            model = RegimeModel.from_dict(json.loads(raw))
+    except (ValueError, TypeError, KeyError) as e:
+        print(f"Error al leer los regímenes cacheados: {e}")
+    if model is None:
+        history = TradingHistory.from_db(db_manager)
+        model = RegimeModel().fit(_completed_weeks(history))
+        db_manager.set_config(REGIME_STATE_KEY, json.dumps(model.to_dict()))
+    _models[db_manager.db_path] = model
+    return model
+
+
+def _completed_weeks(history: TradingHistory) -> TradingHistory:
+    """Historial sin la última semana (la semana en curso)"""
+    return TradingHistory(history.week_dates[:-1], history.amounts[:-1], history.initial_capital[:-1])
+
+
+def refresh_regime_model(db_manager, history: TradingHistory) -> bool:
+    """Reagrupar (partiendo de los centroides actuales) solo si hay semanas completas nuevas"""
+    model = get_regime_model(db_manager)
+    completed = _completed_weeks(history)
+    if len(completed) == model.weeks:
+        return False
+    model.fit(completed)
+    return db_manager.set_config(REGIME_STATE_KEY, json.dumps(model.to_dict()))
@@ -0,0 +1,159 @@
+"""
+Distribución de los resultados diarios
+Histograma (y curva KDE) de los días operados en una ventana del historial, en
+dinero o en % del capital inicial de su semana. Los bordes de los bins y el
+ancho de banda se fijan al construir: cambiar una semana solo resta sus días
+anteriores y suma los nuevos (se reconstruye si un valor cae fuera del rango).
+"""
+
+from typing import Dict, Optional
+import numpy as np
+
+from .history import TradingHistory
+
+# Ventanas seleccionables en semanas (None = todo el historial)
+DISTRIBUTION_WINDOWS = (13, 52, 156, None)
+DISTRIBUTION_MODES = ('amount', 'percent')
+DEFAULT_BINS = 30
+KDE_POINTS = 200
+# Margen a cada lado del rango observado para que los cambios pequeños quepan sin reconstruir
+RANGE_MARGIN = 0.15
+
+
+class ReturnDistribution:
+    """Conteos por bin y suma de kernels de los días operados, mantenidos de forma incremental"""
+
+    def __init__(self, history: TradingHistory, window_weeks: Optional[int] = None,
+                 mode: str = 'amount', n_bins: int = DEFAULT_BINS):
+        self.history = history
+        self.window_weeks = window_weeks
+        self.mode = mode if mode in DISTRIBUTION_MODES else 'amount'
+        self.n_bins = n_bins
+        self.generation = 0  # Cambia cuando cambian los bordes de los bins
+        self.rebuild()
+
+    @classmethod
+    def from_db(cls, db_manager, **kwargs) -> 'ReturnDistribution':
+        return cls(TradingHistory.from_db(db_manager), **kwargs)
+
+    # ------------------------------------------------------------------
+    # Estado interno
+    # ------------------------------------------------------------------
+    def _window_start(self) -> int:
+        n = len(self.history)
+        return 0 if self.window_weeks is None else max(0, n - self.window_weeks)
+
+    def _to_values(self, amounts, capital):
+        """Días operados de las filas dadas, en dinero o en % del capital de su semana"""
+        amounts = np.asarray(amounts, dtype=float)
+        if self.mode == 'percent':
+            capital = np.asarray(capital, dtype=float)
+            safe = np.where(capital > 0, capital, np.nan)
+            values = np.nan_to_num(amounts / safe[..., None] * 100.0, nan=0.0, posinf=0.0, neginf=0.0)
+        else:
+            values = amounts
+        return values[amounts != 0]
+
+    def _row_values(self, idx: int) -> np.ndarray:
+        return self._to_values(self.history.amounts[idx:idx + 1], self.history.initial_capital[idx:idx + 1])
+
+    def window_values(self) -> np.ndarray:
+        """Valores de todos los días operados de la ventana"""
+        start = self._window_start()
+        return self._to_values(self.history.amounts[start:], self.history.initial_capital[start:])
+
+    def rebuild(self):
+        """Recalcular bordes, ancho de banda y conteos desde la ventana completa"""
+        values = self.window_values()
+        lo, hi = (float(values.min()), float(values.max())) if values.size else (-1.0, 1.0)
+        if hi - lo < 1e-9:
+            lo, hi = lo - 1.0, hi + 1.0
+        margin = (hi - lo) * RANGE_MARGIN
+        self.edges = np.linspace(lo - margin, hi + margin, self.n_bins + 1)
+        self.bin_width = float(self.edges[1] - self.edges[0])
+        self.grid = np.linspace(self.edges[0], self.edges[-1], KDE_POINTS)
+        # Regla de Scott; sin dispersión suficiente, un bin de ancho
+        std = float(values.std(ddof=1)) if values.size > 1 else 0.0
+        self.bandwidth = 1.06 * std * values.size ** -0.2 if std > 0 else self.bin_width
+
+        self.counts = np.zeros(self.n_bins, dtype=int)
+        self.kernel_sum = np.zeros(KDE_POINTS)
+        self.count = 0
+        self.sum = 0.0
+        self.sum_sq = 0.0
+        self.positive = 0
+        self._apply(values, 1)
+        self.generation += 1
+
+    def _fits(self, values) -> bool:
+        return bool(np.all((values >= self.edges[0]) & (values <= self.edges[-1])))
+
+    def _apply(self, values, sign: int):
+        """Sumar (sign=1) o restar (sign=-1) días a los conteos, kernels y sumas"""
+        if not values.size:
+            return
+        bins = np.clip(np.searchsorted(self.edges, values, side='right') - 1, 0, self.n_bins - 1)
+        np.add.at(self.counts, bins, sign)
+        z = (self.grid[None, :] - values[:, None]) / self.bandwidth
+        self.kernel_sum += sign * np.exp(-0.5 * z * z).sum(axis=0)
+        self.count += sign * values.size
+        self.sum += sign * float(values.sum())
+        self.sum_sq += sign * float(np.square(values).sum())
+        self.positive += sign * int((values > 0).sum())
+
+    # ------------------------------------------------------------------
+    # Cambios
+    # ------------------------------------------------------------------
+    def set_window(self, window_weeks: Optional[int]):
+        self.window_weeks = window_weeks
+        self.rebuild()
+
+    def set_mode(self, mode: str):
+        if mode in DISTRIBUTION_MODES:
+            self.mode = mode
+            self.rebuild()
+
+    def update_week(self, week_start_date, amounts, initial_capital: float) -> bool:
+        """Aplicar el cambio de una semana. Devuelve False si hubo que reconstruir (bordes nuevos)"""
+        n_before = len(self.history)
+        start_before = self._window_start()
+        idx = self.history.index_of(week_start_date)
+        old = self._row_values(idx) if idx >= start_before else np.empty(0)
+
+        idx_new = self.history.upsert_week(week_start_date, amounts, initial_capital)
+        inserted = len(self.history) > n_before
+        if inserted and idx_new != len(self.history) - 1:
+            # Semana insertada en medio del historial: la ventana cambia entera
+            self.rebuild()
+            return False
+
+        new = self._row_values(idx_new) if idx_new >= self._window_start() else np.empty(0)
+        if not self._fits(new):
+            self.rebuild()
+            return False
+        self._apply(old, -1)
+        if inserted and self._window_start() > start_before:
+            # Semana nueva al final: la más antigua de la ventana sale de ella
+            self._apply(self._row_values(start_before), -1)
+        self._apply(new, 1)
+        return True
+
+    # ------------------------------------------------------------------
+    # Resultados
+    # ------------------------------------------------------------------
+    @property
+    def centers(self) -> np.ndarray:
+        return (self.edges[:-1] + self.edges[1:]) / 2
+
+    def kde_counts(self) -> np.ndarray:
+        """Curva KDE en la escala de los conteos (días por bin)"""
+        scale = self.bin_width / (self.bandwidth * np.sqrt(2 * np.pi))
+        return np.maximum(self.kernel_sum * scale, 0.0)
+
+    def stats(self) -> Dict:
+        """Días, media, desviación típica y días positivos de la ventana"""
+        n = self.count
+        mean = self.sum / n if n else 0.0
+        variance = max(0.0, (self.sum_sq - n * mean ** 2) / (n - 1)) if n > 1 else 0.0
+        return {'count': n, 'mean': mean, 'std': variance ** 0.5,
+                'positive': self.positive}
@@ -0,0 +1,211 @@
+"""
+Motor de métricas de riesgo sobre el historial completo
+Mantiene drawdown, rendimientos móviles, volatilidad, Sharpe/Sortino, tasa de
+acierto, profit factor y rachas, actualizándolos de forma incremental cuando
+cambia una semana (solo se recalcula la cola a partir de esa semana). También
+el máximo acumulado del capital inicial semanal, del que sale el drawdown del
+capital que usa la política de retiro.
+"""
+
+from typing import Dict, Optional
+import numpy as np
+
+from .history import TradingHistory, HISTORY_DAYS
+from .withdrawal_policy import capital_drawdown
+
+ROLLING_WINDOWS = (4, 13, 52)
+WEEKS_PER_YEAR = 52
+
+
+class RiskMetricsEngine:
+    """Métricas de riesgo incrementales para una cuenta (base de datos)"""
+
+    def __init__(self, history: TradingHistory):
+        self.history = history
+        self._metrics: Optional[Dict] = None
+        self._rebuild()
+
+    @classmethod
+    def from_db(cls, db_manager) -> 'RiskMetricsEngine':
+        return cls(TradingHistory.from_db(db_manager))
+
+    # ------------------------------------------------------------------
+    # Estado interno
+    # ------------------------------------------------------------------
+    def _rebuild(self):
+        """Construir todo el estado desde cero (solo al crear el motor)"""
+        n = len(self.history)
+        self.returns = self.history.weekly_returns.copy()
+        self.index = np.empty(n)          # índice de capital compuesto (sin retiros)
+        self.peak = np.empty(n)           # máximo acumulado del índice
+        self.drawdown = np.empty(n)       # caída desde el máximo (fracción)
+        self.underwater = np.zeros(n, dtype=int)  # semanas consecutivas bajo el máximo
+        self.capital_peak = np.empty(n)   # máximo acumulado del capital inicial (con retiros)
+        self.win_run = np.zeros(n * len(HISTORY_DAYS), dtype=int)
+        self.loss_run = np.zeros(n * len(HISTORY_DAYS), dtype=int)
+
+        # Sumas para volatilidad / Sharpe / Sortino
+        self.sum_r = float(self.returns.sum())
+        self.sum_r2 = float(np.square(self.returns).sum())
+        self.sum_down2 = float(np.square(np.minimum(self.returns, 0.0)).sum())
+
+        # Agregados diarios para tasa de acierto y profit factor
+        amounts = self.history.amounts
+        self.wins = int((amounts > 0).sum())
+        self.losses = int((amounts < 0).sum())
+        self.gross_profit = float(amounts[amounts > 0].sum())
+        self.gross_loss = float(-amounts[amounts < 0].sum())
+
+        if n:
+            self._recompute_tail(0)
+
+    def _recompute_tail(self, start: int):
+        """Recalcular series acumulativas desde la semana start hasta el final"""
+        n = len(self.returns)
+        if start >= n:
+            return
+        base = self.index[start - 1] if start > 0 else 1.0
+        self.index[start:] = base * np.cumprod(1.0 + self.returns[start:])
+        prev_peak = self.peak[start - 1] if start > 0 else 1.0
+        self.peak[start:] = np.maximum.accumulate(np.maximum(self.index[start:], prev_peak))
+        self.drawdown[start:] = 1.0 - self.index[start:] / np.where(self.peak[start:] > 0, self.peak[start:], 1.0)
+        prev_capital_peak = self.capital_peak[start - 1] if start > 0 else -np.inf
+        self.capital_peak[start:] = np.maximum.accumulate(
+            np.maximum(self.history.initial_capital[start:], prev_capital_peak))
+
+        # Duración bajo el agua: normalmente la cola es la última semana
+        run = self.underwater[start - 1] if start > 0 else 0
+        for t in range(start, n):
+            run = run + 1 if self.drawdown[t] > 1e-12 else 0
+            self.underwater[t] = run
+
+        # Rachas diarias (los días sin operar no rompen la racha)
+        flat = self.history.amounts.reshape(-1)
+        day_start = start * len(HISTORY_DAYS)
+        win = self.win_run[day_start - 1] if day_start > 0 else 0
+        loss = self.loss_run[day_start - 1] if day_start > 0 else 0
+        for k in range(day_start, flat.size):
+            if flat[k] > 0:
+                win, loss = win + 1, 0
+            elif flat[k] < 0:
+                win, loss = 0, loss + 1
+            self.win_run[k] = win
+            self.loss_run[k] = loss
+
+    def update_week(self, week_start_date, amounts, initial_capital: float):
+        """Aplicar el cambio de una semana de forma incremental"""
+        idx = self.history.index_of(week_start_date)
+        if idx >= 0:
+            old_amounts = self.history.amounts[idx].copy()
+            old_return = float(self.returns[idx])
+        else:
+            old_amounts = np.zeros(len(HISTORY_DAYS))
+            old_return = 0.0
+
+        idx_new = self.history.upsert_week(week_start_date, amounts, initial_capital)
+        new_amounts = self.history.amounts[idx_new]
+        capital = self.history.initial_capital[idx_new]
+        new_return = float(new_amounts.sum() / capital) if capital > 0 else 0.0
+
+        if idx < 0:
+            # Semana nueva: abrir hueco en las series y recalcular desde ahí
+            self.returns = np.insert(self.returns, idx_new, new_return)
+            self.index = np.insert(self.index, idx_new, 0.0)
+            self.peak = np.insert(self.peak, idx_new, 0.0)
+            self.drawdown = np.insert(self.drawdown, idx_new, 0.0)
+            self.underwater = np.insert(self.underwater, idx_new, 0)
+            self.capital_peak = np.insert(self.capital_peak, idx_new, 0.0)
+            day_pos = idx_new * len(HISTORY_DAYS)
+            self.win_run = np.insert(self.win_run, day_pos, np.zeros(len(HISTORY_DAYS), dtype=int))
+            self.loss_run = np.insert(self.loss_run, day_pos, np.zeros(len(HISTORY_DAYS), dtype=int))
+        else:
+            self.returns[idx_new] = new_return
+
+        # Sumas O(1): restar el valor anterior y sumar el nuevo
+        self.sum_r += new_return - old_return
+        self.sum_r2 += new_return ** 2 - old_return ** 2
+        self.sum_down2 += min(new_return, 0.0) ** 2 - min(old_return, 0.0) ** 2
+        for value, sign in ((old_amounts, -1), (new_amounts, 1)):
+            self.wins += sign * int((value > 0).sum())
+            self.losses += sign * int((value < 0).sum())
+            self.gross_profit += sign * float(value[value > 0].sum())
+            self.gross_loss += sign * float(-value[value < 0].sum())
+
+        self._recompute_tail(idx_new)
+        self._metrics = None
+
+    # ------------------------------------------------------------------
+    # Resultados
+    # ------------------------------------------------------------------
+    def capital_drawdown(self, week_start_date, capital: float) -> float:
+        """Drawdown de un capital inicial frente al máximo registrado hasta esa semana (O(1))"""
+        idx = self.history.index_of(week_start_date)
+        if idx < 0:
+            # Semana aún no guardada: máximo de las semanas anteriores
+            key = week_start_date.isoformat() if hasattr(week_start_date, 'isoformat') else str(week_start_date)
+            idx = sum(1 for week in self.history.week_dates if week < key) - 1
+        peak = max(float(self.capital_peak[idx]) if idx >= 0 else capital, capital)
+        return capital_drawdown(capital, peak)
+
+    def equity_curve(self, start_capital: Optional[float] = None) -> np.ndarray:
+        """Curva de capital compuesta (sin retiros) a partir del capital de la primera semana"""
+        if start_capital is None:
+            start_capital = float(self.history.initial_capital[0]) if len(self.history) else 100.0
+        return start_capital * self.index
+
+    def metrics(self) -> Dict:
+        """Métricas actuales (se cachean hasta el siguiente cambio)"""
+        if self._metrics is not None:
+            return self._metrics
+
+        n = len(self.returns)
+        mean = self.sum_r / n if n else 0.0
+        variance = max(0.0, (self.sum_r2 - n * mean ** 2) / (n - 1)) if n > 1 else 0.0
+        volatility = variance ** 0.5
+        downside = (self.sum_down2 / n) ** 0.5 if n else 0.0
+        annual = WEEKS_PER_YEAR ** 0.5
+
+        rolling = {}
+        for window in ROLLING_WINDOWS:
+            if n >= window:
+                base = self.index[n - window - 1] if n > window else 1.0
+                rolling[window] = float(self.index[-1] / base - 1.0) if base > 0 else None
+            else:
+                rolling[window] = None
+
+        decided = self.wins + self.losses
+        current_streak = 0
+        if self.win_run.size:
+            current_streak = int(self.win_run[-1]) if self.win_run[-1] else -int(self.loss_run[-1])
+
+        self._metrics = {
+            'weeks': n,
+            'max_drawdown': float(self.drawdown.max()) if n else 0.0,
+            'current_drawdown': float(self.drawdown[-1]) if n else 0.0,
+            'max_drawdown_duration': int(self.underwater.max()) if n else 0,
+            'rolling_returns': rolling,
+            'mean_weekly_return': mean,
+            'volatility': volatility,
+            'annualized_volatility': volatility * annual,
+            'sharpe': (mean / volatility * annual) if volatility > 0 else 0.0,
+            'sortino': (mean / downside * annual) if downside > 0 else 0.0,
+            'win_rate': (self.wins / decided) if decided else 0.0,
+            'profit_factor': (self.gross_profit / self.gross_loss) if self.gross_loss > 0 else None,
+            'current_streak': current_streak,
+            'max_win_streak': int(self.win_run.max()) if self.win_run.size else 0,
+            'max_loss_streak': int(self.loss_run.max()) if self.loss_run.size else 0,
+        }
+        return self._metrics
+
+
+# Caché de motores por cuenta (ruta de la base de datos)
+_engines: Dict[str, RiskMetricsEngine] = {}
+
+
+def get_risk_engine(db_manager) -> RiskMetricsEngine:
+    """Obtener (o crear una sola vez) el motor de métricas de una cuenta"""
+    engine = _engines.get(db_manager.db_path)
+    if engine is None:
+        engine = RiskMetricsEngine.from_db(db_manager)
+        _engines[db_manager.db_path] = engine
+    return engine
@@ -5,6 +5,12 @@ Modelo de datos mejorado con integración de base de datos
 from datetime import datetime
 from typing import Dict, Optional
 from .trading_model import TradingDataModel
+from .withdrawal_policy import get_withdrawal_policy
+from .risk_metrics import get_risk_engine
+from .weekday_analytics import get_weekday_analytics
+from .forecaster import get_forecaster, sync_forecaster, save_forecaster
+from .regimes import get_regime_model, refresh_regime_model
+from .anomaly_detector import get_anomaly_detector, save_anomaly_detector
 from ..database.database_manager import DatabaseManager
 
 class TradingDataModelWithDB(TradingDataModel):
@@ -21,6 +27,9 @@ class TradingDataModelWithDB(TradingDataModel):
         # Capital inicial de la semana
         self.initial_capital = 100.0  # Valor por defecto
         
+        # Montos atípicos de la semana cargada: día -> puntuación
+        self.anomalies: Dict[str, float] = {}
+        
         # Cargar datos guardados automáticamente al iniciar
         self.load_saved_data()
         
@@ -32,7 +41,80 @@ class TradingDataModelWithDB(TradingDataModel):
             self.daily_amounts[day] = amount
             self.daily_destinations[day] = self.data[day].get('destination', self.destinations[day])
         # Guardar automáticamente en la base de datos
-        self.db_manager.save_weekly_data(self.to_dict())
+        self._persist_week()
+        self._check_anomaly(day, amount)
+
+    def _check_anomaly(self, day: str, amount: float):
+        """Puntuar el monto introducido y actualizar el estado del detector en O(1)
+        (la aportación anterior de la celda se deshace, sea cual sea la semana)
+        """
+        try:
+            detector = get_anomaly_detector(self.db_manager)
+            score = detector.observe(day, amount, f"{self.week_start_date.isoformat()}:{day}")
+            save_anomaly_detector(self.db_manager, detector)
+            if detector.is_anomaly(score):
+                self.anomalies[day] = score
+            else:
+                self.anomalies.pop(day, None)
+        except Exception as e:
+            print(f"Error al evaluar anomalías: {e}")
+        
+    def _persist_week(self) -> bool:
+        """Guardar la semana en la BD y propagar el cambio a las métricas incrementales"""
+        saved = self.db_manager.save_weekly_data(self.to_dict())
+        if saved:
+            try:
+                amounts = [self.data[day]['amount'] for day in self.days]
+                engine = get_risk_engine(self.db_manager)
+                engine.update_week(self.week_start_date, amounts, self.initial_capital)
+                refresh_regime_model(self.db_manager, engine.history)
+                get_weekday_analytics(self.db_manager).update_week(self.week_start_date, amounts, self.initial_capital)
+            except Exception as e:
+                print(f"Error al actualizar métricas de riesgo: {e}")
+            try:
+                forecaster = get_forecaster(self.db_manager)
+                if sync_forecaster(self.db_manager, forecaster, self.week_start_date.isoformat()):
+                    save_forecaster(self.db_manager, forecaster)
+            except Exception as e:
+                print(f"Error al actualizar el pronóstico: {e}")
+        return saved
+    
+    def get_risk_metrics(self) -> Dict:
+        """Métricas de riesgo del historial completo (cacheadas por cuenta)"""
+        try:
+            return get_risk_engine(self.db_manager).metrics()
+        except Exception as e:
+            print(f"Error al calcular métricas de riesgo: {e}")
+            return {}
+
+    def get_forecast(self) -> Dict:
+        """Rango pronosticado (90%) del próximo día y de la próxima semana, en dinero"""
+        try:
+            amounts = [self.data[day]['amount'] for day in self.days]
+            filled = max((i + 1 for i, amount in enumerate(amounts) if amount != 0), default=0)
+            capital = self.initial_capital
+            recent = [amount / capital for amount in amounts[:filled]] if capital > 0 else []
+            return get_forecaster(self.db_manager).forecast(recent, capital)
+        except Exception as e:
+            print(f"Error al calcular el pronóstico: {e}")
+            return {}
+
+    def get_current_regime(self) -> Optional[Dict]:
+        """Régimen (tipo de semana) más cercano a la semana en curso según los días introducidos"""
+        try:
+            amounts = [self.data[day]['amount'] for day in self.days]
+            return get_regime_model(self.db_manager).label(amounts, self.initial_capital)
+        except Exception as e:
+            print(f"Error al detectar el régimen de la semana: {e}")
+            return None
+
+    def get_weekday_stats(self) -> Dict:
+        """Estadísticas por día de la semana y por destino sobre todo el historial"""
+        try:
+            return get_weekday_analytics(self.db_manager).stats()
+        except Exception as e:
+            print(f"Error al calcular estadísticas por día: {e}")
+            return {}
         
     def load_saved_data(self):
         """Cargar datos guardados desde la base de datos"""
@@ -65,11 +147,22 @@ class TradingDataModelWithDB(TradingDataModel):
                 self.daily_destinations[day] = self.data[day].get('destination', self.destinations[day])
         # Cargar capital inicial si existe
         self.initial_capital = data.get('initial_capital', 100.0)
+        self._score_loaded_week()
+
+    def _score_loaded_week(self):
+        """Marcar los montos atípicos de una semana cargada (sin modificar el detector)"""
+        try:
+            detector = get_anomaly_detector(self.db_manager)
+            self.anomalies = detector.score_week({day: self.data[day]['amount'] for day in self.days},
+                                                 self.week_start_date.isoformat())
+        except Exception as e:
+            print(f"Error al evaluar anomalías: {e}")
+            self.anomalies = {}
     
     def save_current_week(self):
         """Guardar la semana actual en la base de datos"""
         try:
-            self.db_manager.save_weekly_data(self.to_dict())
+            self._persist_week()
             return True
         except Exception as e:
             print(f"Error al guardar la semana actual: {e}")
@@ -165,11 +258,23 @@ class TradingDataModelWithDB(TradingDataModel):
             return 0.0
         return (total_change / self.initial_capital) * 100
     
+    def get_capital_drawdown(self):
+        """Drawdown del capital inicial de la semana respecto al máximo registrado hasta ella
+        (máximo acumulado mantenido por el motor de riesgo; misma definición que el backtester)
+        """
+        return get_risk_engine(self.db_manager).capital_drawdown(self.week_start_date, self.initial_capital)
+
+    def get_recommended_withdrawal(self, policy=None):
+        """Retiro recomendado para la semana actual según la política de retiro activa"""
+        policy = policy or get_withdrawal_policy()
+        drawdown = self.get_capital_drawdown() if policy.uses_drawdown else 0.0
+        return policy.withdrawal(self.get_total_profit_loss(), self.initial_capital, drawdown)
+    
     def set_initial_capital(self, capital: float):
         """Establecer el capital inicial de la semana"""
         self.initial_capital = max(0.0, capital)  # Asegurar que no sea negativo
         # Guardar automáticamente en la base de datos
-        self.db_manager.save_weekly_data(self.to_dict())
+        self._persist_week()
     
     def get_weekly_data(self):
         """Obtener todos los datos de la semana actual para exportación"""
@@ -181,7 +286,10 @@ class TradingDataModelWithDB(TradingDataModel):
             'week_start_date': self.week_start_date.isoformat(),
             'current_balance': self.get_current_balance(),
             'total_profit_loss': self.get_total_profit_loss(),
-            'profit_loss_percentage': self.get_profit_loss_percentage()
+            'profit_loss_percentage': self.get_profit_loss_percentage(),
+            'risk_metrics': self.get_risk_metrics(),
+            'weekday_stats': self.get_weekday_stats(),
+            'anomalies': dict(self.anomalies)
         }
 
     def start_new_week(self, next_monday_date, new_initial_capital: float) -> bool:
@@ -206,9 +314,10 @@ class TradingDataModelWithDB(TradingDataModel):
             self.data = {day: {'amount': 0.0, 'destination': self.destinations[day]} for day in self.days}
             self.daily_amounts = {day: 0.0 for day in self.days}
             self.daily_destinations = self.destinations.copy()
+            self.anomalies = {}
 
             # Guardar registro de nueva semana en la base de datos
-            return self.db_manager.save_weekly_data(self.to_dict())
+            return self._persist_week()
         except Exception as e:
             print(f"Error al iniciar nueva semana: {e}")
             return False
\ No newline at end of file
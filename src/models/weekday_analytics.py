@@ -0,0 +1,170 @@
+"""
+Analítica por día de la semana sobre el historial completo
+Media, mediana, tasa de acierto, varianza y contribución al total de cada día
+(y de cada destino). Las sumas por día salen de una única agrupación vectorizada
+al construir; cambiar una semana solo resta su fila anterior y suma la nueva
+(las medianas se mantienen con listas ordenadas por día). Los destinos se
+agregan a partir de las sumas por día, porque cada día tiene un destino fijo.
+"""
+
+import bisect
+from typing import Dict, List, Optional
+import numpy as np
+
+from .history import TradingHistory, HISTORY_DAYS
+
+# Destino de cada día (el historial no guarda destinos: son fijos por día)
+DEFAULT_DESTINATIONS = {
+    'Lunes': 'Retiro Personal',
+    'Martes': 'Retiro Personal',
+    'Miércoles': 'Reinversión',
+    'Jueves': 'Retiro Personal',
+    'Viernes': 'Retiro Personal',
+}
+
+# Operaciones mínimas de un día para recomendar dejar de operarlo
+MIN_TRADES_FOR_ADVICE = 8
+
+
+def stop_day_from_stats(stats: Dict) -> Optional[str]:
+    """Día con media negativa y suficientes operaciones según un resultado de stats()
+    (sirve también para las estadísticas ya serializadas que recibe el analizador)
+    """
+    worst = stats.get('worst_day')
+    if worst is None:
+        return None
+    day = stats['days'][worst]
+    if day['traded'] >= MIN_TRADES_FOR_ADVICE and day['mean'] < 0:
+        return worst
+    return None
+
+
+class WeekdayAnalytics:
+    """Estadísticas por día y por destino, con sumas incrementales por semana"""
+
+    def __init__(self, history: TradingHistory, destinations: Optional[Dict[str, str]] = None):
+        self.history = history
+        self.destinations = destinations or DEFAULT_DESTINATIONS
+        self._stats: Optional[Dict] = None
+        self.rebuild()
+
+    @classmethod
+    def from_db(cls, db_manager) -> 'WeekdayAnalytics':
+        return cls(TradingHistory.from_db(db_manager))
+
+    def rebuild(self):
+        """Sumas por día desde el historial completo (una agrupación vectorizada con bincount)"""
+        n_days = len(HISTORY_DAYS)
+        values = self.history.amounts.reshape(-1)
+        day_ids = np.tile(np.arange(n_days), len(self.history))
+        traded = values != 0
+        g, v = day_ids[traded], values[traded]
+        self.count = np.bincount(g, minlength=n_days).astype(int)
+        self.total = np.bincount(g, weights=v, minlength=n_days)
+        self.total_sq = np.bincount(g, weights=v * v, minlength=n_days)
+        self.hits = np.bincount(g, weights=(v > 0).astype(float), minlength=n_days)
+        # Días operados ordenados por columna: la mediana es una consulta por índice
+        self.sorted_values: List[List[float]] = [
+            sorted(column[column != 0].tolist()) for column in self.history.amounts.T]
+        self._stats = None
+
+    def _apply(self, row, sign: int):
+        """Sumar (sign=1) o restar (sign=-1) la fila de una semana"""
+        for i, value in enumerate(np.asarray(row, dtype=float)):
+            if value == 0:
+                continue
+            value = float(value)
+            self.count[i] += sign
+            self.total[i] += sign * value
+            self.total_sq[i] += sign * value * value
+            self.hits[i] += sign * (value > 0)
+            values = self.sorted_values[i]
+            if sign > 0:
+                bisect.insort(values, value)
+            else:
+                del values[bisect.bisect_left(values, value)]
+
+    def update_week(self, week_start_date, amounts, initial_capital: float):
+        """Aplicar el cambio de una semana: restar su fila anterior y sumar la nueva"""
+        idx = self.history.index_of(week_start_date)
+        old = self.history.amounts[idx].copy() if idx >= 0 else None
+        idx_new = self.history.upsert_week(week_start_date, amounts, initial_capital)
+        if old is not None:
+            self._apply(old, -1)
+        self._apply(self.history.amounts[idx_new], 1)
+        self._stats = None
+
+    @staticmethod
+    def _group(count, total, total_sq, hits) -> Dict[str, np.ndarray]:
+        """Media, varianza y acierto de cada grupo a partir de sus sumas"""
+        safe = np.maximum(count, 1)
+        mean = total / safe
+        variance = np.where(count > 1, (total_sq - count * mean ** 2) / np.maximum(count - 1, 1), 0.0)
+        return {'traded': count, 'total': total, 'mean': mean,
+                'variance': np.maximum(variance, 0.0), 'hit_rate': hits / safe}
+
+    @staticmethod
+    def _median(values: List[float]) -> float:
+        n = len(values)
+        if not n:
+            return 0.0
+        mid = n // 2
+        return values[mid] if n % 2 else (values[mid - 1] + values[mid]) / 2.0
+
+    def stats(self) -> Dict:
+        """Estadísticas actuales por día y por destino (O(días) a partir de las sumas)"""
+        if self._stats is not None:
+            return self._stats
+
+        grand_total = float(self.total.sum())
+
+        def contribution(total):
+            return total / grand_total if grand_total != 0 else np.zeros_like(total)
+
+        by_day = self._group(self.count, self.total, self.total_sq, self.hits)
+        by_day['contribution'] = contribution(by_day['total'])
+
+        dest_names = sorted(set(self.destinations.get(day, '') for day in HISTORY_DAYS))
+        dest_of_day = np.array([dest_names.index(self.destinations.get(day, '')) for day in HISTORY_DAYS])
+        n_dest = len(dest_names)
+        by_dest = self._group(*(np.bincount(dest_of_day, weights=sums, minlength=n_dest)
+                                for sums in (self.count, self.total, self.total_sq, self.hits)))
+        by_dest['contribution'] = contribution(by_dest['total'])
+
+        days = {}
+        for i, day in enumerate(HISTORY_DAYS):
+            days[day] = {key: float(array[i]) for key, array in by_day.items()}
+            days[day]['traded'] = int(by_day['traded'][i])
+            days[day]['median'] = self._median(self.sorted_values[i])
+        destinations = {}
+        for i, name in enumerate(dest_names):
+            destinations[name] = {key: float(array[i]) for key, array in by_dest.items()}
+            destinations[name]['traded'] = int(by_dest['traded'][i])
+
+        active = [day for day in HISTORY_DAYS if days[day]['traded'] > 0]
+        self._stats = {
+            'weeks': len(self.history),
+            'total': grand_total,
+            'days': days,
+            'destinations': destinations,
+            'best_day': max(active, key=lambda d: days[d]['mean']) if active else None,
+            'worst_day': min(active, key=lambda d: days[d]['mean']) if active else None,
+        }
+        return self._stats
+
+    def day_to_stop(self) -> Optional[str]:
+        """Día con media negativa y suficientes operaciones (candidato a dejar de operar)"""
+        return stop_day_from_stats(self.stats())
+
+
+# Caché de analíticas por cuenta (ruta de la base de datos)
+_analytics: Dict[str, WeekdayAnalytics] = {}
+
+
+def get_weekday_analytics(db_manager) -> WeekdayAnalytics:
+    """Obtener (o crear una sola vez) la analítica por día de una cuenta"""
+    analytics = _analytics.get(db_manager.db_path)
+    if analytics is None:
+        analytics = WeekdayAnalytics.from_db(db_manager)
+        _analytics[db_manager.db_path] = analytics
+    return analytics
@@ -0,0 +1,152 @@
+"""
+Políticas de retiro semanal
+Define la regla que decide cuánto retirar de las ganancias de una semana.
+Todas las políticas se expresan con los mismos parámetros (tramos por
+rendimiento + reducción en drawdown) para poder evaluarse de forma vectorizada.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
+
+
+def capital_drawdown(capital, peak):
+    """Drawdown del capital (ya descontados los retiros) frente a su máximo previo.
+    Única definición usada por la recomendación semanal y por el backtester.
+    """
+    capital = np.asarray(capital, dtype=float)
+    peak = np.asarray(peak, dtype=float)
+    drawdown = np.maximum(1.0 - np.divide(capital, peak, out=np.ones_like(capital), where=peak > 0), 0.0)
+    return float(drawdown) if drawdown.ndim == 0 else drawdown
+
+
+class WithdrawalPolicy:
+    """Política de retiro parametrizada por tramos de rendimiento y drawdown.
+    thresholds: rendimientos semanales (fracción del capital) a partir de los que aplica cada tasa.
+    rates: tasa de retiro sobre la ganancia positiva para cada tramo.
+    drawdown_threshold / drawdown_rate: si el drawdown del capital alcanza el umbral,
+    se usa drawdown_rate en lugar de la tasa del tramo.
+    """
+
+    name = 'custom'
+
+    def __init__(self, thresholds: Sequence[float], rates: Sequence[float],
+                 drawdown_threshold: float = np.inf, drawdown_rate: float = 0.0):
+        if len(thresholds) != len(rates) or not rates:
+            raise ValueError("thresholds y rates deben tener la misma longitud (>= 1)")
+        order = np.argsort(thresholds)
+        self.thresholds = np.asarray(thresholds, dtype=float)[order]
+        self.thresholds[0] = -np.inf  # el primer tramo cubre cualquier rendimiento
+        self.rates = np.clip(np.asarray(rates, dtype=float)[order], 0.0, 1.0)
+        self.drawdown_threshold = float(drawdown_threshold)
+        self.drawdown_rate = float(np.clip(drawdown_rate, 0.0, 1.0))
+
+    @property
+    def uses_drawdown(self) -> bool:
+        return np.isfinite(self.drawdown_threshold)
+
+    def rate(self, weekly_return, drawdown=0.0):
+        """Tasa de retiro aplicable (acepta escalares o arreglos NumPy)"""
+        weekly_return = np.asarray(weekly_return, dtype=float)
+        idx = np.searchsorted(self.thresholds, weekly_return, side='right') - 1
+        rate = self.rates[np.clip(idx, 0, len(self.rates) - 1)]
+        if self.uses_drawdown:
+            rate = np.where(np.asarray(drawdown) >= self.drawdown_threshold, self.drawdown_rate, rate)
+        return rate
+
+    def withdrawal(self, profit, capital, drawdown=0.0):
+        """Monto a retirar dada la ganancia semanal y el capital inicial de la semana"""
+        profit = np.asarray(profit, dtype=float)
+        capital = np.asarray(capital, dtype=float)
+        weekly_return = np.divide(profit, capital, out=np.zeros_like(profit), where=capital > 0)
+        amount = np.maximum(profit, 0.0) * self.rate(weekly_return, drawdown)
+        return float(amount) if amount.ndim == 0 else amount
+
+    def label(self) -> str:
+        """Descripción corta de la tasa (para mensajes), p. ej. '30%' o '20%–50%'"""
+        low, high = self.rates.min() * 100, self.rates.max() * 100
+        text = f"{low:.0f}%" if low == high else f"{low:.0f}%–{high:.0f}%"
+        if self.uses_drawdown:
+            text += f" / {self.drawdown_rate * 100:.0f}% (DD ≥ {self.drawdown_threshold * 100:.0f}%)"
+        return text
+
+    def to_params(self, n_tiers: int) -> Tuple[np.ndarray, np.ndarray, float, float]:
+        """Parámetros rellenados a n_tiers tramos para apilar varias políticas"""
+        pad = n_tiers - len(self.rates)
+        thresholds = np.concatenate([self.thresholds, np.full(pad, np.inf)])
+        rates = np.concatenate([self.rates, np.full(pad, self.rates[-1])])
+        return thresholds, rates, self.drawdown_threshold, self.drawdown_rate
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.label()})"
+
+
+class FixedPercentPolicy(WithdrawalPolicy):
+    """Retiro de un porcentaje fijo de las ganancias positivas"""
+
+    name = 'fixed'
+
+    def __init__(self, rate: float = 0.30):
+        super().__init__([0.0], [rate])
+
+
+class TieredPolicy(WithdrawalPolicy):
+    """Retiro por tramos: a mayor rendimiento semanal, mayor porcentaje retirado.
+    tiers: lista de (rendimiento_mínimo, tasa), p. ej. [(0.0, 0.2), (0.05, 0.3), (0.10, 0.5)]
+    """
+
+    name = 'tiered'
+
+    def __init__(self, tiers: Sequence[Tuple[float, float]]):
+        super().__init__([t for t, _ in tiers], [r for _, r in tiers])
+
+
+class DrawdownAwarePolicy(WithdrawalPolicy):
+    """Retiro fijo que se reduce mientras el capital esté en drawdown"""
+
+    name = 'drawdown'
+
+    def __init__(self, rate: float = 0.30, drawdown_threshold: float = 0.10, reduced_rate: float = 0.0):
+        super().__init__([0.0], [rate], drawdown_threshold, reduced_rate)
+
+
+# Política activa en la aplicación (regla histórica: 30% de las ganancias positivas)
+DEFAULT_POLICY = FixedPercentPolicy(0.30)
+_current_policy = DEFAULT_POLICY
+
+
+def get_withdrawal_policy() -> WithdrawalPolicy:
+    """Obtener la política de retiro activa"""
+    return _current_policy
+
+
+def set_withdrawal_policy(policy: WithdrawalPolicy):
+    """Cambiar la política de retiro activa"""
+    global _current_policy
+    _current_policy = policy or DEFAULT_POLICY
+
+
+def stack_policies(policies: Sequence[WithdrawalPolicy]) -> Dict[str, np.ndarray]:
+    """Apilar los parámetros de varias políticas en arreglos (P, K) / (P,)"""
+    n_tiers = max(len(p.rates) for p in policies)
+    params = [p.to_params(n_tiers) for p in policies]
+    return {
+        'thresholds': np.array([p[0] for p in params]),
+        'rates': np.array([p[1] for p in params]),
+        'drawdown_threshold': np.array([p[2] for p in params]),
+        'drawdown_rate': np.array([p[3] for p in params]),
+    }
+
+
+def default_candidate_policies() -> List[WithdrawalPolicy]:
+    """Conjunto de políticas candidatas para comparar en el backtester"""
+    candidates: List[WithdrawalPolicy] = [FixedPercentPolicy(r / 100) for r in range(0, 101, 5)]
+    for base in (0.1, 0.2, 0.3):
+        for step in (0.1, 0.2):
+            for cut in (0.02, 0.05, 0.10):
+                candidates.append(TieredPolicy([(0.0, base), (cut, min(1.0, base + step)),
+                                                (cut * 2, min(1.0, base + 2 * step))]))
+    for rate in (0.2, 0.3, 0.4, 0.5):
+        for threshold in (0.05, 0.10, 0.20):
+            for reduced in (0.0, 0.1):
+                candidates.append(DrawdownAwarePolicy(rate, threshold, reduced))
+    return candidates
@@ -1,9 +1,29 @@
 # Componentes de interfaz de usuario
-from .trading_table import TradingTableWidget
-from .enhanced_chart_widget import EnhancedChartWidget
-from .summary_panel import SummaryPanel
-from .main_menu import MainMenuBar
-from .capital_dialog import CapitalDialog
-from .export_dialog import ExportDialog, show_export_dialog
-
-__all__ = ['TradingTableWidget', 'EnhancedChartWidget', 'SummaryPanel', 'MainMenuBar', 'CapitalDialog', 'ExportDialog', 'show_export_dialog']
\ No newline at end of file
+# Importación diferida (PEP 562): importar un submódulo de src.ui no carga el resto
+# (en particular matplotlib y pandas, que solo necesitan los gráficos y la exportación)
+from importlib import import_module
+
+_EXPORTS = {
+    'TradingTableWidget': 'trading_table',
+    'EnhancedChartWidget': 'enhanced_chart_widget',
+    'ProjectionChartWidget': 'projection_chart_widget',
+    'HistoryChartWidget': 'history_chart_widget',
+    'CalendarHeatmapWidget': 'calendar_heatmap_widget',
+    'ReturnDistributionWidget': 'return_distribution_widget',
+    'DrawdownChartWidget': 'drawdown_chart_widget',
+    'SummaryPanel': 'summary_panel',
+    'MainMenuBar': 'main_menu',
+    'CapitalDialog': 'capital_dialog',
+    'ExportDialog': 'export_dialog',
+    'show_export_dialog': 'export_dialog',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,100 @@
+"""
+Workers de análisis en segundo plano
+Ejecuta el pipeline de analizadores y el consejo del día fuera del hilo de la UI.
+Solo se conserva el trabajo más reciente: si llegan ediciones nuevas antes de
+empezar, las anteriores se descartan, y los resultados de ejecuciones
+obsoletas nunca se emiten. También lanza el análisis por lotes del historial.
+"""
+
+import threading
+from typing import Dict, Optional
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from ..models.analysis_pipeline import AnalysisPipeline, merge_results
+from ..models.batch_analysis import run_batch_analysis
+from ..utils import i18n
+from ..utils.advice import AdviceCache
+
+
+class AnalysisWorker(QThread):
+    """Hilo persistente que procesa siempre la última petición de análisis"""
+
+    analysis_ready = pyqtSignal(int, dict)  # (generación, resultado)
+
+    def __init__(self, pipeline: AnalysisPipeline, advice_cache: Optional[AdviceCache] = None, parent=None):
+        super().__init__(parent)
+        self.pipeline = pipeline
+        self.advice_cache = advice_cache or AdviceCache()
+        self._condition = threading.Condition()
+        self._pending: Optional[tuple] = None
+        self._stopping = False
+
+    def submit(self, inputs: Dict) -> int:
+        """Encolar un análisis (reemplaza cualquier petición pendiente). Devuelve su generación.
+        inputs es una copia tomada en el hilo de la UI; el modelo nunca se lee desde aquí.
+        """
+        generation = self.pipeline.next_generation()
+        with self._condition:
+            self._pending = (generation, inputs)
+            self._condition.notify()
+        return generation
+
+    def is_current(self, generation: int) -> bool:
+        return self.pipeline.is_current(generation)
+
+    def stop(self):
+        """Detener el hilo y el pool de analizadores"""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        self.wait(2000)
+        self.pipeline.shutdown()
+
+    def run(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                generation, inputs = self._pending
+                self._pending = None
+
+            try:
+                results = self.pipeline.run(inputs, generation)
+                if results is None:
+                    continue  # llegó una edición más nueva durante la ejecución
+                payload = {
+                    'summary': inputs.get('summary', {}),
+                    'capital_data': inputs.get('capital_data', {}),
+                    'ai_analysis': merge_results(results),
+                }
+                try:
+                    if inputs.get('advice') is not None:
+                        payload['advice'] = self.advice_cache.get(inputs['advice'])
+                except Exception as e:
+                    print(f"Error al generar el consejo del día: {e}")
+                if self.pipeline.is_current(generation):
+                    self.analysis_ready.emit(generation, payload)
+            except Exception as e:
+                print(f"Error en el análisis en segundo plano: {e}")
+
+
+class BatchAnalysisWorker(QThread):
+    """Análisis por lotes de todas las semanas de la BD sin bloquear la UI"""
+
+    batch_completed = pyqtSignal(dict)
+    batch_error = pyqtSignal(str)
+
+    def __init__(self, db_manager, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        # Idioma tomado al crear el worker (hilo de la UI)
+        self.language = i18n.current_language
+
+    def run(self):
+        try:
+            self.batch_completed.emit(run_batch_analysis(self.db_manager, language=self.language))
+        except Exception as e:
+            self.batch_error.emit(str(e))
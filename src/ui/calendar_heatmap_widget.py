@@ -0,0 +1,248 @@
+"""
+Mapa de calor de calendario del resultado diario
+Todas las jornadas de los años elegidos van en una matriz preasignada
+(días de la semana × semanas) dibujada con un único imshow. El hover resuelve
+la celda con aritmética de índices y editar un día actualiza solo su celda.
+El canvas se crea tras el primer pintado (LazyChartWidget).
+"""
+
+from datetime import date, timedelta
+from typing import Optional, Tuple
+
+import numpy as np
+from PyQt5.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel, QSpinBox, QSizePolicy
+from PyQt5.QtCore import QTimer
+
+from src.models.history import TradingHistory, HISTORY_DAYS, week_amounts_from_model
+from src.ui.lazy_chart import LazyChartWidget
+from src.utils.i18n import tr
+
+DAY_KEYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday']
+
+
+def calendar_grid(history: TradingHistory, first_monday: date, n_weeks: int) -> np.ndarray:
+    """Matriz (5, n_weeks) con el monto de cada día; NaN donde no hay semana guardada"""
+    grid = np.full((len(HISTORY_DAYS), n_weeks), np.nan)
+    if history.is_empty:
+        return grid
+    mondays = np.array(history.week_dates, dtype='datetime64[D]')
+    columns = (mondays - np.datetime64(first_monday, 'D')).astype(int) // 7
+    inside = (columns >= 0) & (columns < n_weeks)
+    grid[:, columns[inside]] = history.amounts[inside].T
+    return grid
+
+
+def year_range(years: int, today: Optional[date] = None, through: Optional[date] = None) -> Tuple[date, int]:
+    """Primer lunes del rango (los últimos `years` años naturales) y número de semanas hasta hoy
+    o hasta la semana `through` si es posterior (p. ej. la semana en curso tras el cierre del sábado)
+    """
+    today = today or date.today()
+    start = date(today.year - years + 1, 1, 1)
+    first_monday = start - timedelta(days=start.weekday())
+    last_day = max(today, through) if through is not None else today
+    last_monday = last_day - timedelta(days=last_day.weekday())
+    return first_monday, (last_monday - first_monday).days // 7 + 1
+
+
+class CalendarHeatmapWidget(LazyChartWidget):
+    """Resultado de cada jornada de varios años en una sola imagen"""
+
+    CMAP = 'RdYlGn'
+
+    def __init__(self):
+        super().__init__()
+        self.is_dark = False
+        self.data_model = None
+        self.first_monday: Optional[date] = None
+        self.grid = np.full((len(HISTORY_DAYS), 0), np.nan)
+        self._refresh_pending = True
+        self._stale = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self.refresh)
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Configurar controles y reservar el sitio del canvas (se crea tras el primer pintado)"""
+        layout = QVBoxLayout()
+
+        controls = QHBoxLayout()
+        self.years_label = QLabel(tr('heatmap_years_label'))
+        controls.addWidget(self.years_label)
+        self.years_spin = QSpinBox()
+        self.years_spin.setRange(1, 10)
+        self.years_spin.setValue(1)
+        self.years_spin.valueChanged.connect(self.request_refresh)
+        controls.addWidget(self.years_spin)
+        controls.addStretch(1)
+        self.hover_label = QLabel("")
+        controls.addWidget(self.hover_label)
+        layout.addLayout(controls)
+        self.add_canvas_slot(layout)
+        self.setLayout(layout)
+
+    def create_canvas(self):
+        """Crear canvas y la imagen (una sola vez)"""
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        from matplotlib.colors import TwoSlopeNorm
+        from matplotlib import colormaps
+
+        self.figure = Figure(figsize=(12, 3), dpi=100, facecolor='white', constrained_layout=True)
+        canvas = FigureCanvas(self.figure)
+        canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+        self.ax = self.figure.add_subplot(111)
+        self.norm = TwoSlopeNorm(vcenter=0.0, vmin=-1.0, vmax=1.0)
+        # Días sin datos (NaN): transparentes, se ve el fondo del eje
+        cmap = colormaps[self.CMAP].with_extremes(bad=(0, 0, 0, 0))
+        # Una columna vacía como marcador: la matriz real llega en refresh()
+        placeholder = np.full((len(HISTORY_DAYS), 1), np.nan)
+        self.image = self.ax.imshow(placeholder, aspect='auto', interpolation='nearest',
+                                    cmap=cmap, norm=self.norm, origin='upper')
+        self.ax.set_yticks(range(len(HISTORY_DAYS)))
+        for side in ('top', 'right', 'left', 'bottom'):
+            self.ax.spines[side].set_visible(False)
+        canvas.mpl_connect('motion_notify_event', self._on_hover)
+        return canvas
+
+    def canvas_ready(self):
+        self._apply_style()
+        if self._refresh_pending:
+            self._refresh_timer.start()
+
+    def set_data_model(self, data_model):
+        """Asociar el modelo de datos (fuente de la base de datos)"""
+        self.data_model = data_model
+
+    def request_refresh(self, *args):
+        """Recargar en el próximo ciclo de eventos (solo si está visible)"""
+        self._refresh_pending = True
+        if self.isVisible():
+            self._refresh_timer.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._refresh_pending:
+            self._refresh_timer.start()
+        elif self._stale and self.canvas is not None:
+            self._stale = False
+            self.canvas.draw_idle()
+
+    def refresh(self):
+        """Rellenar la matriz con una consulta de rango y dibujarla con un único artista"""
+        if self.data_model is None or self.canvas is None:
+            return
+        self._refresh_pending = False
+        try:
+            # Incluir siempre la semana del modelo (tras el cierre del sábado ya es la próxima)
+            self.first_monday, n_weeks = year_range(self.years_spin.value(),
+                                                    through=self.data_model.week_start_date)
+            history = TradingHistory.from_db(self.data_model.db_manager, start_date=self.first_monday.isoformat())
+            self.grid = calendar_grid(history, self.first_monday, n_weeks)
+            # Mantener el estado actual aunque aún no se haya guardado
+            self.update_from_model(self.data_model, draw=False, reload_if_missing=False)
+
+            self._update_norm()
+            self.image.set_data(self.grid)
+            self.image.set_extent((-0.5, n_weeks - 0.5, len(HISTORY_DAYS) - 0.5, -0.5))
+            self._set_month_ticks(n_weeks)
+            self.canvas.draw_idle()
+        except Exception as e:
+            print(f"Error al cargar el mapa de calor: {e}")
+
+    def _update_norm(self):
+        """Escala simétrica alrededor de 0 (percentil 98 para que un día extremo no apague el resto)"""
+        values = np.abs(self.grid[~np.isnan(self.grid)])
+        limit = float(np.percentile(values, 98)) if values.size else 1.0
+        limit = max(limit, 1.0)
+        self.norm.vmin, self.norm.vmax = -limit, limit
+
+    def _set_month_ticks(self, n_weeks: int):
+        """Marcas en el primer lunes de cada mes (o de cada año si el rango es largo)"""
+        mondays = np.datetime64(self.first_monday, 'D') + 7 * np.arange(n_weeks)
+        months = mondays.astype('datetime64[M]')
+        period = months if self.years_spin.value() <= 2 else mondays.astype('datetime64[Y]')
+        starts = np.flatnonzero(np.concatenate(([True], period[1:] != period[:-1])))
+        labels = [str(months[i])[:7] if self.years_spin.value() <= 2 else str(months[i])[:4] for i in starts]
+        self.ax.set_xticks(starts)
+        self.ax.set_xticklabels(labels, fontsize=8)
+
+    def _cell_of(self, week_start) -> Optional[int]:
+        """Columna de una semana en la matriz (aritmética de fechas, sin búsquedas)"""
+        if self.first_monday is None:
+            return None
+        column = (week_start - self.first_monday).days // 7
+        return column if 0 <= column < self.grid.shape[1] else None
+
+    def update_day(self, week_start, day_index: int, amount: float, draw: bool = True):
+        """Actualizar una sola celda en el sitio"""
+        column = self._cell_of(week_start)
+        if column is None:
+            return
+        self.grid[day_index, column] = amount
+        if draw:
+            self._redraw_image()
+
+    def update_from_model(self, data_model, draw: bool = True, reload_if_missing: bool = True):
+        """Volcar la semana actual del modelo: solo se tocan las celdas que cambiaron"""
+        column = self._cell_of(data_model.week_start_date)
+        if column is None:
+            # Semana posterior al rango cargado (nueva semana): recargar cuando toque
+            if reload_if_missing and self.first_monday is not None and data_model.week_start_date > self.first_monday:
+                self.request_refresh()
+            return
+        amounts = np.array(week_amounts_from_model(data_model))
+        changed = np.flatnonzero(self.grid[:, column] != amounts)
+        for day_index in changed:
+            self.update_day(data_model.week_start_date, int(day_index), float(amounts[day_index]), draw=False)
+        if draw and changed.size:
+            self._redraw_image()
+
+    def _redraw_image(self):
+        """Pasar la matriz a la imagen y repintar (o dejarlo para cuando vuelva a ser visible)"""
+        if self.canvas is None:
+            return
+        self.image.set_data(self.grid)
+        if self.isVisible():
+            self.canvas.draw_idle()
+        else:
+            self._stale = True
+
+    def _on_hover(self, event):
+        """Celda bajo el cursor por redondeo de coordenadas (sin recorrer artistas)"""
+        if event.inaxes is not self.ax or self.first_monday is None or event.xdata is None:
+            self.hover_label.setText("")
+            return
+        column, row = int(round(event.xdata)), int(round(event.ydata))
+        if not (0 <= row < self.grid.shape[0] and 0 <= column < self.grid.shape[1]):
+            self.hover_label.setText("")
+            return
+        day = self.first_monday + timedelta(days=7 * column + row)
+        value = self.grid[row, column]
+        amount = tr('heatmap_no_data') if np.isnan(value) else f"${value:.2f}"
+        self.hover_label.setText(f"{tr(DAY_KEYS[row])} {day.isoformat()}: {amount}")
+
+    def _apply_style(self):
+        """Colores y textos según tema e idioma sobre los artistas existentes"""
+        text_color = '#e0e0e0' if self.is_dark else '#2c3e50'
+        self.figure.patch.set_facecolor('#121212' if self.is_dark else 'white')
+        self.ax.set_facecolor('#2a2a2a' if self.is_dark else '#ecf0f1')
+        self.ax.set_title(tr('heatmap_title'), fontsize=12, fontweight='bold', color=text_color)
+        self.ax.set_yticklabels([tr(key)[:3] for key in DAY_KEYS], fontsize=8)
+        self.ax.tick_params(colors=text_color, length=0)
+
+    def set_theme(self, is_dark: bool):
+        """Cambiar tema del gráfico"""
+        self.is_dark = is_dark
+        if self.canvas is not None:
+            self._apply_style()
+            self.canvas.draw_idle()
+
+    def apply_language(self):
+        """Actualizar textos según el idioma actual"""
+        self.years_label.setText(tr('heatmap_years_label'))
+        self.apply_placeholder_language()
+        if self.canvas is not None:
+            self._apply_style()
+            self.canvas.draw_idle()
@@ -0,0 +1,248 @@
+"""
+Backends de gráficos de series temporales
+Misma API de datos (fechas datetime64[D] + valores) para dos implementaciones:
+matplotlib (nivel de detalle + LTTB al ancho en píxeles) y pyqtgraph (opcional;
+submuestreo y recorte a la vista nativos, interactivo con 100k+ puntos).
+create_series_backend elige según el tamaño de los datos (o la preferencia del
+usuario).
+"""
+
+import importlib.util
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QWidget, QVBoxLayout
+
+from src.utils.downsampling import LOD_LEVELS, aggregate_last, choose_level, lttb
+
+# pyqtgraph es opcional: se comprueba sin importarlo (se importa al crear el backend)
+HAS_PYQTGRAPH = importlib.util.find_spec('pyqtgraph') is not None
+
+# A partir de cuántos puntos conviene pyqtgraph (si está instalado): el saldo
+# diario de unos ocho años (5 días por semana) ya lo supera
+PYQTGRAPH_MIN_POINTS = 2000
+
+# Opciones de backend para el selector de la interfaz (None = automático)
+BACKEND_CHOICES = (None, 'matplotlib', 'pyqtgraph')
+
+LINE_COLOR = '#3498db'
+
+# on_hover(fecha o None, valor o None); on_view(nivel de detalle, puntos dibujados)
+HoverCallback = Callable[[Optional[np.datetime64], Optional[float]], None]
+ViewCallback = Callable[[str, int], None]
+
+
+def _theme_colors(is_dark: bool) -> Dict[str, str]:
+    return {
+        'text': '#e0e0e0' if is_dark else '#2c3e50',
+        'background': '#121212' if is_dark else 'white',
+        'axes_background': '#1e1e1e' if is_dark else 'white',
+        'grid': '#3a3a3a' if is_dark else '#ecf0f1',
+    }
+
+
+class SeriesChartBackend(ABC):
+    """Interfaz común de los backends de series temporales"""
+
+    name = ''
+
+    def __init__(self, on_hover: Optional[HoverCallback] = None, on_view: Optional[ViewCallback] = None):
+        self.on_hover = on_hover or (lambda date, value: None)
+        self.on_view = on_view or (lambda level, points: None)
+        self.dates = np.empty(0, dtype='datetime64[D]')
+        self.values = np.empty(0)
+
+    @abstractmethod
+    def widget(self) -> QWidget:
+        """Widget de Qt que muestra el gráfico"""
+
+    @abstractmethod
+    def set_series(self, dates, values):
+        """Reemplazar la serie completa y mostrarla entera"""
+
+    @abstractmethod
+    def apply_style(self, title: str, x_label: str, y_label: str, is_dark: bool):
+        """Colores y textos según tema e idioma"""
+
+    def _nearest(self, x, xs) -> int:
+        """Índice del punto más cercano a x en xs ordenado (búsqueda binaria)"""
+        i = int(np.searchsorted(xs, x))
+        if i <= 0:
+            return 0
+        if i >= xs.size:
+            return xs.size - 1
+        return i if xs[i] - x < x - xs[i - 1] else i - 1
+
+
+class MatplotlibSeriesBackend(SeriesChartBackend):
+    """matplotlib: niveles día/semana/mes precalculados y LTTB del tramo visible"""
+
+    name = 'matplotlib'
+
+    def __init__(self, on_hover=None, on_view=None):
+        super().__init__(on_hover, on_view)
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+        from matplotlib.figure import Figure
+        import matplotlib.dates as mdates
+        self._mdates = mdates
+
+        self.levels: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self.current_level = 'day'
+        self._container = QWidget()
+        layout = QVBoxLayout(self._container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.figure = Figure(figsize=(12, 6), dpi=100, facecolor='white', constrained_layout=True)
+        self.canvas = FigureCanvas(self.figure)
+        self.toolbar = NavigationToolbar(self.canvas, self._container)
+        layout.addWidget(self.toolbar)
+        layout.addWidget(self.canvas)
+
+        self.ax = self.figure.add_subplot(111)
+        (self.line,) = self.ax.plot([], [], color=LINE_COLOR, linewidth=1.5)
+        locator = mdates.AutoDateLocator()
+        self.ax.xaxis.set_major_locator(locator)
+        self.ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+        for side in ('top', 'right'):
+            self.ax.spines[side].set_visible(False)
+
+        # Agrupar cambios de vista (zoom, pan) en un solo recálculo por ciclo de eventos
+        self._view_timer = QTimer(self._container)
+        self._view_timer.setSingleShot(True)
+        self._view_timer.timeout.connect(self._update_view)
+        self.ax.callbacks.connect('xlim_changed', lambda ax: self._view_timer.start())
+        self.canvas.mpl_connect('motion_notify_event', self._on_motion)
+
+    def widget(self) -> QWidget:
+        return self._container
+
+    def set_series(self, dates, values):
+        self.dates = np.asarray(dates, dtype='datetime64[D]')
+        self.values = np.asarray(values, dtype=float)
+        self.levels = {}
+        for level in LOD_LEVELS:
+            level_dates, level_values = aggregate_last(self.dates, self.values, level)
+            self.levels[level] = (self._mdates.date2num(level_dates), level_values)
+
+        x, y = self.levels['day']
+        if x.size:
+            pad_y = max(float(y.max() - y.min()) * 0.05, 1.0)
+            pad_x = max((x[-1] - x[0]) * 0.01, 1.0)
+            self.ax.set_ylim(float(y.min()) - pad_y, float(y.max()) + pad_y)
+            self.ax.set_xlim(x[0] - pad_x, x[-1] + pad_x)
+            self.toolbar.update()  # La vista completa pasa a ser el "inicio" del zoom
+        # set_xlim ya pidió recalcular la vista: hacerlo ahora una sola vez
+        self._view_timer.stop()
+        self._update_view()
+
+    def _update_view(self):
+        """Elegir nivel de detalle para el tramo visible y reducirlo al ancho en píxeles"""
+        if not self.levels or not self.levels['day'][0].size:
+            self.line.set_data([], [])
+            self.on_view(self.current_level, 0)
+            self.canvas.draw_idle()
+            return
+        x0, x1 = self.ax.get_xlim()
+        width_px = max(int(self.ax.bbox.width), 100)
+        self.current_level = choose_level(x1 - x0, width_px)
+        x, y = self.levels[self.current_level]
+        # Incluir un punto a cada lado para que la línea llegue a los bordes
+        start = max(int(np.searchsorted(x, x0)) - 1, 0)
+        end = min(int(np.searchsorted(x, x1)) + 1, x.size)
+        xs, ys = lttb(x[start:end], y[start:end], width_px)
+        self.line.set_data(xs, ys)
+        self.on_view(self.current_level, xs.size)
+        self.canvas.draw_idle()
+
+    def _on_motion(self, event):
+        if event.inaxes is not self.ax or event.xdata is None or not self.levels:
+            self.on_hover(None, None)
+            return
+        x, y = self.levels['day']
+        if not x.size:
+            return
+        i = self._nearest(event.xdata, x)
+        self.on_hover(self.dates[i], float(y[i]))
+
+    def apply_style(self, title: str, x_label: str, y_label: str, is_dark: bool):
+        colors = _theme_colors(is_dark)
+        self.figure.patch.set_facecolor(colors['background'])
+        self.ax.set_facecolor(colors['axes_background'])
+        self.ax.set_title(title, fontsize=14, fontweight='bold', color=colors['text'])
+        self.ax.set_xlabel(x_label, color=colors['text'])
+        self.ax.set_ylabel(y_label, color=colors['text'])
+        self.ax.tick_params(colors=colors['text'])
+        self.ax.grid(True, alpha=0.3, color=colors['grid'])
+        for side in ('left', 'bottom'):
+            self.ax.spines[side].set_color(colors['text'])
+        self.canvas.draw_idle()
+
+
+class PyqtgraphSeriesBackend(SeriesChartBackend):
+    """pyqtgraph: submuestreo por picos y recorte a la vista en cada repintado"""
+
+    name = 'pyqtgraph'
+
+    def __init__(self, on_hover=None, on_view=None):
+        super().__init__(on_hover, on_view)
+        import pyqtgraph as pg
+        self._pg = pg
+        self.x = np.empty(0)
+        self.plot = pg.PlotWidget(axisItems={'bottom': pg.DateAxisItem()})
+        self.curve = self.plot.plot([], [], pen=pg.mkPen(LINE_COLOR, width=1.5))
+        self.curve.setDownsampling(auto=True, method='peak')
+        self.curve.setClipToView(True)
+        self.plot.showGrid(x=True, y=True, alpha=0.3)
+        # Hover limitado a la frecuencia de refresco de la pantalla
+        self._hover_proxy = pg.SignalProxy(self.plot.scene().sigMouseMoved, rateLimit=60, slot=self._on_mouse_moved)
+
+    def widget(self) -> QWidget:
+        return self.plot
+
+    def set_series(self, dates, values):
+        self.dates = np.asarray(dates, dtype='datetime64[D]')
+        self.values = np.asarray(values, dtype=float)
+        # DateAxisItem trabaja con segundos desde la época Unix
+        self.x = self.dates.astype('datetime64[s]').astype(np.int64).astype(float)
+        self.curve.setData(self.x, self.values)
+        self.plot.enableAutoRange()
+        self.on_view('auto', int(self.x.size))
+
+    def _on_mouse_moved(self, event):
+        position = event[0]
+        if not self.x.size or not self.plot.sceneBoundingRect().contains(position):
+            self.on_hover(None, None)
+            return
+        x = self.plot.getViewBox().mapSceneToView(position).x()
+        i = self._nearest(x, self.x)
+        self.on_hover(self.dates[i], float(self.values[i]))
+
+    def apply_style(self, title: str, x_label: str, y_label: str, is_dark: bool):
+        colors = _theme_colors(is_dark)
+        self.plot.setBackground(colors['axes_background'])
+        self.plot.setTitle(title, color=colors['text'])
+        self.plot.setLabel('bottom', x_label, color=colors['text'])
+        self.plot.setLabel('left', y_label, color=colors['text'])
+        for axis in ('left', 'bottom'):
+            self.plot.getAxis(axis).setPen(colors['text'])
+            self.plot.getAxis(axis).setTextPen(colors['text'])
+
+
+def backend_name_for(n_points: int, prefer: Optional[str] = None) -> str:
+    """Backend a usar: el preferido si está disponible; si no, pyqtgraph solo para series grandes"""
+    if prefer == 'matplotlib' or not HAS_PYQTGRAPH:
+        return 'matplotlib'
+    if prefer == 'pyqtgraph' or n_points >= PYQTGRAPH_MIN_POINTS:
+        return 'pyqtgraph'
+    return 'matplotlib'
+
+
+def create_series_backend(name: str, on_hover: Optional[HoverCallback] = None,
+                          on_view: Optional[ViewCallback] = None) -> SeriesChartBackend:
+    """Instanciar un backend por nombre ('matplotlib' o 'pyqtgraph')"""
+    if name == 'pyqtgraph':
+        return PyqtgraphSeriesBackend(on_hover, on_view)
+    return MatplotlibSeriesBackend(on_hover, on_view)
+
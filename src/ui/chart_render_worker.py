@@ -0,0 +1,124 @@
+"""
+Renderizado de gráficos fuera del hilo de la UI
+Un hilo persistente construye la figura con el backend Agg, la rasteriza y
+entrega un QImage que envuelve directamente el búfer RGBA de Agg (sin copia).
+Como en AnalysisWorker, solo se conserva el último trabajo pendiente y los
+resultados obsoletos no se emiten. matplotlib se importa con el primer
+renderizado, ya en el hilo.
+"""
+
+import threading
+from typing import Callable, Optional, Tuple
+
+from PyQt5.QtCore import QThread, pyqtSignal, QTimer, QSize
+from PyQt5.QtGui import QImage, QPainter
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+
+
+def render_to_qimage(draw: Callable, width: int, height: int, dpi: float = 100.0) -> Tuple[QImage, object]:
+    """Dibujar con draw(figure) en una figura Agg de width×height píxeles y envolver el búfer en un QImage.
+    Devuelve (imagen, valor devuelto por draw).
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    figure = Figure(figsize=(max(width, 1) / dpi, max(height, 1) / dpi), dpi=dpi, constrained_layout=True)
+    canvas = FigureCanvasAgg(figure)
+    result = draw(figure)
+    canvas.draw()
+    buffer = canvas.buffer_rgba()
+    image = QImage(buffer, buffer.shape[1], buffer.shape[0], QImage.Format_RGBA8888)
+    # El QImage no es dueño de la memoria: mantener vivo el búfer de Agg junto a él
+    image._agg_buffer = buffer
+    image._agg_canvas = canvas
+    return image, result
+
+
+class ChartRenderWorker(QThread):
+    """Hilo persistente que renderiza siempre la última petición"""
+
+    rendered = pyqtSignal(int, object, object)  # (generación, QImage, valor devuelto por draw)
+    render_failed = pyqtSignal(int, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._condition = threading.Condition()
+        self._pending: Optional[tuple] = None
+        self._generation = 0
+        self._stopping = False
+
+    def submit(self, draw: Callable, width: int, height: int, dpi: float = 100.0) -> int:
+        """Encolar un renderizado (reemplaza el pendiente). draw(figure) se ejecuta en el hilo"""
+        with self._condition:
+            self._generation += 1
+            self._pending = (self._generation, draw, width, height, dpi)
+            self._condition.notify()
+            generation = self._generation
+        if not self.isRunning():
+            self.start()
+        return generation
+
+    def is_current(self, generation: int) -> bool:
+        return generation == self._generation
+
+    def stop(self):
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        self.wait(2000)
+
+    def run(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                generation, draw, width, height, dpi = self._pending
+                self._pending = None
+            try:
+                image, result = render_to_qimage(draw, width, height, dpi)
+                if self.is_current(generation):
+                    self.rendered.emit(generation, image, result)
+            except Exception as e:
+                self.render_failed.emit(generation, str(e))
+
+
+class ImageChartView(QWidget):
+    """Muestra el último QImage renderizado y pide uno nuevo al cambiar de tamaño"""
+
+    resized = pyqtSignal(QSize)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.image: Optional[QImage] = None
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumHeight(200)
+        # Agrupar los eventos de redimensionado en una sola petición
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(100)
+        self._resize_timer.timeout.connect(lambda: self.resized.emit(self.pixel_size()))
+
+    def pixel_size(self) -> QSize:
+        """Tamaño en píxeles físicos (respeta pantallas HiDPI)"""
+        ratio = self.devicePixelRatioF()
+        return QSize(int(self.width() * ratio), int(self.height() * ratio))
+
+    def set_image(self, image: QImage):
+        image.setDevicePixelRatio(self.devicePixelRatioF())
+        self.image = image
+        self.update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._resize_timer.start()
+
+    def paintEvent(self, event):
+        if self.image is None:
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        # Mientras llega el renderizado del nuevo tamaño, escalar la imagen anterior
+        painter.drawImage(self.rect(), self.image)
+        painter.end()
@@ -0,0 +1,182 @@
+"""
+Gráfico de drawdown (bajo el agua) del historial
+Usa las series que ya mantiene RiskMetricsEngine (índice de capital compuesto,
+máximo acumulado con np.maximum.accumulate y drawdown), que al editar una semana
+solo recalcula la cola. Aquí el área y la línea se crean una sola vez y solo se
+reescriben los vértices desde la primera semana que cambió. El canvas se crea
+tras el primer pintado (LazyChartWidget).
+"""
+
+from typing import Optional
+
+import numpy as np
+from PyQt5.QtWidgets import QVBoxLayout, QSizePolicy
+from PyQt5.QtCore import QTimer
+
+from src.models.risk_metrics import get_risk_engine
+from src.ui.lazy_chart import LazyChartWidget
+from src.utils.i18n import tr
+
+FILL_COLOR = '#e74c3c'
+
+
+class DrawdownChartWidget(LazyChartWidget):
+    """Caída desde el máximo (%) de cada semana del historial"""
+
+    def __init__(self):
+        super().__init__()
+        self.is_dark = False
+        self.data_model = None
+        self.metrics = {}
+        self._week_dates = []
+        self._x = np.empty(0)
+        self._y = np.empty(0)
+        self._verts = np.empty((0, 2))
+        self._refresh_pending = True
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self.refresh)
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Reservar el sitio del canvas (se crea tras el primer pintado)"""
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.placeholder.setMinimumHeight(120)
+        self.add_canvas_slot(layout)
+        self.setLayout(layout)
+
+    def create_canvas(self):
+        """Crear canvas y artistas (una sola vez)"""
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        import matplotlib.dates as mdates
+
+        self.figure = Figure(figsize=(12, 2.5), dpi=100, facecolor='white', constrained_layout=True)
+        canvas = FigureCanvas(self.figure)
+        canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        canvas.setMinimumHeight(120)
+
+        self.ax = self.figure.add_subplot(111)
+        self.area = self.ax.fill_between([], [], 0, color=FILL_COLOR, alpha=0.35, linewidth=0)
+        (self.line,) = self.ax.plot([], [], color=FILL_COLOR, linewidth=1.2)
+        (self.max_marker,) = self.ax.plot([], [], 'v', color=FILL_COLOR, markersize=6)
+        self.zero_line = self.ax.axhline(0, linewidth=0.8, alpha=0.6)
+        locator = mdates.AutoDateLocator()
+        self.ax.xaxis.set_major_locator(locator)
+        self.ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+        self.ax.yaxis.set_major_formatter(lambda value, pos: f"{value:.0f}%")
+        for side in ('top', 'right'):
+            self.ax.spines[side].set_visible(False)
+        return canvas
+
+    def canvas_ready(self):
+        self._apply_style()
+        if self._refresh_pending:
+            self._refresh_timer.start()
+
+    def set_data_model(self, data_model):
+        """Asociar el modelo de datos (fuente de la base de datos)"""
+        self.data_model = data_model
+
+    def request_refresh(self):
+        """Actualizar en el próximo ciclo de eventos (solo si está visible)"""
+        self._refresh_pending = True
+        if self.isVisible():
+            self._refresh_timer.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._refresh_pending:
+            self._refresh_timer.start()
+
+    def refresh(self):
+        """Tomar las series del motor de riesgo y reescribir solo la cola que cambió"""
+        if self.data_model is None or self.canvas is None:
+            return
+        self._refresh_pending = False
+        try:
+            engine = get_risk_engine(self.data_model.db_manager)
+            week_dates = engine.history.week_dates
+            y = -100.0 * engine.drawdown
+            start = self._first_change(week_dates, y)
+            if start is None:
+                return
+            if len(week_dates) != len(self._week_dates) or start == 0:
+                import matplotlib.dates as mdates
+                self._x = mdates.date2num(np.array(week_dates, dtype='datetime64[D]'))
+                self._verts = np.empty((2 * len(week_dates), 2))
+                # Borde inferior del área (y = 0) recorrido al revés para cerrar el polígono
+                self._verts[len(week_dates):, 0] = self._x[::-1]
+                self._verts[len(week_dates):, 1] = 0.0
+                start = 0
+            self._week_dates = list(week_dates)
+            self._y = y.copy()
+            self._update_artists(start, engine)
+        except Exception as e:
+            print(f"Error al actualizar el drawdown: {e}")
+
+    def _first_change(self, week_dates, y) -> Optional[int]:
+        """Primera semana cuyo drawdown cambió (None si nada cambió)"""
+        n = min(len(week_dates), len(self._week_dates))
+        if week_dates[:n] != self._week_dates[:n]:
+            return 0
+        changed = np.flatnonzero(y[:n] != self._y[:n])
+        if changed.size:
+            return int(changed[0])
+        return n if len(week_dates) != len(self._week_dates) else None
+
+    def _update_artists(self, start: int, engine):
+        """Vértices del área y la línea desde start; límites y textos con las métricas"""
+        n = self._y.size
+        self._verts[start:n, 0] = self._x[start:]
+        self._verts[start:n, 1] = self._y[start:]
+        self.area.set_verts([self._verts] if n else [])
+        self.line.set_data(self._x, self._y)
+
+        self.metrics = engine.metrics()
+        if n:
+            worst = int(np.argmin(self._y))
+            self.max_marker.set_data([self._x[worst]], [self._y[worst]])
+            pad_x = max((self._x[-1] - self._x[0]) * 0.01, 1.0)
+            self.ax.set_xlim(self._x[0] - pad_x, self._x[-1] + pad_x)
+            self.ax.set_ylim(min(float(self._y.min()) * 1.15, -1.0), 0.5)
+        else:
+            self.max_marker.set_data([], [])
+        self._set_title()
+        self.canvas.draw_idle()
+
+    def _set_title(self):
+        """Drawdown actual, máximo y duración máxima bajo el agua"""
+        self.ax.set_title(tr('drawdown_title').format(
+            current=self.metrics.get('current_drawdown', 0.0) * 100,
+            worst=self.metrics.get('max_drawdown', 0.0) * 100,
+            weeks=self.metrics.get('max_drawdown_duration', 0)),
+            fontsize=11, fontweight='bold', color='#e0e0e0' if self.is_dark else '#2c3e50')
+
+    def _apply_style(self):
+        """Colores según tema sobre los artistas existentes"""
+        text_color = '#e0e0e0' if self.is_dark else '#2c3e50'
+        self.figure.patch.set_facecolor('#121212' if self.is_dark else 'white')
+        self.ax.set_facecolor('#1e1e1e' if self.is_dark else 'white')
+        self._set_title()
+        self.ax.set_ylabel(tr('drawdown_axis'), color=text_color)
+        self.ax.tick_params(colors=text_color, labelsize=8)
+        self.ax.grid(True, alpha=0.3, color='#3a3a3a' if self.is_dark else '#ecf0f1')
+        self.zero_line.set_color(text_color)
+        for side in ('left', 'bottom'):
+            self.ax.spines[side].set_color(text_color)
+
+    def set_theme(self, is_dark: bool):
+        """Cambiar tema del gráfico"""
+        self.is_dark = is_dark
+        if self.canvas is not None:
+            self._apply_style()
+            self.canvas.draw_idle()
+
+    def apply_language(self):
+        """Actualizar textos según el idioma actual"""
+        self.apply_placeholder_language()
+        if self.canvas is not None:
+            self._apply_style()
+            self.canvas.draw_idle()
@@ -1,282 +1,248 @@
 """
 Widget de gráfico mejorado con mejor visualización
+Los repintados se piden con request_redraw(): todas las peticiones de un mismo
+ciclo del bucle de eventos (o de la ventana de debounce) se agrupan en un solo
+renderizado, y no se renderiza mientras el widget esté oculto o minimizado.
+Cada imagen renderizada se guarda en una caché LRU por estado (datos, tema,
+idioma, leyenda, tamaño): volver a un estado ya visto solo restaura píxeles.
+El hover (cruz y tooltip) se pinta con blit sobre la imagen ya dibujada, como
+mucho una vez por refresco de pantalla. matplotlib se importa al crear el
+canvas, tras el primer pintado del widget (ver LazyChartWidget).
 """
 
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QSizePolicy
-from PyQt5.QtCore import QTimer
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from datetime import datetime
-import numpy as np
+from PyQt5.QtWidgets import QVBoxLayout, QSizePolicy
+from PyQt5.QtCore import QTimer, QEvent
+from PyQt5.QtGui import QGuiApplication
+from src.utils import i18n
 from src.utils.i18n import tr
+from src.ui.lazy_chart import LazyChartWidget
+from src.ui.render_cache import RenderCache
 
-class EnhancedChartWidget(QWidget):
+class EnhancedChartWidget(LazyChartWidget):
     """Widget de gráfico mejorado con mejor visualización"""
     
-    def __init__(self):
+    def __init__(self, debounce_ms: int = 0):
         super().__init__()
         self.is_dark = False
         self.legend_visible = True
         # Posición por defecto dentro del gráfico para evitar encoger el área
         self.legend_position = 'upper_right'  # opciones: outside_right, upper_right, upper_center
+        self.last_data_model = None
+        self.figure = None
+        self.chart = None
+        # Repintado diferido: 0 ms = agrupar todo lo pedido en el mismo ciclo de eventos
+        self._redraw_pending = False
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(max(0, debounce_ms))
+        self._redraw_timer.timeout.connect(self._flush_redraw)
+        self._watched_window = None
+        self.render_count = 0  # Renderizados realizados (diagnóstico)
+        self.render_cache = RenderCache()
+        # Hover: solo se atiende la última posición del ratón en cada refresco de pantalla
+        self._hover_pos = None
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(self._frame_interval_ms())
+        self._hover_timer.timeout.connect(self._flush_hover)
         self.setup_ui()
         
     def setup_ui(self):
-        """Configurar la interfaz del gráfico"""
+        """Configurar la interfaz del gráfico (el canvas se crea tras el primer pintado)"""
         layout = QVBoxLayout()
-
-        # Crear figura y canvas (usar constrained_layout para mejorar ajuste inicial)
-        self.figure = Figure(figsize=(12, 6), dpi=100, facecolor='white', edgecolor='none', constrained_layout=True)
-        self.canvas = FigureCanvas(self.figure)
-        # Asegurar que el canvas se expanda con el contenedor
-        self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.canvas.updateGeometry()
-        layout.addWidget(self.canvas)
-
+        self.add_canvas_slot(layout)
         self.setLayout(layout)
 
+    def create_canvas(self):
+        """Crear figura, canvas y artistas (el layout se recalcula solo cuando cambia, no en cada edición)"""
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        from src.ui.weekly_bar_chart import WeeklyBarChart
+
         # Configurar estilo inicial
         self.setup_chart_style()
+        self.figure = Figure(figsize=(12, 6), dpi=100, facecolor='white', edgecolor='none')
+        canvas = FigureCanvas(self.figure)
+        # Asegurar que el canvas se expanda con el contenedor
+        canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        canvas.updateGeometry()
+
+        # Artistas reutilizados entre actualizaciones
+        self.chart = WeeklyBarChart(self.figure, self.colors, blit=True)
+        canvas.mpl_connect('resize_event', self._on_canvas_resize)
+        canvas.mpl_connect('draw_event', self._on_canvas_draw)
+        canvas.mpl_connect('motion_notify_event', self._on_motion)
+        canvas.mpl_connect('axes_leave_event', self._on_hover_leave)
+        canvas.mpl_connect('figure_leave_event', self._on_hover_leave)
+        return canvas
+
+    def canvas_ready(self):
+        """Aplicar el tema elegido antes de crear el canvas y dibujar lo pedido"""
+        self.set_theme(self.is_dark)
+        self.chart.mark_layout_dirty()
+        if self._redraw_pending:
+            self._redraw_timer.start()
 
     def showEvent(self, event):
         """Tras mostrar el widget, rehacer el layout del gráfico para capturar el tamaño real."""
         super().showEvent(event)
-        QTimer.singleShot(0, self._post_show_adjust)
+        self._watch_window()
+        self._hover_timer.setInterval(self._frame_interval_ms())
+        if self.chart is not None:
+            self.chart.mark_layout_dirty()
+        self.request_redraw()
+
+    def _watch_window(self):
+        """Vigilar la ventana principal para repintar lo pendiente al dejar de estar minimizada"""
+        window = self.window()
+        if window is not self and window is not self._watched_window:
+            if self._watched_window is not None:
+                self._watched_window.removeEventFilter(self)
+            window.installEventFilter(self)
+            self._watched_window = window
+
+    def eventFilter(self, obj, event):
+        if obj is self._watched_window and event.type() == QEvent.WindowStateChange:
+            if self._redraw_pending and not obj.isMinimized():
+                self._redraw_timer.start()
+        return super().eventFilter(obj, event)
+
+    def _can_render(self) -> bool:
+        return self.chart is not None and self.isVisible() and not self.window().isMinimized()
+
+    def request_redraw(self, data_model=None):
+        """Pedir un repintado; las peticiones seguidas se agrupan en un único renderizado"""
+        if data_model is not None:
+            self.last_data_model = data_model
+        self._redraw_pending = True
+        if self._can_render():
+            self._redraw_timer.start()
+
+    def _flush_redraw(self):
+        """Renderizar una sola vez lo pedido (o esperar a que el widget vuelva a ser visible)"""
+        if not self._redraw_pending or not self._can_render():
+            return
+        self._redraw_pending = False
+        self._post_show_adjust()
+
+    def _on_canvas_resize(self, event):
+        """El tamaño real cambió: rehacer márgenes antes del próximo dibujado"""
+        self.chart.relayout()
+
+    def _on_canvas_draw(self, event):
+        """Dibujado completo terminado: guardar el fondo para los próximos blits y la imagen en caché"""
+        self.chart.capture_background(self.canvas)
+        if self.chart.ax is not None:
+            self._store_render()
+            if self._hover_pos is not None:
+                # El dibujado completo borró la capa de hover: volver a ponerla
+                self._hover_timer.start()
+
+    def _frame_interval_ms(self) -> int:
+        """Milisegundos por fotograma de la pantalla actual (60 Hz si no se conoce)"""
+        handle = self.window().windowHandle() if self.isVisible() else None
+        screen = handle.screen() if handle is not None else QGuiApplication.primaryScreen()
+        rate = screen.refreshRate() if screen is not None else 0
+        return max(1, int(1000 / (rate if rate > 0 else 60)))
+
+    def _on_motion(self, event):
+        """Guardar la última posición; el repintado del hover se limita a uno por fotograma"""
+        if self.chart.ax is None or event.inaxes is not self.chart.ax or event.xdata is None:
+            self._on_hover_leave(event)
+            return
+        self._hover_pos = (event.xdata, event.ydata)
+        if not self._hover_timer.isActive():
+            self._hover_timer.start()
+
+    def _flush_hover(self):
+        if self._hover_pos is None or self._redraw_pending:
+            return
+        self.chart.show_hover(self.canvas, *self._hover_pos, self._hover_text)
+
+    def _hover_text(self, row) -> str:
+        day, amount, destination, running = row
+        return tr('weekly_hover_tooltip').format(day=day, amount=amount, destination=destination or '-',
+                                                 running=running)
+
+    def _on_hover_leave(self, event):
+        if self._hover_pos is None:
+            return
+        self._hover_pos = None
+        self._hover_timer.stop()
+        self.chart.hide_hover(self.canvas)
+
+    def _render_key(self):
+        """Todo lo que determina los píxeles del gráfico"""
+        width, height = self.figure.bbox.size
+        return (self.chart.data_key, self.is_dark, i18n.current_language, self.legend_visible,
+                self.legend_position, int(width), int(height))
+
+    def _store_render(self):
+        """Guardar la imagen mostrada (y su fondo) bajo el estado actual"""
+        self.render_cache.put(self._render_key(), self.canvas.copy_from_bbox(self.figure.bbox),
+                              self.chart.background)
+        self.canvas.setStatusTip(self.render_cache.describe())
 
     def _post_show_adjust(self):
         try:
-            if hasattr(self, 'last_data_model') and self.last_data_model:
+            if self.last_data_model:
                 # Redibujar con datos ya cargados para ajustar al tamaño real
                 self.update_chart(self.last_data_model)
             else:
                 # Ajuste mínimo si no hay datos aún
                 self.figure.tight_layout()
-                self.canvas.draw()
+                self.canvas.draw_idle()
         except Exception:
             pass
     
     def setup_chart_style(self):
         """Configurar el estilo del gráfico"""
-        # Estilo profesional
-        try:
-            plt.style.use('seaborn-v0_8-whitegrid')
-        except Exception:
-            plt.style.use('seaborn')
+        from src.ui.weekly_bar_chart import apply_chart_style, chart_colors
+        # Estilo profesional y fuentes (compartido con la exportación por lotes)
+        apply_chart_style()
 
         # Paleta de colores elegante
-        self.colors = {
-            'positive': '#2ecc71',      # Verde suave
-            'negative': '#e74c3c',      # Rojo elegante
-            # 'withdrawal': '#8e44ad',
-            'withdrawal': '#2ecc71',    # Púrpura para retiro personal
-            'reinvestment': '#f1c40f',  # Dorado para reinversión
-            'neutral': '#bdc3c7',       # Gris
-            'text': '#2c3e50',          # Texto oscuro
-            'grid': '#ecf0f1',          # Grilla clara
-            'avg_line': '#3498db'       # Línea de promedio
-        }
-
-        # Configurar fuentes
-        plt.rcParams['font.family'] = 'sans-serif'
-        plt.rcParams['font.sans-serif'] = ['Segoe UI', 'Arial', 'DejaVu Sans']
-        plt.rcParams['font.size'] = 10
+        self.colors = chart_colors(self.is_dark)
     
     def update_chart(self, data_model):
-        """Actualizar el gráfico con datos del modelo"""
+        """Actualizar el gráfico con datos del modelo de inmediato (preferir request_redraw)"""
         # Guardar referencia para poder regenerar con nuevo idioma
         self.last_data_model = data_model
+        if self.chart is None:
+            # Sin canvas todavía: se dibuja al crearlo
+            self._redraw_pending = True
+            return
+        self.render_count += 1
         try:
-            self.figure.clear()
-            
-            # Crear subplot principal
-            ax = self.figure.add_subplot(111)
-            
-            # Obtener datos, usando días dinámicos del modelo
-            base_daily_data = []
-            model_days = getattr(data_model, 'days', [])
-            # Mapeo de claves de días para etiquetas traducidas
-            day_keys = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-
-            for i, day_key in enumerate(model_days):
-                amount = data_model.daily_amounts.get(day_key, 0)
-                destination = data_model.daily_destinations.get(day_key, '')
-                # Etiqueta visible: abreviatura del nombre traducido (si disponible)
-                # Si el modelo usa claves como 'monday', 'tuesday', etc., usar directamente la traducción
-                label_name = tr(day_key)[:3] if day_key in day_keys else (tr(day_keys[i])[:3] if i < len(day_keys) else day_key[:3])
-                base_daily_data.append({
-                    'day': label_name,
-                    'amount': amount,
-                    'destination': destination,
-                    'is_positive': amount > 0,
-                    'is_withdrawal': destination in (tr('personal_withdrawal'), 'Retiro Personal', 'Personal Withdrawal'),
-                    'is_reinvestment': destination in (tr('reinvestment'), 'Reinversión', 'Reinvestment')
-                })
+            from src.ui.weekly_bar_chart import weekly_chart_data_from_model
+            self.chart.is_dark = self.is_dark
+            self.chart.legend_visible = self.legend_visible
+            self.chart.legend_position = self.legend_position
+            daily_data, base_amounts = weekly_chart_data_from_model(data_model)
+            frame_changed = self.chart.update(daily_data, base_amounts)
 
-            # Extender visualmente el gráfico como si tuviera sábado y domingo
-            daily_data = list(base_daily_data)
-            # Agregar placeholders solo si no existen ya en el modelo
-            if 'saturday' not in model_days:
-                daily_data.append({
-                    'day': tr('saturday')[:3],
-                    'amount': 0,
-                    'destination': '',
-                    'is_positive': False,
-                    'is_withdrawal': False,
-                    'is_reinvestment': False
-                })
-            if 'sunday' not in model_days:
-                daily_data.append({
-                    'day': tr('sunday')[:3],
-                    'amount': 0,
-                    'destination': '',
-                    'is_positive': False,
-                    'is_withdrawal': False,
-                    'is_reinvestment': False
-                })
-            
-            # Preparar datos para el gráfico
-            x_positions = np.arange(len(daily_data))
-            # Guardar montos base (sin placeholders) para cálculos como promedio
-            base_amounts = [d['amount'] for d in base_daily_data]
-            amounts = [d['amount'] for d in daily_data]
-            
-            # Determinar colores de las barras
-            colors = []
-            for data in daily_data:
-                if data['amount'] < 0:
-                    colors.append(self.colors['negative'])
-                elif data['amount'] == 0:
-                    colors.append(self.colors['neutral'])
-                else:  # Positivo
-                    if data.get('is_withdrawal'):
-                        colors.append(self.colors['withdrawal'])
-                    elif data.get('is_reinvestment'):
-                        colors.append(self.colors['reinvestment'])
-                    else:
-                        colors.append(self.colors['positive'])
-            
-            # Crear barras con mejor proporción
-            bar_width = 0.6
-            bars = ax.bar(x_positions, amounts, bar_width, color=colors, 
-                         alpha=0.8, edgecolor='white', linewidth=1.5)
-            
-            # Configurar el gráfico
-            ax.set_xlabel(tr('days_of_week_label'), fontsize=12, fontweight='bold', color=self.colors['text'])
-            ax.set_ylabel(tr('amount_axis_label'), fontsize=12, fontweight='bold', color=self.colors['text'])
-            # Título sin emoji para evitar advertencias de fuente
-            weekly_total = sum(amounts)
-            ax.set_title(tr('weekly_performance_title'), fontsize=16, fontweight='bold', 
-                        color=self.colors['text'], pad=16)
-            
-            # Configurar ejes
-            ax.set_xticks(x_positions)
-            ax.set_xticklabels([d['day'] for d in daily_data], fontsize=10, color=self.colors['text'])
-            
-            # Configurar grid
-            ax.grid(True, axis='y', alpha=0.35, color=self.colors['grid'], linestyle='-', linewidth=0.8)
-            ax.set_axisbelow(True)
-            
-            # Configurar línea base en cero
-            ax.axhline(y=0, color=self.colors['text'], linewidth=1, alpha=0.5)
-            
-            # Añadir etiquetas de valores con mejor posicionamiento
-            for i, (bar, data) in enumerate(zip(bars, daily_data)):
-                height = bar.get_height()
-                
-                if height != 0:  # Solo mostrar etiquetas para barras con valor
-                    # Determinar posición de la etiqueta
-                    if height > 0:
-                        y_pos = height + (max(amounts + [1]) * 0.02)  # margen por encima
-                        va = 'bottom'
-                    else:
-                        y_pos = height - (max(abs(np.array(amounts)) + 1) * 0.02)  # margen por debajo
-                        va = 'top'
-                    
-                    # Formatear el valor
-                    value_text = f'${height:.0f}'
-                    
-                    # Añadir etiqueta
-                    bbox_face = '#1e1e1e' if self.is_dark else 'white'
-                    bbox_edge = '#2a2a2a' if self.is_dark else 'none'
-                    ax.text(bar.get_x() + bar.get_width()/2., y_pos, value_text,
-                           ha='center', va=va, fontsize=9, fontweight='bold',
-                           color=self.colors['text'], 
-                           bbox=dict(boxstyle='round,pad=0.3', facecolor=bbox_face, 
-                                   alpha=0.85, edgecolor=bbox_edge))
-
-            # Añadir línea de promedio semanal
-            if base_amounts:
-                avg = np.mean(base_amounts)
-                ax.axhline(avg, color=self.colors['avg_line'], linestyle='--', linewidth=1.5, alpha=0.8)
-                ax.text(0.99, 0.02, f"{tr('average_label')} ${avg:.2f}", transform=ax.transAxes,
-                        ha='right', va='bottom', fontsize=9, color=self.colors['avg_line'],
-                        bbox=dict(boxstyle='round,pad=0.25', facecolor='white', alpha=0.7, edgecolor='none'))
-            
-            # Ajustar límites del eje Y para dar espacio a las etiquetas
-            y_min, y_max = ax.get_ylim()
-            y_range = y_max - y_min
-            
-            if y_min < 0:
-                ax.set_ylim(y_min - y_range * 0.1, y_max + y_range * 0.15)
+            # Estado ya visto: restaurar la imagen; si el marco no cambió, repintar solo las barras;
+            # si no, dibujado completo diferido (que se guarda en la caché al terminar)
+            cached = self.render_cache.get(self._render_key())
+            if cached is not None:
+                self.chart.restore_render(self.canvas, *cached)
+                self._flush_hover()
+            elif not frame_changed and self.chart.blit_update(self.canvas):
+                self._store_render()
+                self._flush_hover()
             else:
-                ax.set_ylim(y_min, y_max + y_range * 0.15)
-            
-            # Añadir leyenda mejorada (opcional y sin solapar barras)
-            if self.legend_visible:
-                legend_elements = [
-                    patches.Patch(color=self.colors['reinvestment'], label=tr('legend_gain_reinvestment')),
-                    patches.Patch(color=self.colors['withdrawal'], label=tr('legend_gain_withdrawal')),
-                    patches.Patch(color=self.colors['negative'], label=tr('legend_loss')),
-                    patches.Patch(color=self.colors['neutral'], label=tr('legend_neutral'))
-                ]
-
-                if self.legend_position == 'outside_right':
-                    # Colocar la leyenda fuera del área del gráfico, a la derecha
-                    ax.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(1.02, 1),
-                              frameon=True, fancybox=True, shadow=True, fontsize=9, borderaxespad=0.0)
-                    # Reducir el espacio del subplot para dejar sitio a la leyenda a la derecha
-                    try:
-                        self.figure.tight_layout(rect=[0, 0, 0.82, 1])
-                    except Exception:
-                        self.figure.tight_layout()
-                elif self.legend_position == 'upper_center':
-                    ax.legend(handles=legend_elements, loc='upper center', bbox_to_anchor=(0.5, 1.12),
-                              frameon=True, fancybox=True, shadow=True, fontsize=9, ncol=2)
-                else:  # 'upper_right' por defecto
-                    ax.legend(handles=legend_elements, loc='upper right',
-                              frameon=True, fancybox=True, shadow=True, fontsize=9)
+                self.canvas.draw_idle()
 
-            # Subtítulo con total semanal
-            ax.text(0.01, 1.00, f"{tr('total_week')} ${weekly_total:.2f}", transform=ax.transAxes,
-                    ha='left', va='bottom', fontsize=10, color=self.colors['text'])
-            
-            # Mejorar la apariencia general
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['left'].set_color(self.colors['text'])
-            ax.spines['bottom'].set_color(self.colors['text'])
-            
-            # Ajustar márgenes
-            try:
-                if self.legend_visible and self.legend_position == 'outside_right':
-                    self.figure.tight_layout(rect=[0, 0, 0.82, 1])
-                else:
-                    self.figure.tight_layout()
-            except Exception:
-                self.figure.tight_layout()
-            
-            # Actualizar canvas
-            self.canvas.draw()
-            
         except Exception as e:
             print(f"{tr('chart_error_update')}: {e}")
             self.show_error_message(str(e))
-    
+
     def show_error_message(self, error_msg):
         """Mostrar mensaje de error en el gráfico"""
+        if self.chart is None:
+            return
         self.figure.clear()
+        self.chart.reset()
         ax = self.figure.add_subplot(111)
         
         ax.text(0.5, 0.5, f"{tr('chart_error_load')}:\n{error_msg}", 
@@ -291,50 +257,36 @@ class EnhancedChartWidget(QWidget):
     
     def clear_chart(self):
         """Limpiar el gráfico"""
+        if self.chart is None:
+            return
         self.figure.clear()
-        self.canvas.draw()
+        self.chart.reset()
+        self.canvas.draw_idle()
     
     def apply_language(self):
         """Actualizar idioma del gráfico"""
+        self.apply_placeholder_language()
         # Si hay datos cargados, regenerar el gráfico con nuevas traducciones
-        if hasattr(self, 'last_data_model') and self.last_data_model:
-            self.update_chart(self.last_data_model)
+        if self.last_data_model:
+            self.request_redraw()
 
     def set_theme(self, is_dark: bool):
         """Cambiar tema del gráfico"""
         self.is_dark = is_dark
-        if is_dark:
-            self.figure.patch.set_facecolor('#121212')
-            plt.rcParams['text.color'] = '#e0e0e0'
-            plt.rcParams['axes.facecolor'] = '#1e1e1e'
-            plt.rcParams['axes.edgecolor'] = '#e0e0e0'
-            plt.rcParams['axes.labelcolor'] = '#e0e0e0'
-            plt.rcParams['xtick.color'] = '#e0e0e0'
-            plt.rcParams['ytick.color'] = '#e0e0e0'
-            plt.rcParams['grid.color'] = '#3a3a3a'
-        else:
-            self.figure.patch.set_facecolor('white')
-            plt.rcParams['text.color'] = '#2c3e50'
-            plt.rcParams['axes.facecolor'] = 'white'
-            plt.rcParams['axes.edgecolor'] = '#2c3e50'
-            plt.rcParams['axes.labelcolor'] = '#2c3e50'
-            plt.rcParams['xtick.color'] = '#2c3e50'
-            plt.rcParams['ytick.color'] = '#2c3e50'
-            plt.rcParams['grid.color'] = '#ecf0f1'
-        
-        # Actualizar colores según tema
-        if is_dark:
-            self.colors['text'] = '#e0e0e0'
-            self.colors['grid'] = '#3a3a3a'
-        else:
-            self.colors['text'] = '#2c3e50'
-            self.colors['grid'] = '#ecf0f1'
+        if self.chart is None:
+            return  # Se aplica al crear el canvas
+        from src.ui.weekly_bar_chart import THEME_COLORS, apply_theme_rcparams
+        self.figure.patch.set_facecolor(THEME_COLORS[bool(is_dark)]['background'])
+        apply_theme_rcparams(is_dark)
+
+        # Actualizar colores según tema (los artistas existentes los toman en la próxima actualización)
+        self.colors.update(THEME_COLORS[bool(is_dark)])
 
     def set_legend_visible(self, visible: bool):
         """Mostrar u ocultar la leyenda y redibujar."""
         self.legend_visible = bool(visible)
-        if hasattr(self, 'last_data_model') and self.last_data_model:
-            self.update_chart(self.last_data_model)
+        if self.last_data_model:
+            self.request_redraw()
 
     def set_legend_position(self, position: str):
         """Cambiar la posición de la leyenda y redibujar.
@@ -342,5 +294,5 @@ class EnhancedChartWidget(QWidget):
         """
         if position in ('outside_right', 'upper_right', 'upper_center'):
             self.legend_position = position
-            if hasattr(self, 'last_data_model') and self.last_data_model:
-                self.update_chart(self.last_data_model)
\ No newline at end of file
+            if self.last_data_model:
+                self.request_redraw()
\ No newline at end of file
@@ -15,10 +15,12 @@ from PyQt5.QtGui import QIcon, QPixmap, QFont
 import os
 import pandas as pd
 from typing import Dict, Any, Optional
+from src.utils import i18n
 from src.utils.i18n import tr
 
 # Importar nuestro gestor de exportación
 from ..utils.export_manager import ExportManager
+from ..utils.chart_export import export_week_charts
 
 
 class ExportWorker(QThread):
@@ -76,6 +78,32 @@ class ExportWorker(QThread):
         self.export_error.emit(error)
 
 
+class BatchChartExportWorker(QThread):
+    """Exportación de los gráficos de todas las semanas (pool de procesos) sin bloquear la UI"""
+
+    export_completed = pyqtSignal(dict)
+    export_error = pyqtSignal(str)
+
+    def __init__(self, db_manager, out_dir: str, fmt: str, start_date: Optional[str] = None,
+                 is_dark: bool = False, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.out_dir = out_dir
+        self.fmt = fmt
+        self.start_date = start_date
+        self.is_dark = is_dark
+        # Idioma tomado al crear el worker (hilo de la UI)
+        self.language = i18n.current_language
+
+    def run(self):
+        try:
+            self.export_completed.emit(export_week_charts(self.db_manager, self.out_dir, self.fmt,
+                                                          start_date=self.start_date, language=self.language,
+                                                          is_dark=self.is_dark))
+        except Exception as e:
+            self.export_error.emit(str(e))
+
+
 class ExportDialog(QDialog):
     """Diálogo principal de exportación con opciones avanzadas."""
     
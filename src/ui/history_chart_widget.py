@@ -0,0 +1,141 @@
+"""
+Widget de curva de saldo de todo el historial
+Carga el historial con una única consulta columnar y lo entrega a un backend
+de series temporales (matplotlib con nivel de detalle + LTTB, o pyqtgraph si
+está instalado y la serie es grande), elegido según el número de puntos o
+según el selector de motor. El backend (y con él matplotlib) se crea en la primera recarga, con la pestaña ya
+visible.
+"""
+
+from typing import Optional
+
+import numpy as np
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox
+from PyQt5.QtCore import QTimer
+
+from src.models.history import TradingHistory
+from src.ui.chart_backends import (BACKEND_CHOICES, HAS_PYQTGRAPH, SeriesChartBackend,
+                                   backend_name_for, create_series_backend)
+from src.utils.i18n import tr
+
+
+class HistoryChartWidget(QWidget):
+    """Saldo acumulado de todas las semanas con nivel de detalle automático"""
+
+    def __init__(self, prefer_backend: Optional[str] = None):
+        super().__init__()
+        self.is_dark = False
+        self.data_model = None
+        self.prefer_backend = prefer_backend
+        self.backend: Optional[SeriesChartBackend] = None
+        self._total_points = 0
+        # Agrupar recargas en un solo trabajo por ciclo de eventos
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self.refresh)
+        self._refresh_pending = True
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Configurar el contenedor del backend y las etiquetas de estado"""
+        self.main_layout = QVBoxLayout()
+        controls = QHBoxLayout()
+        self.backend_label = QLabel(tr('chart_backend_label'))
+        controls.addWidget(self.backend_label)
+        self.backend_combo = QComboBox()
+        controls.addWidget(self.backend_combo)
+        controls.addStretch(1)
+        self._fill_backend_combo()
+        self.backend_combo.currentIndexChanged.connect(self._on_backend_changed)
+        self.info_label = QLabel(tr('chart_loading'))
+        self.hover_label = QLabel("")
+        self.main_layout.addLayout(controls)
+        self.main_layout.addWidget(self.info_label)
+        self.main_layout.addWidget(self.hover_label)
+        self.setLayout(self.main_layout)
+
+    def _fill_backend_combo(self):
+        """Opciones de motor en el idioma actual (pyqtgraph solo si está instalado)"""
+        self.backend_combo.blockSignals(True)
+        self.backend_combo.clear()
+        for choice in BACKEND_CHOICES:
+            self.backend_combo.addItem(tr('chart_backend_auto') if choice is None else choice, choice)
+            if choice == 'pyqtgraph' and not HAS_PYQTGRAPH:
+                self.backend_combo.model().item(self.backend_combo.count() - 1).setEnabled(False)
+        self.backend_combo.setCurrentIndex(max(self.backend_combo.findData(self.prefer_backend), 0))
+        self.backend_combo.blockSignals(False)
+
+    def _on_backend_changed(self, index: int):
+        self.prefer_backend = self.backend_combo.itemData(index)
+        self.request_refresh()
+
+    def _set_backend(self, name: str):
+        """Crear (o sustituir) el backend de dibujo"""
+        if self.backend is not None:
+            if self.backend.name == name:
+                return
+            self.main_layout.removeWidget(self.backend.widget())
+            self.backend.widget().deleteLater()
+        self.backend = create_series_backend(name, on_hover=self._on_hover, on_view=self._on_view)
+        self.main_layout.insertWidget(1, self.backend.widget(), 1)
+        self._apply_style()
+
+    def set_data_model(self, data_model):
+        """Asociar el modelo de datos (fuente de la base de datos)"""
+        self.data_model = data_model
+
+    def request_refresh(self):
+        """Recargar el historial en el próximo ciclo de eventos (solo si está visible)"""
+        self._refresh_pending = True
+        if self.isVisible():
+            self._refresh_timer.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._refresh_pending:
+            self._refresh_timer.start()
+
+    def refresh(self):
+        """Cargar el historial con una consulta y pasarlo al backend adecuado a su tamaño"""
+        if self.data_model is None:
+            return
+        self._refresh_pending = False
+        try:
+            history = TradingHistory.from_db(self.data_model.db_manager)
+            dates, balance = history.daily_balance()
+            self._total_points = int(dates.size)
+            self._set_backend(backend_name_for(self._total_points, self.prefer_backend))
+            self.backend.set_series(dates, balance)
+        except Exception as e:
+            print(f"Error al cargar el historial: {e}")
+
+    def _on_view(self, level: str, points: int):
+        """Nivel de detalle y puntos dibujados del tramo visible"""
+        if not self._total_points:
+            self.info_label.setText(tr('history_empty'))
+            return
+        level_name = tr(f'lod_{level}') if level in ('day', 'week', 'month') else tr('lod_auto')
+        self.info_label.setText(tr('history_lod_info').format(
+            level=level_name, points=points, total=self._total_points) + f" · {self.backend.name}")
+
+    def _on_hover(self, date: Optional[np.datetime64], value: Optional[float]):
+        self.hover_label.setText("" if date is None else f"{date}: ${value:.2f}")
+
+    def _apply_style(self):
+        """Colores y textos según tema e idioma"""
+        if self.backend is None:
+            return  # Se aplica al crear el backend
+        self.backend.apply_style(tr('history_title'), tr('history_date_axis'), tr('amount_axis_label'), self.is_dark)
+
+    def set_theme(self, is_dark: bool):
+        """Cambiar tema del gráfico"""
+        self.is_dark = is_dark
+        self._apply_style()
+
+    def apply_language(self):
+        """Actualizar textos según el idioma actual"""
+        self.backend_label.setText(tr('chart_backend_label'))
+        self._fill_backend_combo()
+        self._apply_style()
+        # El texto de nivel de detalle se regenera al recargar
+        self.request_refresh()
@@ -0,0 +1,73 @@
+"""
+Creación diferida de los gráficos
+Los widgets de gráfico muestran un marcador ligero y crean su figura y canvas
+(importando matplotlib en ese momento) justo después de su primer pintado: la
+ventana principal aparece sin esperar a matplotlib, y las pestañas que nunca se
+abren no lo crean nunca.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+from PyQt5.QtWidgets import QWidget, QLabel, QSizePolicy
+from PyQt5.QtCore import Qt, QTimer
+
+from src.utils.i18n import tr
+
+
+class _QtABCMeta(type(QWidget), ABCMeta):
+    """Metaclase que combina la de Qt (sip) con ABCMeta para permitir métodos abstractos"""
+
+
+class LazyChartWidget(QWidget, metaclass=_QtABCMeta):
+    """Base: marcador hasta el primer pintado; luego create_canvas() y canvas_ready()"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.canvas = None
+        self._canvas_layout = None
+        self._canvas_stretch = 1
+        self._canvas_scheduled = False
+        self.placeholder = QLabel(tr('chart_loading'))
+        self.placeholder.setAlignment(Qt.AlignCenter)
+        self.placeholder.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+    def add_canvas_slot(self, layout, stretch: int = 1):
+        """Reservar en layout el sitio del canvas (lo ocupa el marcador hasta crearlo)"""
+        self._canvas_layout = layout
+        self._canvas_stretch = stretch
+        layout.addWidget(self.placeholder, stretch)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.canvas is None and not self._canvas_scheduled:
+            # El marcador ya está en pantalla: crear el gráfico en el siguiente ciclo de eventos
+            self._canvas_scheduled = True
+            QTimer.singleShot(0, self.ensure_canvas)
+
+    def ensure_canvas(self) -> bool:
+        """Crear el canvas si aún no existe. Devuelve si está disponible"""
+        if self.canvas is not None:
+            return True
+        try:
+            canvas = self.create_canvas()
+        except Exception as e:
+            print(f"Error al crear el gráfico: {e}")
+            return False
+        index = self._canvas_layout.indexOf(self.placeholder)
+        self._canvas_layout.removeWidget(self.placeholder)
+        self.placeholder.deleteLater()
+        self._canvas_layout.insertWidget(index, canvas, self._canvas_stretch)
+        self.canvas = canvas
+        self.canvas_ready()
+        return True
+
+    @abstractmethod
+    def create_canvas(self) -> QWidget:
+        """Importar matplotlib, crear figura, canvas y artistas; devolver el canvas"""
+
+    def canvas_ready(self):
+        """Aplicar el estado acumulado mientras no había canvas (tema, datos pendientes...)"""
+
+    def apply_placeholder_language(self):
+        if self.canvas is None:
+            self.placeholder.setText(tr('chart_loading'))
@@ -27,9 +27,11 @@ class MainMenuBar(QMenuBar):
     daily_advice_visibility_changed = pyqtSignal(bool)
     show_weekly_summary_triggered = pyqtSignal()
     start_new_week_triggered = pyqtSignal()
+    batch_analysis_triggered = pyqtSignal()
     export_excel_triggered = pyqtSignal()
     export_csv_triggered = pyqtSignal()
     export_json_triggered = pyqtSignal()
+    export_week_charts_triggered = pyqtSignal()
     language_changed = pyqtSignal(str)
     
     def __init__(self, parent=None):
@@ -128,6 +130,12 @@ class MainMenuBar(QMenuBar):
         self._actions['weekly_summary'].triggered.connect(self.show_weekly_summary_triggered.emit)
         self._menus['assistant'].addAction(self._actions['weekly_summary'])
 
+        # Acción: Analizar todas las semanas guardadas (en segundo plano)
+        self._actions['batch_analysis'] = QAction(tr('batch_analysis'), self)
+        self._actions['batch_analysis'].setStatusTip(tr('status_batch_analysis'))
+        self._actions['batch_analysis'].triggered.connect(self.batch_analysis_triggered.emit)
+        self._menus['assistant'].addAction(self._actions['batch_analysis'])
+
         # Acción: Empezar nueva semana (reiniciar datos)
         self._actions['start_new_week_reset'] = QAction(tr('start_new_week_reset'), self)
         self._actions['start_new_week_reset'].setStatusTip(tr('status_start_new_week_reset'))
@@ -153,6 +161,12 @@ class MainMenuBar(QMenuBar):
         self._actions['export_json'].setStatusTip(tr('status_export_json'))
         self._actions['export_json'].triggered.connect(self.export_json_triggered)
         self._menus['export'].addAction(self._actions['export_json'])
+
+        self._menus['export'].addSeparator()
+        self._actions['export_week_charts'] = QAction(tr('export_week_charts'), self)
+        self._actions['export_week_charts'].setStatusTip(tr('status_export_week_charts'))
+        self._actions['export_week_charts'].triggered.connect(self.export_week_charts_triggered.emit)
+        self._menus['export'].addAction(self._actions['export_week_charts'])
         
         # Menú Ayuda
         self._menus['help'] = self.addMenu(tr('menu_help'))
@@ -338,6 +352,8 @@ class MainMenuBar(QMenuBar):
             self._actions['daily_advice'].setText(tr('daily_advice'))
         if 'weekly_summary' in self._actions:
             self._actions['weekly_summary'].setText(tr('weekly_summary'))
+        if 'batch_analysis' in self._actions:
+            self._actions['batch_analysis'].setText(tr('batch_analysis'))
         if 'start_new_week_reset' in self._actions:
             self._actions['start_new_week_reset'].setText(tr('start_new_week_reset'))
         if 'export_excel' in self._actions:
@@ -346,6 +362,8 @@ class MainMenuBar(QMenuBar):
             self._actions['export_csv'].setText(tr('export_csv'))
         if 'export_json' in self._actions:
             self._actions['export_json'].setText(tr('export_json'))
+        if 'export_week_charts' in self._actions:
+            self._actions['export_week_charts'].setText(tr('export_week_charts'))
         if 'about' in self._actions:
             self._actions['about'].setText(tr('about'))
         if 'instructions' in self._actions:
@@ -376,6 +394,8 @@ class MainMenuBar(QMenuBar):
             self._actions['daily_advice'].setStatusTip(tr('status_daily_advice'))
         if 'weekly_summary' in self._actions:
             self._actions['weekly_summary'].setStatusTip(tr('status_weekly_summary'))
+        if 'batch_analysis' in self._actions:
+            self._actions['batch_analysis'].setStatusTip(tr('status_batch_analysis'))
         if 'start_new_week_reset' in self._actions:
             self._actions['start_new_week_reset'].setStatusTip(tr('status_start_new_week_reset'))
         if 'export_excel' in self._actions:
@@ -384,6 +404,8 @@ class MainMenuBar(QMenuBar):
             self._actions['export_csv'].setStatusTip(tr('status_export_csv'))
         if 'export_json' in self._actions:
             self._actions['export_json'].setStatusTip(tr('status_export_json'))
+        if 'export_week_charts' in self._actions:
+            self._actions['export_week_charts'].setStatusTip(tr('status_export_week_charts'))
         if 'about' in self._actions:
             self._actions['about'].setStatusTip(tr('status_about'))
         if 'instructions' in self._actions:
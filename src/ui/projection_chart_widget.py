@@ -0,0 +1,154 @@
+"""
+Widget de gráfico de abanico para la proyección de capital (Monte Carlo)
+La simulación y el dibujo se hacen en un hilo de renderizado (Agg → QImage),
+así el cálculo de miles de trayectorias nunca bloquea la interfaz.
+"""
+
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSpinBox, QPushButton
+from src.models.projection import CapitalProjector
+from src.ui.chart_render_worker import ChartRenderWorker, ImageChartView
+from src.utils.i18n import tr
+
+
+def draw_projection(figure, projection, is_dark: bool):
+    """Dibujar las bandas de percentiles como gráfico de abanico sobre figure"""
+    text_color = '#e0e0e0' if is_dark else '#2c3e50'
+    band_color = '#3498db'
+
+    figure.clear()
+    figure.patch.set_facecolor('#121212' if is_dark else 'white')
+    ax = figure.add_subplot(111)
+    ax.set_facecolor('#1e1e1e' if is_dark else 'white')
+
+    weeks = projection['weeks']
+    bands = projection['percentiles']
+    levels = sorted(bands)
+    half = len(levels) // 2
+    # Bandas simétricas desde la más externa a la más interna
+    for low, high in zip(levels[:half], reversed(levels[-half:] if half else [])):
+        ax.fill_between(weeks, bands[low], bands[high], color=band_color, alpha=0.18,
+                        linewidth=0, label=f"P{low:g}–P{high:g}")
+    median_key = levels[half]
+    ax.plot(weeks, bands[median_key], color=band_color, linewidth=2, label=f"P{median_key:g}")
+    ax.axhline(projection['initial_capital'], color=text_color, linewidth=1, alpha=0.5, linestyle='--')
+
+    ax.set_title(tr('projection_title'), fontsize=14, fontweight='bold', color=text_color)
+    ax.set_xlabel(tr('projection_weeks_axis'), color=text_color)
+    ax.set_ylabel(tr('amount_axis_label'), color=text_color)
+    ax.tick_params(colors=text_color)
+    ax.grid(True, alpha=0.3)
+    ax.text(0.01, 0.98, f"{tr('projection_loss_probability')} {projection['probability_of_loss'] * 100:.1f}%",
+            transform=ax.transAxes, ha='left', va='top', fontsize=9, color=text_color)
+    legend = ax.legend(loc='upper left', bbox_to_anchor=(0.0, 0.92), fontsize=8, frameon=False)
+    for legend_text in legend.get_texts():
+        legend_text.set_color(text_color)
+    for side in ('top', 'right'):
+        ax.spines[side].set_visible(False)
+
+
+class ProjectionChartWidget(QWidget):
+    """Gráfico de abanico con las bandas de percentiles del capital proyectado"""
+
+    def __init__(self):
+        super().__init__()
+        self.is_dark = False
+        self.data_model = None
+        self.last_projection = None
+        self._simulating = False  # Hay una simulación encolada que aún no llegó
+        self.render_worker = ChartRenderWorker(self)
+        self.render_worker.rendered.connect(self._on_rendered)
+        self.render_worker.render_failed.connect(self._on_render_failed)
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Configurar controles y vista de la imagen renderizada"""
+        layout = QVBoxLayout()
+
+        controls = QHBoxLayout()
+        self.weeks_label = QLabel(tr('projection_weeks_label'))
+        controls.addWidget(self.weeks_label)
+        self.weeks_spin = QSpinBox()
+        self.weeks_spin.setRange(1, 104)
+        self.weeks_spin.setValue(12)
+        controls.addWidget(self.weeks_spin)
+        self.run_button = QPushButton(tr('projection_run'))
+        self.run_button.clicked.connect(self.refresh)
+        controls.addWidget(self.run_button)
+        controls.addStretch(1)
+        layout.addLayout(controls)
+
+        self.view = ImageChartView()
+        self.view.resized.connect(lambda size: self._render())
+        layout.addWidget(self.view)
+
+        self.setLayout(layout)
+
+    def set_data_model(self, data_model):
+        """Asociar el modelo de datos (fuente del historial y capital actual)"""
+        self.data_model = data_model
+
+    def refresh(self):
+        """Recalcular la proyección con el historial actual y redibujar (en segundo plano)"""
+        if self.data_model is None:
+            return
+        db_manager = self.data_model.db_manager
+        balance = self.data_model.get_current_balance()
+        weeks = self.weeks_spin.value()
+        is_dark = self.is_dark
+        self._simulating = True
+
+        def simulate_and_draw(figure):
+            projection = CapitalProjector.from_db(db_manager).project(balance, weeks=weeks, n_paths=20000)
+            draw_projection(figure, projection, is_dark)
+            return projection
+
+        self._submit(simulate_and_draw)
+
+    def _render(self):
+        """Volver a dibujar la última proyección (tema, idioma o tamaño nuevos) sin recalcularla"""
+        if self._simulating:
+            # Solo se conserva el último trabajo: repetir la simulación con el estado nuevo
+            self.refresh()
+            return
+        projection, is_dark = self.last_projection, self.is_dark
+        if projection is None:
+            return
+
+        def redraw(figure):
+            draw_projection(figure, projection, is_dark)
+            return projection
+
+        self._submit(redraw)
+
+    def _submit(self, draw):
+        """Encolar draw(figure) -> proyección en el hilo de renderizado con el tamaño actual de la vista"""
+        size = self.view.pixel_size()
+        if size.width() <= 0 or size.height() <= 0:
+            return
+        self.render_worker.submit(draw, size.width(), size.height(), 100 * self.view.devicePixelRatioF())
+
+    def _on_rendered(self, generation: int, image, projection):
+        if not self.render_worker.is_current(generation):
+            return
+        self._simulating = False
+        self.last_projection = projection
+        self.view.set_image(image)
+
+    def _on_render_failed(self, generation: int, message: str):
+        self._simulating = False
+        print(f"Error al calcular la proyección: {message}")
+
+    def shutdown(self):
+        """Detener el hilo de renderizado (al cerrar la aplicación)"""
+        self.render_worker.stop()
+
+    def set_theme(self, is_dark: bool):
+        """Cambiar tema del gráfico"""
+        self.is_dark = is_dark
+        self._render()
+
+    def apply_language(self):
+        """Actualizar textos según el idioma actual"""
+        self.weeks_label.setText(tr('projection_weeks_label'))
+        self.run_button.setText(tr('projection_run'))
+        self._render()
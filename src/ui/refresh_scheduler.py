@@ -0,0 +1,64 @@
+"""
+Planificador de refrescos por tiempo
+Arma un único QTimer de disparo único para el próximo límite relevante
+(medianoche y el día/hora del rollover semanal) y emite la señal
+correspondiente justo entonces; entre límites no hay sondeo.
+"""
+
+from datetime import datetime, time, timedelta
+from typing import Optional
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+# Re-sincronizar como máximo cada 6 horas (cambios de hora, suspensión del equipo)
+MAX_INTERVAL_MS = 6 * 60 * 60 * 1000
+
+
+class RefreshScheduler(QObject):
+    """Emite day_changed a medianoche y rollover_due al llegar el día/hora de rollover"""
+
+    day_changed = pyqtSignal()
+    rollover_due = pyqtSignal()
+
+    def __init__(self, rollover_weekday: int = 5, rollover_time: time = time(0, 0), parent=None):
+        super().__init__(parent)
+        self.rollover_weekday = rollover_weekday  # 0=Lunes ... 5=Sábado
+        self.rollover_time = rollover_time
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timeout)
+        self._next_midnight: Optional[datetime] = None
+        self._next_rollover: Optional[datetime] = None
+
+    def next_rollover(self, now: datetime) -> datetime:
+        """Próximo instante de rollover estrictamente posterior a now"""
+        days_ahead = (self.rollover_weekday - now.weekday()) % 7
+        candidate = datetime.combine(now.date() + timedelta(days=days_ahead), self.rollover_time)
+        if candidate <= now:
+            candidate += timedelta(days=7)
+        return candidate
+
+    def start(self, now: Optional[datetime] = None):
+        """Calcular los próximos límites y armar el temporizador"""
+        now = now or datetime.now()
+        self._next_midnight = datetime.combine(now.date() + timedelta(days=1), time(0, 0))
+        self._next_rollover = self.next_rollover(now)
+        self._arm(now)
+
+    def stop(self):
+        self._timer.stop()
+
+    def _arm(self, now: datetime):
+        target = min(self._next_midnight, self._next_rollover)
+        delay_ms = int((target - now).total_seconds() * 1000) + 1
+        self._timer.start(max(0, min(delay_ms, MAX_INTERVAL_MS)))
+
+    def _on_timeout(self):
+        now = datetime.now()
+        if now >= self._next_midnight:
+            self._next_midnight = datetime.combine(now.date() + timedelta(days=1), time(0, 0))
+            self.day_changed.emit()
+        if now >= self._next_rollover:
+            self._next_rollover = self.next_rollover(now)
+            self.rollover_due.emit()
+        self._arm(now)
@@ -0,0 +1,80 @@
+"""
+Caché LRU de imágenes renderizadas de gráficos
+Guarda regiones de píxeles (copy_from_bbox) por clave de estado (datos, tema,
+idioma, leyenda, tamaño) para que volver a un estado ya visto solo requiera
+restaurar la imagen. El uso de memoria está acotado por bytes, no por entradas.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+from src.utils.i18n import tr
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def region_nbytes(region) -> int:
+    """Tamaño en bytes de una región RGBA de Agg"""
+    x0, y0, x1, y1 = region.get_extents()
+    return max(0, x1 - x0) * max(0, y1 - y0) * 4
+
+
+class RenderCache:
+    """LRU de (imagen completa, fondo sin artistas de datos) acotado por memoria"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[Hashable, Tuple[object, object, int]]' = OrderedDict()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Tuple[object, object]]:
+        """(imagen, fondo) si el estado ya se renderizó; lo marca como usado recientemente"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0], entry[1]
+
+    def put(self, key: Hashable, image, background=None):
+        """Guardar un renderizado y expulsar los más antiguos hasta caber en max_bytes"""
+        nbytes = region_nbytes(image) + (region_nbytes(background) if background is not None else 0)
+        if nbytes > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes_used -= old[2]
+        self._entries[key] = (image, background, nbytes)
+        self.bytes_used += nbytes
+        while self.bytes_used > self.max_bytes:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self.bytes_used -= evicted
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes_used = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> Dict:
+        """Entradas, memoria usada/límite y tasa de aciertos"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self.bytes_used,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def describe(self) -> str:
+        """Resumen legible del uso de la caché"""
+        stats = self.stats()
+        return tr('render_cache_status').format(
+            entries=stats['entries'], used=stats['bytes'] / 1048576,
+            limit=stats['max_bytes'] / 1048576, hit_rate=stats['hit_rate'] * 100)
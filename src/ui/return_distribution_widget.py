@@ -0,0 +1,258 @@
+"""
+Histograma de la distribución de resultados diarios
+Las barras y la curva KDE se crean una sola vez: al editar un día solo cambian
+los conteos del modelo (ReturnDistribution) y aquí se actualizan las alturas en
+el sitio; posiciones y colores solo se tocan cuando cambian los bordes. El
+canvas se crea tras el primer pintado (LazyChartWidget).
+"""
+
+from typing import Optional
+
+import numpy as np
+from PyQt5.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QCheckBox, QSizePolicy
+from PyQt5.QtCore import QTimer
+
+from src.models.history import week_amounts_from_model
+from src.models.return_distribution import ReturnDistribution, DISTRIBUTION_WINDOWS, DEFAULT_BINS
+from src.ui.lazy_chart import LazyChartWidget
+from src.utils.i18n import tr
+
+POSITIVE_COLOR = '#2ecc71'
+NEGATIVE_COLOR = '#e74c3c'
+KDE_COLOR = '#3498db'
+
+
+class ReturnDistributionWidget(LazyChartWidget):
+    """Histograma + KDE de los días operados en una ventana del historial"""
+
+    def __init__(self):
+        super().__init__()
+        self.is_dark = False
+        self.data_model = None
+        self.distribution: Optional[ReturnDistribution] = None
+        self._drawn_generation = None
+        self._refresh_pending = True
+        self._stale = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self.refresh)
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Configurar controles y reservar el sitio del canvas (se crea tras el primer pintado)"""
+        layout = QVBoxLayout()
+
+        controls = QHBoxLayout()
+        self.window_label = QLabel(tr('distribution_window_label'))
+        controls.addWidget(self.window_label)
+        self.window_combo = QComboBox()
+        controls.addWidget(self.window_combo)
+        self.mode_combo = QComboBox()
+        controls.addWidget(self.mode_combo)
+        self.kde_check = QCheckBox(tr('distribution_kde'))
+        self.kde_check.setChecked(True)
+        controls.addWidget(self.kde_check)
+        controls.addStretch(1)
+        self.stats_label = QLabel("")
+        controls.addWidget(self.stats_label)
+        layout.addLayout(controls)
+        self._fill_combos()
+        self.window_combo.setCurrentIndex(len(DISTRIBUTION_WINDOWS) - 1)
+        self.window_combo.currentIndexChanged.connect(self._on_window_changed)
+        self.mode_combo.currentIndexChanged.connect(self._on_mode_changed)
+        self.kde_check.toggled.connect(self._on_kde_toggled)
+        self.add_canvas_slot(layout)
+        self.setLayout(layout)
+
+    def create_canvas(self):
+        """Crear canvas y artistas (una sola vez)"""
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+
+        self.figure = Figure(figsize=(12, 4), dpi=100, facecolor='white', constrained_layout=True)
+        canvas = FigureCanvas(self.figure)
+        canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+        self.ax = self.figure.add_subplot(111)
+        self.bars = list(self.ax.bar(np.arange(DEFAULT_BINS), np.zeros(DEFAULT_BINS), width=1.0,
+                                     alpha=0.85, edgecolor='none'))
+        (self.kde_line,) = self.ax.plot([], [], color=KDE_COLOR, linewidth=2)
+        self.mean_line = self.ax.axvline(0, linestyle='--', linewidth=1, alpha=0.7)
+        for side in ('top', 'right'):
+            self.ax.spines[side].set_visible(False)
+        return canvas
+
+    def canvas_ready(self):
+        self._apply_style()
+        if self._refresh_pending:
+            self._refresh_timer.start()
+
+    def _fill_combos(self):
+        """Textos de las ventanas y modos en el idioma actual"""
+        window_index = max(self.window_combo.currentIndex(), 0)
+        mode_index = max(self.mode_combo.currentIndex(), 0)
+        for combo in (self.window_combo, self.mode_combo):
+            combo.blockSignals(True)
+            combo.clear()
+        for weeks in DISTRIBUTION_WINDOWS:
+            label = tr('distribution_window_all') if weeks is None else tr('distribution_window_weeks').format(weeks=weeks)
+            self.window_combo.addItem(label, weeks)
+        self.mode_combo.addItem(tr('distribution_mode_amount'), 'amount')
+        self.mode_combo.addItem(tr('distribution_mode_percent'), 'percent')
+        self.window_combo.setCurrentIndex(window_index)
+        self.mode_combo.setCurrentIndex(mode_index)
+        for combo in (self.window_combo, self.mode_combo):
+            combo.blockSignals(False)
+
+    def set_data_model(self, data_model):
+        """Asociar el modelo de datos (fuente de la base de datos)"""
+        self.data_model = data_model
+
+    def request_refresh(self, *args):
+        """Recargar en el próximo ciclo de eventos (solo si está visible)"""
+        self._refresh_pending = True
+        if self.isVisible():
+            self._refresh_timer.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._refresh_pending:
+            self._refresh_timer.start()
+        elif self._stale and self.canvas is not None:
+            self._stale = False
+            self.canvas.draw_idle()
+
+    def refresh(self):
+        """Cargar el historial con una consulta y construir los conteos"""
+        if self.data_model is None or self.canvas is None:
+            return
+        self._refresh_pending = False
+        try:
+            self.distribution = ReturnDistribution.from_db(
+                self.data_model.db_manager, window_weeks=self.window_combo.currentData(),
+                mode=self.mode_combo.currentData())
+            # Incluir la semana en curso aunque aún no se haya guardado
+            self.update_from_model(self.data_model, draw=False)
+            self._update_artists()
+            self.canvas.draw_idle()
+        except Exception as e:
+            print(f"Error al cargar la distribución de resultados: {e}")
+
+    def update_from_model(self, data_model, draw: bool = True):
+        """Aplicar la semana actual del modelo (solo se restan/suman sus días)"""
+        if self.distribution is None:
+            self.request_refresh()
+            return
+        history = self.distribution.history
+        amounts = np.array(week_amounts_from_model(data_model))
+        capital = float(getattr(data_model, 'initial_capital', 100.0) or 0.0)
+        idx = history.index_of(data_model.week_start_date)
+        if idx >= 0 and np.array_equal(history.amounts[idx], amounts) and history.initial_capital[idx] == capital:
+            return
+        if idx < 0 and not amounts.any():
+            return  # Semana vacía: no aporta días operados
+        self.distribution.update_week(data_model.week_start_date, amounts, capital)
+        if draw:
+            self._update_artists()
+            self._redraw()
+
+    def _redraw(self):
+        """Repintar (o dejarlo para cuando vuelva a ser visible)"""
+        if self.isVisible():
+            self.canvas.draw_idle()
+        else:
+            self._stale = True
+
+    def _update_artists(self):
+        """Alturas en el sitio; posiciones, colores y eje X solo si cambiaron los bordes"""
+        distribution = self.distribution
+        if distribution.generation != self._drawn_generation:
+            self._drawn_generation = distribution.generation
+            edges = distribution.edges
+            for bar, left, center in zip(self.bars, edges[:-1], distribution.centers):
+                bar.set_x(left)
+                bar.set_width(distribution.bin_width * 0.95)
+                bar.set_facecolor(POSITIVE_COLOR if center >= 0 else NEGATIVE_COLOR)
+            self.ax.set_xlim(edges[0], edges[-1])
+            self.ax.set_xlabel(self._x_label())
+
+        for bar, count in zip(self.bars, distribution.counts):
+            bar.set_height(count)
+        kde = distribution.kde_counts()
+        self.kde_line.set_data(distribution.grid, kde)
+        self.kde_line.set_visible(self.kde_check.isChecked())
+        stats = distribution.stats()
+        self.mean_line.set_xdata([stats['mean'], stats['mean']])
+        top = max(float(distribution.counts.max()), float(kde.max()) if self.kde_check.isChecked() else 0.0, 1.0)
+        self.ax.set_ylim(0, top * 1.15)
+        self._update_stats(stats)
+
+    def _update_stats(self, stats):
+        unit = '%' if self.distribution.mode == 'percent' else '$'
+        positive = stats['positive'] / stats['count'] * 100 if stats['count'] else 0.0
+        self.stats_label.setText(tr('distribution_stats').format(
+            count=stats['count'], mean=self._format(stats['mean'], unit),
+            std=self._format(stats['std'], unit), positive=positive))
+
+    @staticmethod
+    def _format(value: float, unit: str) -> str:
+        return f"{value:.2f}%" if unit == '%' else f"${value:.2f}"
+
+    def _x_label(self) -> str:
+        if self.distribution is not None and self.distribution.mode == 'percent':
+            return tr('distribution_percent_axis')
+        return tr('amount_axis_label')
+
+    def _on_window_changed(self, index: int):
+        if self.distribution is None or self.canvas is None:
+            return
+        self.distribution.set_window(self.window_combo.currentData())
+        self._update_artists()
+        self._redraw()
+
+    def _on_mode_changed(self, index: int):
+        if self.distribution is None or self.canvas is None:
+            return
+        self.distribution.set_mode(self.mode_combo.currentData())
+        self._update_artists()
+        self._redraw()
+
+    def _on_kde_toggled(self, checked: bool):
+        if self.distribution is None or self.canvas is None:
+            return
+        self._update_artists()
+        self._redraw()
+
+    def _apply_style(self):
+        """Colores y textos según tema e idioma sobre los artistas existentes"""
+        text_color = '#e0e0e0' if self.is_dark else '#2c3e50'
+        self.figure.patch.set_facecolor('#121212' if self.is_dark else 'white')
+        self.ax.set_facecolor('#1e1e1e' if self.is_dark else 'white')
+        self.ax.set_title(tr('distribution_title'), fontsize=12, fontweight='bold', color=text_color)
+        self.ax.set_xlabel(self._x_label(), color=text_color)
+        self.ax.set_ylabel(tr('distribution_days_axis'), color=text_color)
+        self.ax.tick_params(colors=text_color)
+        self.ax.grid(True, axis='y', alpha=0.3, color='#3a3a3a' if self.is_dark else '#ecf0f1')
+        self.mean_line.set_color(text_color)
+        for side in ('left', 'bottom'):
+            self.ax.spines[side].set_color(text_color)
+
+    def set_theme(self, is_dark: bool):
+        """Cambiar tema del gráfico"""
+        self.is_dark = is_dark
+        if self.canvas is not None:
+            self._apply_style()
+            self._redraw()
+
+    def apply_language(self):
+        """Actualizar textos según el idioma actual"""
+        self.window_label.setText(tr('distribution_window_label'))
+        self.kde_check.setText(tr('distribution_kde'))
+        self._fill_combos()
+        self.apply_placeholder_language()
+        if self.canvas is None:
+            return
+        self._apply_style()
+        if self.distribution is not None:
+            self._update_stats(self.distribution.stats())
+        self._redraw()
@@ -7,6 +7,8 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont, QPalette, QColor
 from src.utils.i18n import tr
+from src.utils.metrics_format import risk_metric_rows, forecast_rows, regime_text
+from src.models.ai_analyzer import DAY_KEYS
 
 class SummaryPanel(QWidget):
     """Panel de resumen mejorado para mostrar estadísticas y análisis"""
@@ -17,6 +19,10 @@ class SummaryPanel(QWidget):
         # Mantener últimos datos para re-aplicar colores al cambiar tema
         self.last_summary = {}
         self.last_capital = {}
+        self.last_risk_metrics = {}
+        self.last_anomalies = {}
+        self.last_forecast = {}
+        self.last_regime = None
     
     def setup_ui(self):
         """Configurar la interfaz del panel"""
@@ -131,6 +137,32 @@ class SummaryPanel(QWidget):
         self.advice_group.setLayout(advice_layout)
         layout.addWidget(self.advice_group)
 
+        # Sección de métricas de riesgo del historial
+        self.risk_group = QGroupBox(tr("risk_metrics_title"))
+        risk_layout = QVBoxLayout()
+        # Aviso de montos atípicos (posibles errores de captura)
+        self.anomaly_label = QLabel("")
+        self.anomaly_label.setWordWrap(True)
+        self.anomaly_label.setStyleSheet("font-size: 9pt; font-weight: bold; color: #d35400;")
+        self.anomaly_label.setVisible(False)
+        risk_layout.addWidget(self.anomaly_label)
+        # Régimen (tipo de semana) en curso
+        self.regime_label = QLabel("")
+        self.regime_label.setWordWrap(True)
+        self.regime_label.setStyleSheet("font-size: 9pt; font-weight: bold; color: #8e44ad;")
+        risk_layout.addWidget(self.regime_label)
+        self.risk_label = QLabel("")
+        self.risk_label.setWordWrap(True)
+        self.risk_label.setStyleSheet("font-size: 9pt; color: #2c3e50;")
+        risk_layout.addWidget(self.risk_label)
+        # Pronóstico del próximo día / semana
+        self.forecast_label = QLabel("")
+        self.forecast_label.setWordWrap(True)
+        self.forecast_label.setStyleSheet("font-size: 9pt; color: #2c3e50;")
+        risk_layout.addWidget(self.forecast_label)
+        self.risk_group.setLayout(risk_layout)
+        layout.addWidget(self.risk_group)
+
         # Sección de análisis AI
         self.ai_group = QGroupBox(tr("ai_analysis_title"))
         ai_layout = QVBoxLayout()
@@ -275,6 +307,34 @@ class SummaryPanel(QWidget):
         html = f"<b>{title}</b><br><br>{replaced}"
         self.daily_advice_label.setText(html)
 
+    def update_risk_metrics(self, metrics: dict):
+        """Actualizar las métricas de riesgo del historial."""
+        self.last_risk_metrics = metrics or {}
+        rows = risk_metric_rows(self.last_risk_metrics)
+        self.risk_label.setText("<br>".join(f"<b>{label}</b> {value}" for label, value in rows))
+
+    def update_forecast(self, forecast: dict):
+        """Mostrar el rango pronosticado del próximo día y de la próxima semana."""
+        self.last_forecast = forecast or {}
+        rows = forecast_rows(self.last_forecast)
+        title = f"<b>{tr('forecast_title')}</b><br>" if rows else ""
+        self.forecast_label.setText(title + "<br>".join(f"<b>{label}</b> {value}" for label, value in rows))
+
+    def update_regime(self, regime: dict):
+        """Mostrar el régimen más cercano a la semana en curso."""
+        self.last_regime = regime
+        self.regime_label.setText(regime_text(regime))
+
+    def update_anomalies(self, anomalies: dict):
+        """Mostrar un aviso con los días cuyo monto parece atípico."""
+        self.last_anomalies = anomalies or {}
+        if not self.last_anomalies:
+            self.anomaly_label.setVisible(False)
+            return
+        days = ", ".join(f"{tr(DAY_KEYS.get(day, day))} ({score:.1f}σ)" for day, score in self.last_anomalies.items())
+        self.anomaly_label.setText(f"⚠ {tr('anomaly_warning')} {days}")
+        self.anomaly_label.setVisible(True)
+
     def apply_language(self):
         """Aplicar traducciones a títulos y etiquetas del panel"""
         self.title_label.setText(tr("weekly_summary_panel"))
@@ -284,6 +344,12 @@ class SummaryPanel(QWidget):
         self.performance_group.setTitle(tr("performance"))
         self.advice_group.setTitle(tr("daily_advice_title"))
         self.ai_group.setTitle(tr("ai_analysis_title"))
+        self.risk_group.setTitle(tr("risk_metrics_title"))
+        if self.last_risk_metrics:
+            self.update_risk_metrics(self.last_risk_metrics)
+        self.update_anomalies(self.last_anomalies)
+        self.update_forecast(self.last_forecast)
+        self.update_regime(self.last_regime)
         # Encabezados principales (se actualizan con datos)
         # Mantener valores actuales pero traducir prefijos
         try:
@@ -414,7 +480,7 @@ class SummaryPanel(QWidget):
                 }
                 """
             )
-            for group in [self.withdrawal_group, self.total_group, self.reinvestment_group, self.performance_group, self.advice_group, self.ai_group]:
+            for group in [self.withdrawal_group, self.total_group, self.reinvestment_group, self.performance_group, self.advice_group, self.risk_group, self.ai_group]:
                 group.setStyleSheet(
                     """
                     QGroupBox {
@@ -441,6 +507,8 @@ class SummaryPanel(QWidget):
             self.performance_label.setStyleSheet("font-size: 12pt; font-weight: bold; color: #e0e0e0;")
             self.days_label.setStyleSheet("font-size: 10pt; color: #b0b0b0;")
             self.daily_advice_label.setStyleSheet("font-size: 10pt; color: #e0e0e0;")
+            self.risk_label.setStyleSheet("font-size: 9pt; color: #e0e0e0;")
+            self.forecast_label.setStyleSheet("font-size: 9pt; color: #e0e0e0;")
             self.ai_summary_label.setStyleSheet(
                 """
                 QLabel {
@@ -489,7 +557,7 @@ class SummaryPanel(QWidget):
                 }
                 """
             )
-            for group in [self.withdrawal_group, self.total_group, self.reinvestment_group, self.performance_group, self.advice_group, self.ai_group]:
+            for group in [self.withdrawal_group, self.total_group, self.reinvestment_group, self.performance_group, self.advice_group, self.risk_group, self.ai_group]:
                 group.setStyleSheet("")
             self.initial_capital_label.setStyleSheet("font-size: 12pt; font-weight: bold; color: #34495e;")
             self.current_balance_label.setStyleSheet("font-size: 14pt; font-weight: bold; color: #2c3e50;")
@@ -499,6 +567,8 @@ class SummaryPanel(QWidget):
             self.performance_label.setStyleSheet("font-size: 12pt; font-weight: bold; color: #3498db;")
             self.days_label.setStyleSheet("font-size: 10pt; color: #7f8c8d;")
             self.daily_advice_label.setStyleSheet("font-size: 10pt; color: #2c3e50;")
+            self.risk_label.setStyleSheet("font-size: 9pt; color: #2c3e50;")
+            self.forecast_label.setStyleSheet("font-size: 9pt; color: #2c3e50;")
             self.ai_summary_label.setStyleSheet(
                 """
                 QLabel {
@@ -72,6 +72,12 @@ class TradingTableWidget(QTableWidget):
             else:
                 amount_item.setForeground(QBrush(QColor("#7f8c8d")))
             
+            # Resaltar montos atípicos detectados por el modelo
+            score = getattr(self.data_model, 'anomalies', {}).get(day)
+            if score is not None:
+                amount_item.setBackground(QBrush(QColor("#fdebd0")))
+                amount_item.setToolTip(tr('anomaly_tooltip').format(score=score))
+            
             self.setItem(row, 1, amount_item)
             
             # Destino
@@ -0,0 +1,450 @@
+"""
+Gráfico de barras semanal en modo retenido
+Crea ejes, barras, etiquetas y leyenda una sola vez sobre una Figure de
+matplotlib y en cada actualización solo muta alturas, colores y posiciones.
+Con blit=True, mientras el marco (textos, límites, márgenes) no cambie, solo se
+repintan los artistas de datos sobre un fondo guardado, y la cruz y el tooltip
+del hover se pintan sobre una copia del gráfico ya dibujado. No depende de Qt,
+por lo que también sirve para renderizar sin interfaz (Agg).
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import matplotlib.patches as patches
+import matplotlib.style as mplstyle
+from matplotlib import rcParams
+
+from src.utils import i18n
+from src.utils.i18n import tr
+
+DAY_KEYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+
+DEFAULT_COLORS = {
+    'positive': '#2ecc71',      # Verde suave
+    'negative': '#e74c3c',      # Rojo elegante
+    'withdrawal': '#2ecc71',    # Retiro personal
+    'reinvestment': '#f1c40f',  # Dorado para reinversión
+    'neutral': '#bdc3c7',       # Gris
+    'text': '#2c3e50',          # Texto oscuro
+    'grid': '#ecf0f1',          # Grilla clara
+    'avg_line': '#3498db',      # Línea de promedio
+    'background': 'white',      # Fondo de la figura
+    'axes_background': 'white'  # Fondo del área de trazado
+}
+
+# Colores que cambian con el tema (el resto de DEFAULT_COLORS es común)
+THEME_COLORS = {
+    False: {'text': '#2c3e50', 'grid': '#ecf0f1', 'background': 'white', 'axes_background': 'white'},
+    True: {'text': '#e0e0e0', 'grid': '#3a3a3a', 'background': '#121212', 'axes_background': '#1e1e1e'},
+}
+
+LEGEND_POSITIONS = ('outside_right', 'upper_right', 'upper_center')
+
+
+def chart_colors(is_dark: bool = False) -> Dict:
+    """Paleta completa del gráfico para un tema"""
+    colors = dict(DEFAULT_COLORS)
+    colors.update(THEME_COLORS[bool(is_dark)])
+    return colors
+
+
+def apply_chart_style():
+    """Estilo global de matplotlib del gráfico semanal (widget y exportación por lotes)"""
+    try:
+        mplstyle.use('seaborn-v0_8-whitegrid')
+    except Exception:
+        mplstyle.use('seaborn')
+    rcParams['font.family'] = 'sans-serif'
+    rcParams['font.sans-serif'] = ['Segoe UI', 'Arial', 'DejaVu Sans']
+    rcParams['font.size'] = 10
+
+
+def apply_theme_rcparams(is_dark: bool):
+    """Colores por defecto de matplotlib según el tema (leyenda y textos sin color propio)"""
+    text = THEME_COLORS[bool(is_dark)]['text']
+    rcParams['text.color'] = text
+    rcParams['axes.facecolor'] = THEME_COLORS[bool(is_dark)]['axes_background']
+    rcParams['axes.edgecolor'] = text
+    rcParams['axes.labelcolor'] = text
+    rcParams['xtick.color'] = text
+    rcParams['ytick.color'] = text
+    rcParams['grid.color'] = THEME_COLORS[bool(is_dark)]['grid']
+
+
+def _day_entry(label: str, amount: float, destination: str, language: Optional[str] = None) -> Dict:
+    return {
+        'day': label,
+        'amount': amount,
+        'destination': destination,
+        'is_positive': amount > 0,
+        'is_withdrawal': destination in (tr('personal_withdrawal', language=language), 'Retiro Personal', 'Personal Withdrawal'),
+        'is_reinvestment': destination in (tr('reinvestment', language=language), 'Reinversión', 'Reinvestment')
+    }
+
+
+def weekly_chart_data(days: List[str], amounts: Dict, destinations: Dict,
+                      language: Optional[str] = None) -> Tuple[List[Dict], List[float]]:
+    """Barras a dibujar (con sábado y domingo de relleno) y montos reales para el promedio
+    (textos en language, o en el idioma actual)
+    """
+    base_daily_data = []
+    for i, day_key in enumerate(days):
+        # Etiqueta visible: abreviatura del nombre traducido
+        if day_key in DAY_KEYS:
+            label_name = tr(day_key, language=language)[:3]
+        else:
+            label_name = tr(DAY_KEYS[i], language=language)[:3] if i < len(DAY_KEYS) else day_key[:3]
+        base_daily_data.append(_day_entry(label_name, amounts.get(day_key, 0), destinations.get(day_key, ''), language))
+
+    # Extender visualmente el gráfico como si tuviera sábado y domingo
+    daily_data = list(base_daily_data)
+    for day_key in ('saturday', 'sunday'):
+        if day_key not in days:
+            daily_data.append(_day_entry(tr(day_key, language=language)[:3], 0, '', language))
+    return daily_data, [d['amount'] for d in base_daily_data]
+
+
+def weekly_chart_data_from_model(data_model) -> Tuple[List[Dict], List[float]]:
+    """weekly_chart_data a partir de un TradingDataModelWithDB"""
+    return weekly_chart_data(getattr(data_model, 'days', []), data_model.daily_amounts, data_model.daily_destinations)
+
+
+class WeeklyBarChart:
+    """Barras diarias, etiquetas de valor, promedio y leyenda reutilizados entre actualizaciones"""
+
+    BAR_WIDTH = 0.6
+
+    def __init__(self, figure, colors: Optional[Dict] = None, blit: bool = False, language: Optional[str] = None):
+        self.figure = figure
+        self.blit = blit
+        # Idioma fijo de los textos (None = el idioma actual de la aplicación)
+        self.language = language
+        # Se guarda la referencia: los cambios de tema del widget se ven aquí
+        self.colors = colors if colors is not None else dict(DEFAULT_COLORS)
+        self.is_dark = False
+        self.legend_visible = True
+        self.legend_position = 'upper_right'
+        self.ax = None
+        self.bars = []
+        self.value_labels = []
+        self.legend = None
+        self._static_key = None
+        self._layout_key = None
+        self._layout_dirty = True
+        self._ylim = None
+        self._background = None
+        self._data_background = None  # Marco + datos, sin la capa de hover
+        self.data_key = None  # Huella de los datos dibujados (para cachés de renderizado)
+        self.hover_rows: List[Tuple[str, float, str, float]] = []  # (día, monto, destino, acumulado)
+
+    def _tr(self, key: str) -> str:
+        return tr(key, language=self.language)
+
+    def reset(self):
+        """Olvidar los artistas (p. ej. tras limpiar la figura desde fuera)"""
+        self.ax = None
+        self.bars = []
+        self.value_labels = []
+        self.legend = None
+        self._static_key = None
+        self._layout_dirty = True
+        self._ylim = None
+        self._background = None
+
+    def mark_layout_dirty(self):
+        self._layout_dirty = True
+
+    def dynamic_artists(self) -> List:
+        """Artistas que cambian con los datos (los únicos que se repintan al hacer blit)"""
+        if self.ax is None:
+            return []
+        return self.bars + self.value_labels + [self.avg_line, self.avg_text, self.total_text]
+
+    def overlay_artists(self) -> List:
+        """Cruz y tooltip del hover (nunca forman parte del dibujado normal)"""
+        if self.ax is None:
+            return []
+        return [self.cross_v, self.cross_h, self.tooltip]
+
+    def _build(self, n_bars: int):
+        """Crear los artistas una sola vez para n_bars barras"""
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+        x_positions = np.arange(n_bars)
+        container = ax.bar(x_positions, np.zeros(n_bars), self.BAR_WIDTH, color=self.colors['neutral'],
+                           alpha=0.8, edgecolor='white', linewidth=1.5)
+        self.bars = list(container.patches)
+        self.value_labels = [
+            ax.text(i, 0, '', ha='center', va='bottom', fontsize=9, fontweight='bold', visible=False,
+                    bbox=dict(boxstyle='round,pad=0.3', alpha=0.85))
+            for i in range(n_bars)
+        ]
+        ax.set_xticks(x_positions)
+        half = self.BAR_WIDTH / 2
+        margin = (n_bars - 1 + self.BAR_WIDTH) * rcParams['axes.xmargin']
+        ax.set_xlim(-half - margin, n_bars - 1 + half + margin)
+        ax.set_axisbelow(True)
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+
+        # Línea base en cero y línea de promedio semanal
+        self.zero_line = ax.axhline(y=0, linewidth=1, alpha=0.5)
+        self.avg_line = ax.axhline(0, linestyle='--', linewidth=1.5, alpha=0.8, visible=False)
+        self.avg_text = ax.text(0.99, 0.02, '', transform=ax.transAxes, ha='right', va='bottom', fontsize=9,
+                                visible=False,
+                                bbox=dict(boxstyle='round,pad=0.25', facecolor='white', alpha=0.7, edgecolor='none'))
+        # Subtítulo con total semanal
+        self.total_text = ax.text(0.01, 1.00, '', transform=ax.transAxes, ha='left', va='bottom', fontsize=10)
+        self.ax = ax
+        self.legend = None
+        self._static_key = None
+        self._ylim = None
+        self._background = None
+
+        # Capa de hover: cruz y tooltip, ocultos hasta que el cursor entra en el gráfico
+        self.cross_v = ax.axvline(0, linestyle=':', linewidth=0.8, alpha=0.8, visible=False)
+        self.cross_h = ax.axhline(0, linestyle=':', linewidth=0.8, alpha=0.8, visible=False)
+        self.tooltip = ax.annotate('', xy=(0, 0), xytext=(12, 12), textcoords='offset points', fontsize=9,
+                                   bbox=dict(boxstyle='round,pad=0.4', alpha=0.92), zorder=10, visible=False)
+        if self.blit:
+            # Fuera del dibujado normal: se pintan sobre el fondo guardado
+            for artist in self.dynamic_artists() + self.overlay_artists():
+                artist.set_animated(True)
+
+    def _apply_static(self, day_labels: List[str]):
+        """Textos, colores y leyenda: solo cambian con idioma, tema o ajustes de leyenda"""
+        key = (tuple(day_labels), self.language or i18n.current_language, self.is_dark, self.legend_visible,
+               self.legend_position, tuple(sorted(self.colors.items())))
+        if key == self._static_key:
+            return
+        ax, colors = self.ax, self.colors
+
+        self.figure.patch.set_facecolor(colors['background'])
+        ax.set_facecolor(colors['axes_background'])
+        ax.set_xlabel(self._tr('days_of_week_label'), fontsize=12, fontweight='bold', color=colors['text'])
+        ax.set_ylabel(self._tr('amount_axis_label'), fontsize=12, fontweight='bold', color=colors['text'])
+        # Título sin emoji para evitar advertencias de fuente
+        ax.set_title(self._tr('weekly_performance_title'), fontsize=16, fontweight='bold', color=colors['text'], pad=16)
+        ax.set_xticklabels(day_labels, fontsize=10, color=colors['text'])
+        ax.tick_params(colors=colors['text'])
+        ax.grid(True, axis='y', alpha=0.35, color=colors['grid'], linestyle='-', linewidth=0.8)
+        ax.spines['left'].set_color(colors['text'])
+        ax.spines['bottom'].set_color(colors['text'])
+
+        self.zero_line.set_color(colors['text'])
+        self.avg_line.set_color(colors['avg_line'])
+        self.avg_text.set_color(colors['avg_line'])
+        self.total_text.set_color(colors['text'])
+        for line in (self.cross_v, self.cross_h):
+            line.set_color(colors['text'])
+        self.tooltip.set_color(colors['text'])
+        self.tooltip.get_bbox_patch().set_facecolor(colors['axes_background'])
+        self.tooltip.get_bbox_patch().set_edgecolor(colors['grid'])
+        bbox_face = '#1e1e1e' if self.is_dark else 'white'
+        bbox_edge = '#2a2a2a' if self.is_dark else 'none'
+        for label in self.value_labels:
+            label.set_color(colors['text'])
+            label.get_bbox_patch().set_facecolor(bbox_face)
+            label.get_bbox_patch().set_edgecolor(bbox_edge)
+
+        self._build_legend()
+        self._static_key = key
+        self._layout_dirty = True
+
+    def _build_legend(self):
+        """Leyenda opcional y sin solapar barras"""
+        if self.legend is not None:
+            self.legend.remove()
+            self.legend = None
+        if not self.legend_visible:
+            return
+        legend_elements = [
+            patches.Patch(color=self.colors['reinvestment'], label=self._tr('legend_gain_reinvestment')),
+            patches.Patch(color=self.colors['withdrawal'], label=self._tr('legend_gain_withdrawal')),
+            patches.Patch(color=self.colors['negative'], label=self._tr('legend_loss')),
+            patches.Patch(color=self.colors['neutral'], label=self._tr('legend_neutral'))
+        ]
+        if self.legend_position == 'outside_right':
+            # Fuera del área del gráfico, a la derecha
+            self.legend = self.ax.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(1.02, 1),
+                                         frameon=True, fancybox=True, shadow=True, fontsize=9, borderaxespad=0.0)
+        elif self.legend_position == 'upper_center':
+            self.legend = self.ax.legend(handles=legend_elements, loc='upper center', bbox_to_anchor=(0.5, 1.12),
+                                         frameon=True, fancybox=True, shadow=True, fontsize=9, ncol=2)
+        else:  # 'upper_right' por defecto
+            self.legend = self.ax.legend(handles=legend_elements, loc='upper right',
+                                         frameon=True, fancybox=True, shadow=True, fontsize=9)
+
+    def _bar_color(self, data: Dict) -> str:
+        if data['amount'] < 0:
+            return self.colors['negative']
+        if data['amount'] == 0:
+            return self.colors['neutral']
+        if data.get('is_withdrawal'):
+            return self.colors['withdrawal']
+        if data.get('is_reinvestment'):
+            return self.colors['reinvestment']
+        return self.colors['positive']
+
+    def relayout(self):
+        """Recalcular márgenes (solo al cambiar textos, tamaño o ancho de las etiquetas del eje Y)"""
+        if self.ax is None:
+            return
+        try:
+            if self.legend_visible and self.legend_position == 'outside_right':
+                # Reducir el espacio del subplot para dejar sitio a la leyenda a la derecha
+                self.figure.tight_layout(rect=[0, 0, 0.82, 1])
+            else:
+                self.figure.tight_layout()
+        except Exception:
+            pass
+        self._layout_dirty = False
+        self._background = None
+
+    def update(self, daily_data: List[Dict], base_amounts: List[float], caption: Optional[str] = None) -> bool:
+        """Mutar los artistas existentes con los datos de la semana (no dibuja).
+        caption se antepone al total semanal (p. ej. la fecha de la semana al exportar).
+        Devuelve True si cambió el marco y hace falta un dibujado completo.
+        """
+        n_bars = len(daily_data)
+        if self.ax is None or n_bars != len(self.bars):
+            self._build(n_bars)
+        self._apply_static([d['day'] for d in daily_data])
+
+        amounts = np.array([d['amount'] for d in daily_data], dtype=float)
+        self.data_key = tuple((d['day'], d['amount'], self._bar_color(d)) for d in daily_data) + (len(base_amounts),)
+        running = np.cumsum(amounts)
+        self.hover_rows = [(d['day'], float(a), d['destination'], float(r))
+                           for d, a, r in zip(daily_data, amounts, running)]
+        up_offset = max(amounts.max(initial=0.0), 1.0) * 0.02
+        down_offset = (np.abs(amounts).max(initial=0.0) + 1) * 0.02
+        for bar, label, data, height in zip(self.bars, self.value_labels, daily_data, amounts):
+            bar.set_height(height)
+            bar.set_facecolor(self._bar_color(data))
+            if height == 0:  # Solo mostrar etiquetas para barras con valor
+                label.set_visible(False)
+                continue
+            if height > 0:
+                label.set_y(height + up_offset)
+                label.set_verticalalignment('bottom')
+            else:
+                label.set_y(height - down_offset)
+                label.set_verticalalignment('top')
+            label.set_text(f'${height:.0f}')
+            label.set_visible(True)
+
+        y_values = [0.0, amounts.min(initial=0.0), amounts.max(initial=0.0)]
+        if base_amounts:
+            avg = float(np.mean(base_amounts))
+            self.avg_line.set_ydata([avg, avg])
+            self.avg_text.set_text(f"{self._tr('average_label')} ${avg:.2f}")
+            y_values.append(avg)
+        self.avg_line.set_visible(bool(base_amounts))
+        self.avg_text.set_visible(bool(base_amounts))
+        total = f"{self._tr('total_week')} ${amounts.sum():.2f}"
+        self.total_text.set_text(f"{caption} · {total}" if caption else total)
+
+        # Límites del eje Y con espacio para las etiquetas (equivalente al autoscale anterior)
+        low, high = min(y_values), max(y_values)
+        if high == low:
+            low, high = low - 1.0, high + 1.0
+        margin = (high - low) * rcParams['axes.ymargin']
+        y_min, y_max = low - margin, high + margin
+        y_range = y_max - y_min
+        if y_min < 0:
+            self.ax.set_ylim(y_min - y_range * 0.1, y_max + y_range * 0.15)
+        else:
+            self.ax.set_ylim(y_min, y_max + y_range * 0.15)
+
+        # El ancho de las etiquetas del eje Y solo cambia con el número de cifras
+        layout_key = (len(f'{y_min:.0f}'), len(f'{y_max:.0f}'))
+        if layout_key != self._layout_key:
+            self._layout_key = layout_key
+            self._layout_dirty = True
+        if self._layout_dirty:
+            self.relayout()
+
+        ylim = self.ax.get_ylim()
+        if ylim != self._ylim:
+            self._ylim = ylim
+            self._background = None
+        return self._background is None
+
+    def capture_background(self, canvas):
+        """Tras un dibujado completo: guardar el fondo sin los artistas de datos y pintarlos encima"""
+        if not self.blit or self.ax is None:
+            return
+        self._background = canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_dynamic()
+        self._data_background = canvas.copy_from_bbox(self.figure.bbox)
+
+    def _draw_dynamic(self):
+        for artist in self.dynamic_artists():
+            self.figure.draw_artist(artist)
+
+    @property
+    def background(self):
+        """Fondo guardado (sin artistas de datos) del marco actual, o None"""
+        return self._background
+
+    def restore_render(self, canvas, image, background):
+        """Mostrar un renderizado cacheado del estado actual sin dibujar nada"""
+        self._background = background if self.blit else None
+        self._data_background = image
+        canvas.restore_region(image)
+        canvas.blit(self.figure.bbox)
+
+    def blit_update(self, canvas) -> bool:
+        """Repintar solo los artistas de datos sobre el fondo guardado. False si no hay fondo válido"""
+        if not self.blit or self._background is None:
+            return False
+        canvas.restore_region(self._background)
+        self._draw_dynamic()
+        self._data_background = canvas.copy_from_bbox(self.figure.bbox)
+        canvas.blit(self.figure.bbox)
+        return True
+
+    # ------------------------------------------------------------------
+    # Hover
+    # ------------------------------------------------------------------
+    def hit_test(self, x: float) -> int:
+        """Barra bajo la coordenada x (las barras están centradas en 0..n-1), o -1"""
+        index = int(np.floor(x + 0.5))
+        if 0 <= index < len(self.hover_rows) and abs(x - index) <= self.BAR_WIDTH / 2:
+            return index
+        return -1
+
+    def show_hover(self, canvas, x: float, y: float, text_for) -> bool:
+        """Pintar cruz y tooltip sobre el gráfico ya dibujado. text_for(fila) -> texto del tooltip"""
+        if not self.blit or self._background is None or self._data_background is None:
+            return False
+        self.cross_v.set_xdata([x, x])
+        self.cross_h.set_ydata([y, y])
+        self.cross_v.set_visible(True)
+        self.cross_h.set_visible(True)
+        index = self.hit_test(x)
+        if index >= 0:
+            _, amount, _, _ = self.hover_rows[index]
+            self.tooltip.xy = (index, max(amount, 0.0))
+            # En la mitad derecha el tooltip se abre hacia la izquierda para no salirse
+            right_half = index >= len(self.hover_rows) / 2
+            self.tooltip.set_position((-12, 12) if right_half else (12, 12))
+            self.tooltip.set_horizontalalignment('right' if right_half else 'left')
+            self.tooltip.set_text(text_for(self.hover_rows[index]))
+        self.tooltip.set_visible(index >= 0)
+
+        canvas.restore_region(self._data_background)
+        for artist in self.overlay_artists():
+            if artist.get_visible():
+                self.figure.draw_artist(artist)
+        canvas.blit(self.figure.bbox)
+        return True
+
+    def hide_hover(self, canvas):
+        """Quitar la capa de hover restaurando el gráfico sin ella"""
+        for artist in self.overlay_artists():
+            artist.set_visible(False)
+        if self.blit and self._background is not None and self._data_background is not None:
+            canvas.restore_region(self._data_background)
+            canvas.blit(self.figure.bbox)
@@ -1,189 +1,248 @@
 """
 Sistema de consejos diarios y resumen semanal con soporte i18n.
+Los consejos salen de una tabla declarativa de reglas (día, signo de la semana,
+racha, estado de drawdown) que se compila una sola vez en una tabla de búsqueda
+de claves de traducción; generar un consejo es una consulta al diccionario más
+la traducción y el formateo de sus líneas.
 """
 
+import threading
 from datetime import datetime
-from .i18n import tr, current_language
-
-def get_daily_advice(model):
-    """Obtener consejo del día basado en el día actual y el rendimiento.
+from itertools import product
+from typing import Dict, Optional, Tuple
+from . import i18n
+from .i18n import tr
+from ..models.withdrawal_policy import get_withdrawal_policy
+
+ANY = '*'
+WEEKDAYS = range(7)                      # 0=Lunes ... 6=Domingo
+SIGNS = ('pos', 'neg', 'flat')           # resultado de la semana en curso
+STREAKS = ('win', 'loss', 'none')        # racha diaria del historial (3+ días)
+DRAWDOWNS = ('deep', 'mild', 'none')     # capital bajo su máximo (>=10% / >=3%)
+
+NOT_UP = ('neg', 'flat')
+
+# Reglas: (día, signo, racha, drawdown, claves de i18n de las líneas). ANY o una tupla de
+# valores admitidos. Todas las reglas que coinciden se concatenan en el orden de la tabla.
+# Los textos están en i18n.TRANSLATIONS; las líneas cuyos campos no estén disponibles
+# (p. ej. sin historial) se omiten al formatear.
+ADVICE_RULES = (
+    # --- Lunes ---
+    (0, ANY, ANY, ANY, ('advice_monday_1', 'advice_monday_2', 'advice_monday_3')),
+    (0, 'pos', ANY, ANY, ('advice_monday_4',)),
+    (0, NOT_UP, ANY, ANY, ('advice_monday_5',)),
+    # --- Martes ---
+    (1, ANY, ANY, ANY, ('advice_tuesday_1', 'advice_tuesday_2')),
+    (1, 'pos', ANY, ANY, ('advice_tuesday_3',)),
+    (1, NOT_UP, ANY, ANY, ('advice_tuesday_4',)),
+    # --- Miércoles ---
+    (2, ANY, ANY, ANY, ('advice_wednesday_1',)),
+    (2, 'pos', ANY, ANY, ('advice_wednesday_2',)),
+    (2, NOT_UP, ANY, ANY, ('advice_wednesday_3',)),
+    (2, ANY, ANY, ANY, ('advice_wednesday_4', 'advice_wednesday_5')),
+    # --- Jueves ---
+    (3, ANY, ANY, ANY, ('advice_thursday_1', 'advice_thursday_2', 'advice_thursday_3', 'advice_thursday_4')),
+    # --- Viernes ---
+    (4, ANY, ANY, ANY, ('advice_friday_1', 'advice_friday_2')),
+    (4, 'pos', ANY, ANY, ('advice_friday_3',)),
+    (4, NOT_UP, ANY, ANY, ('advice_friday_4',)),
+    (4, ANY, ANY, ANY, ('advice_friday_5',)),
+    # --- Sábado ---
+    (5, ANY, ANY, ANY, ('advice_saturday_1', 'advice_saturday_2', 'advice_saturday_3', 'advice_saturday_4')),
+    (5, 'pos', ANY, ANY, ('advice_saturday_5',)),
+    (5, NOT_UP, ANY, ANY, ('advice_saturday_6',)),
+    (5, ANY, ANY, ANY, ('advice_saturday_7',)),
+    # --- Domingo ---
+    (6, ANY, ANY, ANY, ('advice_sunday_1', 'advice_sunday_2', 'advice_sunday_3', 'advice_sunday_4')),
+    # --- Historial: día de la semana (solo días de operación) ---
+    ((0, 1, 2, 3, 4), ANY, ANY, ANY, ('advice_weekday_1',)),
+    # --- Historial: rachas ---
+    (ANY, ANY, 'win', ANY, ('advice_streak_win_1',)),
+    (ANY, ANY, 'loss', ANY, ('advice_streak_loss_1',)),
+    # --- Historial: drawdown ---
+    (ANY, ANY, ANY, 'deep', ('advice_drawdown_deep_1',)),
+    (ANY, ANY, ANY, 'mild', ('advice_drawdown_mild_1',)),
+)
+
+
+def _matches(rule_value, value) -> bool:
+    if rule_value == ANY:
+        return True
+    if isinstance(rule_value, tuple):
+        return value in rule_value
+    return rule_value == value
+
+
+def compile_advice_rules(rules=ADVICE_RULES) -> Dict[Tuple, Tuple[str, ...]]:
+    """Compilar la tabla de reglas en un diccionario (día, signo, racha, drawdown) -> claves de las líneas"""
+    table = {}
+    for key in product(WEEKDAYS, SIGNS, STREAKS, DRAWDOWNS):
+        lines = []
+        for *conditions, rule_lines in rules:
+            if all(_matches(c, v) for c, v in zip(conditions, key)):
+                lines.extend(rule_lines)
+        table[key] = tuple(lines)
+    return table
+
+
+# Compilada una sola vez al importar el módulo
+ADVICE_TABLE = compile_advice_rules()
+
+DAY_KEYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+MODEL_DAYS = ['Lunes', 'Martes', 'Miércoles', 'Jueves', 'Viernes']
+
+
+def _streak_state(streak: int) -> str:
+    if streak >= 3:
+        return 'win'
+    if streak <= -3:
+        return 'loss'
+    return 'none'
+
+
+def _drawdown_state(drawdown: float) -> str:
+    if drawdown >= 0.10:
+        return 'deep'
+    if drawdown >= 0.03:
+        return 'mild'
+    return 'none'
+
+
+def _format_lines(keys, params: Dict, language: str) -> str:
+    """Traducir y formatear las líneas, omitiendo las que requieren datos no disponibles"""
+    out = []
+    for key in keys:
+        try:
+            out.append(tr(key, language=language).format(**params))
+        except (KeyError, ValueError):
+            continue
+    return "\n".join(out)
+
+
+def advice_snapshot(model, history_metrics: Optional[Dict] = None,
+                    weekday_stats: Optional[Dict] = None, today: Optional[datetime] = None) -> Dict:
+    """Copia de todo lo que el consejo lee del modelo; se toma en el hilo de la UI
+    para que el worker no lea el modelo mientras se edita.
+    """
+    today = today or datetime.now()
+    if history_metrics is None and hasattr(model, 'get_risk_metrics'):
+        history_metrics = model.get_risk_metrics()
+    if weekday_stats is None and hasattr(model, 'get_weekday_stats'):
+        weekday_stats = model.get_weekday_stats()
+    saturday = today.weekday() == 5
+    return {
+        'today': today,
+        'total': model.get_total_profit_loss(),
+        'percentage': model.get_profit_loss_percentage(),
+        'initial': model.initial_capital,
+        'balance': model.get_current_balance(),
+        # El retiro solo se muestra los sábados
+        'withdraw': model.get_recommended_withdrawal() if saturday else 0.0,
+        'rate_label': get_withdrawal_policy().label(),
+        'history_metrics': dict(history_metrics or {}),
+        'weekday_stats': weekday_stats or {},
+    }
+
+
+def get_daily_advice(model, history_metrics: Optional[Dict] = None,
+                     weekday_stats: Optional[Dict] = None, today: Optional[datetime] = None):
+    """Obtener consejo del día basado en el día actual, el rendimiento y el historial.
     Devuelve un dict con 'title' y 'message'.
     """
-    today_idx = datetime.now().weekday()  # 0=Lunes ... 6=Domingo
-    total = model.get_total_profit_loss()
-    percentage = model.get_profit_loss_percentage()
-    initial = model.initial_capital
-    balance = model.get_current_balance()
-
-    positive = total > 0
-
-    # Nombre del día según idioma
-    day_keys = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-    day = tr(day_keys[today_idx])
+    return advice_from_snapshot(advice_snapshot(model, history_metrics, weekday_stats, today))
+
+
+def advice_from_snapshot(snapshot: Dict) -> Dict:
+    """Consejo del día a partir de una copia de advice_snapshot (no toca el modelo)"""
+    today_idx = snapshot['today'].weekday()  # 0=Lunes ... 6=Domingo
+    total = snapshot['total']
+    percentage = snapshot['percentage']
+    initial = snapshot['initial']
+    balance = snapshot['balance']
+    history_metrics = snapshot['history_metrics']
+    weekday_stats = snapshot['weekday_stats']
+
+    streak = int(history_metrics.get('current_streak', 0) or 0)
+    drawdown = float(history_metrics.get('current_drawdown', 0.0) or 0.0)
+    sign = 'pos' if total > 0 else ('neg' if total < 0 else 'flat')
+    language = i18n.current_language
+    lines = ADVICE_TABLE[(today_idx, sign, _streak_state(streak), _drawdown_state(drawdown))]
+
+    day = tr(DAY_KEYS[today_idx], language=language)
+    params = {'day': day, 'total': total, 'streak': abs(streak), 'drawdown': drawdown * 100}
+    if today_idx == 5:
+        withdraw = snapshot['withdraw']
+        params.update(withdraw=withdraw, reinvest=max(0.0, total) - withdraw,
+                      rate_label=snapshot['rate_label'])
+    if today_idx < len(MODEL_DAYS) and weekday_stats:
+        day_stats = weekday_stats.get('days', {}).get(MODEL_DAYS[today_idx])
+        if day_stats and day_stats['traded'] >= 4:
+            params.update(day_mean=day_stats['mean'], day_hit=day_stats['hit_rate'] * 100)
 
     # Línea base con métricas clave
     base = (
-        f"{tr('capital_initial')} ${initial:.2f} | "
-        f"{tr('current_balance')} ${balance:.2f} | "
-        f"{tr('total_profit_loss')} ${total:.2f} ({percentage:.2f}%)"
+        f"{tr('capital_initial', language=language)} ${initial:.2f} | "
+        f"{tr('current_balance', language=language)} ${balance:.2f} | "
+        f"{tr('total_profit_loss', language=language)} ${total:.2f} ({percentage:.2f}%)"
     )
+    return {"title": f"{tr('daily_advice_title', language=language)} - {day}",
+            "message": f"{base}\n\n{_format_lines(lines, params, language)}"}
 
-    if today_idx == 0:  # Lunes / Monday
-        if current_language == 'es':
-            msg = (
-                "Arranca la semana con foco y energía 💪. Define 1-2 objetivos reales y planifica tus operaciones clave.\n"
-                "• Revisa capital y riesgos antes de operar.\n"
-                "• Calidad sobre cantidad: evita sobreoperar.\n"
-                f"• {('Buen inicio, disciplina y pasos firmes 🚀' if positive else 'Si el inicio es flojo, sé selectivo y reduce tamaño 🧠')}"
-            )
-        else:
-            msg = (
-                "Kick off the week with focus and energy 💪. Set 1–2 realistic goals and plan core trades.\n"
-                "• Review capital and risks before trading.\n"
-                "• Quality over quantity: avoid overtrading.\n"
-                f"• {('Strong start—discipline and steady steps 🚀' if positive else 'If the start is weak, be selective and cut size 🧠')}"
-            )
-        return {"title": f"{tr('daily_advice_title')} - {day}", "message": f"{base}\n\n{msg}"}
-
-    if today_idx == 1:  # Martes / Tuesday
-        if current_language == 'es':
-            msg = (
-                "Consolida el momentum: busca confirmaciones, no persigas entradas tardías.\n"
-                "• Ajusta stops a estructura real, no a números redondos.\n"
-                f"• {('Protege ganancias y cuida tu ventaja 🎯' if positive else 'Minimiza pérdidas y espera setups A+ 🧩')}"
-            )
-        else:
-            msg = (
-                "Consolidate momentum: seek confirmations, avoid chasing late entries.\n"
-                "• Set stops to real structure, not round numbers.\n"
-                f"• {('Protect gains and guard your edge 🎯' if positive else 'Minimize losses and wait for A+ setups 🧩')}"
-            )
-        return {"title": f"{tr('daily_advice_title')} - {day}", "message": f"{base}\n\n{msg}"}
-
-    if today_idx == 2:  # Miércoles / Wednesday
-        if current_language == 'es':
-            msg = (
-                "Mitad de semana: evalúa progreso y ajusta el rumbo.\n"
-                "• Si vas bien, evita el exceso de confianza.\n"
-                "• Si vas mal, simplifica y baja exposición.\n"
-                "• Recuerda: consistencia > perfección ✅"
-            )
-        else:
-            msg = (
-                "Midweek: assess progress and adjust course.\n"
-                "• If you’re doing well, avoid overconfidence.\n"
-                "• If you’re not, simplify and reduce exposure.\n"
-                "• Remember: consistency > perfection ✅"
-            )
-        return {"title": f"{tr('daily_advice_title')} - {day}", "message": f"{base}\n\n{msg}"}
-
-    if today_idx == 3:  # Jueves / Thursday
-        if current_language == 'es':
-            msg = (
-                "Prepara el cierre semanal. Sé selectivo y evita forzar trades.\n"
-                "• Prioriza setups con confluencias claras.\n"
-                "• No persigas recuperaciones a última hora.\n"
-                "• Mantén la mente fría: el viernes debe encontrarte listo 🧊"
-            )
-        else:
-            msg = (
-                "Prepare the weekly close. Be selective and avoid forcing trades.\n"
-                "• Prioritize setups with clear confluences.\n"
-                "• Don’t chase last-minute recoveries.\n"
-                "• Keep a cool head: be ready for Friday 🧊"
-            )
-        return {"title": f"{tr('daily_advice_title')} - {day}", "message": f"{base}\n\n{msg}"}
-
-    if today_idx == 4:  # Viernes / Friday
-        if current_language == 'es':
-            msg = (
-                "Cierra la semana con cabeza fría.\n"
-                "• No arriesgues ganancias consolidadas.\n"
-                "• Documenta aprendizajes clave para el sábado.\n"
-                "• Termina fuerte y sin ansiedad 🏁"
-            )
-        else:
-            msg = (
-                "Close the week with a cool head.\n"
-                "• Don’t risk consolidated gains.\n"
-                "• Document key learnings for Saturday.\n"
-                "• Finish strong, without anxiety 🏁"
-            )
-        return {"title": f"{tr('daily_advice_title')} - {day}", "message": f"{base}\n\n{msg}"}
-
-    if today_idx == 5:  # Sábado / Saturday
-        withdraw = max(0.0, total) * 0.30
-        reinvest = max(0.0, total) - withdraw
-        if current_language == 'es':
-            msg = (
-                "Día de promedio semanal y retiros.\n"
-                f"• Resultado semanal: ${total:.2f}.\n"
-                f"• Retiro recomendado: ${withdraw:.2f} (30% de las ganancias).\n"
-                f"• Reinversión sugerida: ${reinvest:.2f}.\n"
-                f"• {('¡Semana ganadora! Felicitaciones 👏' if positive else 'Semana en rojo: revisa, aprende y ajusta 📘')}\n"
-                "• Celebra el proceso: progreso sostenido > impulsos 🔁"
-            )
-        else:
-            msg = (
-                "Weekly average and withdrawals day.\n"
-                f"• Weekly result: ${total:.2f}.\n"
-                f"• Recommended withdrawal: ${withdraw:.2f} (30% of gains).\n"
-                f"• Suggested reinvestment: ${reinvest:.2f}.\n"
-                f"• {('Winning week! Congrats 👏' if positive else 'Red week: review, learn, and adjust 📘')}\n"
-                "• Celebrate the process: sustained progress > impulses 🔁"
-            )
-        return {"title": f"{tr('daily_advice_title')} - {day}", "message": f"{base}\n\n{msg}"}
-
-    # Domingo / Sunday
-    if current_language == 'es':
-        msg = (
-            "Descansa y prepara la estrategia de la próxima semana.\n"
-            "• Revisa diarios y marcas clave.\n"
-            "• Planifica escenarios y tus límites.\n"
-            "• Recarga la mente: claridad trae oportunidades 🌤️"
-        )
-    else:
-        msg = (
-            "Rest and prepare next week's strategy.\n"
-            "• Review journals and key levels.\n"
-            "• Plan scenarios and your limits.\n"
-            "• Reset your mind: clarity brings opportunities 🌤️"
-        )
-    return {"title": f"{tr('daily_advice_title')} - {day}", "message": f"{base}\n\n{msg}"}
+
+class AdviceCache:
+    """Último consejo generado; se sirve tal cual mientras no cambien sus entradas
+    (fecha, idioma, resultado de la semana, racha, drawdown, estadísticas del día
+    de hoy en el historial y política de retiro).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key = None
+        self._advice = None
+
+    @staticmethod
+    def _key_for(snapshot: Dict) -> Tuple:
+        metrics = snapshot['history_metrics']
+        today_idx = snapshot['today'].weekday()
+        day_stats = ()
+        if today_idx < len(MODEL_DAYS):
+            stats = (snapshot['weekday_stats'] or {}).get('days', {}).get(MODEL_DAYS[today_idx])
+            if stats:
+                day_stats = (stats['traded'], round(stats['mean'], 2), round(stats['hit_rate'], 3))
+        return (snapshot['today'].date(), i18n.current_language, day_stats,
+                round(snapshot['total'], 2), round(snapshot['initial'], 2), round(snapshot['withdraw'], 2),
+                int(metrics.get('current_streak', 0) or 0),
+                round(float(metrics.get('current_drawdown', 0.0) or 0.0), 3),
+                snapshot['rate_label'])
+
+    def get(self, snapshot: Dict) -> Dict:
+        """Consejo para una copia de advice_snapshot (seguro desde cualquier hilo)"""
+        key = self._key_for(snapshot)
+        with self._lock:
+            if key == self._key and self._advice is not None:
+                return self._advice
+        advice = advice_from_snapshot(snapshot)
+        with self._lock:
+            self._key, self._advice = key, advice
+        return advice
+
+    def clear(self):
+        """Invalidar (p. ej. al cambiar de día)"""
+        with self._lock:
+            self._key, self._advice = None, None
 
 
 def get_weekly_summary_message(model):
     """Construir mensaje de resumen semanal con sugerencia de retiro y reinversión."""
     total = model.get_total_profit_loss()
-    percentage = model.get_profit_loss_percentage()
-    initial = model.initial_capital
-    balance = model.get_current_balance()
-    withdraw = max(0.0, total) * 0.30
-    reinvest = max(0.0, total) - withdraw
-
-    if total >= 0:
-        headline = ("¡Semana de ganancias! 🎉" if current_language == 'es' else "Profitable week! 🎉")
-    else:
-        headline = ("Semana desafiante 💡" if current_language == 'es' else "Challenging week 💡")
-
-    if current_language == 'es':
-        message = (
-            f"{headline}\n\n"
-            f"Capital inicial: ${initial:.2f}\n"
-            f"Balance actual: ${balance:.2f}\n"
-            f"Resultado semanal: ${total:.2f} ({percentage:.2f}%)\n\n"
-            f"Retiro recomendado (30%): ${withdraw:.2f}\n"
-            f"Reinversión sugerida: ${reinvest:.2f}\n"
-            "\nConsejo: documenta tus mejores y peores operaciones para aprender rápido."
-        )
-    else:
-        message = (
-            f"{headline}\n\n"
-            f"Initial capital: ${initial:.2f}\n"
-            f"Current balance: ${balance:.2f}\n"
-            f"Weekly result: ${total:.2f} ({percentage:.2f}%)\n\n"
-            f"Recommended withdrawal (30%): ${withdraw:.2f}\n"
-            f"Suggested reinvestment: ${reinvest:.2f}\n"
-            "\nTip: document your best and worst trades to learn faster."
-        )
-    return message
\ No newline at end of file
+    withdraw = model.get_recommended_withdrawal()
+    return tr('weekly_summary_body').format(
+        headline=tr('weekly_summary_headline_up') if total >= 0 else tr('weekly_summary_headline_down'),
+        initial=model.initial_capital,
+        balance=model.get_current_balance(),
+        total=total,
+        percentage=model.get_profit_loss_percentage(),
+        withdraw=withdraw,
+        reinvest=max(0.0, total) - withdraw,
+        rate_label=get_withdrawal_policy().label(),
+    )
@@ -0,0 +1,143 @@
+"""
+Exportación por lotes de los gráficos semanales
+Renderiza el gráfico de barras de cada semana guardada (o de un rango) a PNG o
+SVG con Agg, sin interfaz, repartiendo bloques de semanas en un pool de
+procesos: cada proceso crea una sola figura (en el inicializador del pool) y
+la reutiliza para todas sus semanas. Al terminar escribe un índice HTML con
+todas las imágenes.
+
+El renderizado nunca se hace en el proceso de la interfaz: los procesos se
+arrancan con 'spawn' (no fork de un proceso Qt con hilos), el estilo se aplica
+dentro de matplotlib.rc_context y los textos se piden en el idioma indicado,
+sin tocar rcParams ni el idioma de la aplicación.
+"""
+
+import html
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.image import imsave
+
+from src.models.history import HISTORY_DAYS
+from src.models.weekday_analytics import DEFAULT_DESTINATIONS
+from src.ui.weekly_bar_chart import (WeeklyBarChart, apply_chart_style, apply_theme_rcparams, chart_colors,
+                                     weekly_chart_data)
+from src.utils import i18n
+from src.utils.i18n import tr
+
+EXPORT_FORMATS = ('png', 'svg')
+INDEX_FILENAME = 'index.html'
+# Compresión PNG rápida: el tamaño apenas cambia en gráficos de colores planos
+PNG_COMPRESS_LEVEL = 1
+
+
+def chart_filename(week_start_date: str, fmt: str) -> str:
+    return f"semana_{week_start_date}.{fmt}"
+
+
+# Estado de cada proceso del pool (lo crea _init_worker una sola vez por proceso)
+_worker = None
+
+
+def _init_worker(language: str, is_dark: bool, size: Tuple[float, float], dpi: int):
+    """Inicializador del pool: la figura, el canvas y los artistas del proceso"""
+    global _worker
+    with matplotlib.rc_context():
+        apply_chart_style()
+        apply_theme_rcparams(is_dark)
+        figure = Figure(figsize=size, dpi=dpi)
+    canvas = FigureCanvasAgg(figure)
+    chart = WeeklyBarChart(figure, chart_colors(is_dark), language=language)
+    chart.is_dark = is_dark
+    _worker = {'figure': figure, 'canvas': canvas, 'chart': chart, 'language': language,
+               'is_dark': is_dark, 'dpi': dpi}
+
+
+def _render_chunk(rows: List[tuple], out_dir: str, fmt: str) -> List[tuple]:
+    """Trabajo de un proceso del pool: un bloque de semanas sobre la figura del proceso.
+    Devuelve (semana, archivo o None, total) por semana.
+    """
+    figure, canvas, chart = _worker['figure'], _worker['canvas'], _worker['chart']
+    language, dpi = _worker['language'], _worker['dpi']
+    results = []
+    # Estilo y tema solo dentro del contexto: los artistas se crean y se dibujan con él
+    with matplotlib.rc_context():
+        apply_chart_style()
+        apply_theme_rcparams(_worker['is_dark'])
+        for row in rows:
+            week_start_date = row[0]
+            amounts = {day: float(value or 0.0) for day, value in zip(HISTORY_DAYS, row[1:6])}
+            total = sum(amounts.values())
+            try:
+                daily_data, base_amounts = weekly_chart_data(HISTORY_DAYS, amounts, DEFAULT_DESTINATIONS, language)
+                chart.update(daily_data, base_amounts, caption=week_start_date)
+                filename = chart_filename(week_start_date, fmt)
+                path = os.path.join(out_dir, filename)
+                if fmt == 'png':
+                    # Un solo dibujado Agg y el búfer directo al PNG (savefig dibujaría dos veces)
+                    canvas.draw()
+                    imsave(path, np.asarray(canvas.buffer_rgba()), format='png', dpi=dpi,
+                           pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
+                else:
+                    figure.savefig(path, format=fmt, facecolor=figure.get_facecolor())
+                results.append((week_start_date, filename, total))
+            except Exception as e:
+                print(f"Error al exportar el gráfico de la semana {week_start_date}: {e}")
+                results.append((week_start_date, None, total))
+    return results
+
+
+def write_index(out_dir: str, results: List[tuple], language: str) -> str:
+    """Índice HTML con una fila por semana (fecha, total e imagen)"""
+    def text(key: str) -> str:
+        return html.escape(tr(key, language=language))
+
+    title = text('chart_export_index_title')
+    lines = ['<!DOCTYPE html>', '<html><head><meta charset="utf-8">', f'<title>{title}</title>',
+             '<style>body{font-family:sans-serif} td{padding:4px 12px;vertical-align:top}'
+             ' img{width:600px}</style>', f'</head><body><h1>{title}</h1><table>',
+             f"<tr><th>{text('chart_export_week')}</th><th>{text('total_week')}</th><th></th></tr>"]
+    for week_start_date, filename, total in results:
+        image = (f'<a href="{html.escape(filename)}"><img src="{html.escape(filename)}" loading="lazy"></a>'
+                 if filename else text('chart_export_failed'))
+        lines.append(f'<tr><td>{html.escape(week_start_date)}</td><td>${total:,.2f}</td><td>{image}</td></tr>')
+    lines.append('</table></body></html>')
+    path = os.path.join(out_dir, INDEX_FILENAME)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines))
+    return path
+
+
+def export_week_charts(db_manager, out_dir: str, fmt: str = 'png', start_date: Optional[str] = None,
+                       end_date: Optional[str] = None, workers: Optional[int] = None, chunk_size: int = 26,
+                       language: Optional[str] = None, is_dark: bool = False,
+                       size: Tuple[float, float] = (12, 6), dpi: int = 100) -> Dict:
+    """Exportar el gráfico de cada semana guardada (o del rango) a out_dir.
+    Devuelve {'total', 'exported', 'failed', 'index'}.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Formato no soportado: {fmt}")
+    language = language or i18n.current_language
+    os.makedirs(out_dir, exist_ok=True)
+    rows = db_manager.get_history_rows(start_date, end_date)
+
+    chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+    chunk_results = []
+    if chunks:
+        # Siempre fuera del proceso de la interfaz, aunque sea un solo bloque
+        workers = max(1, min(workers or os.cpu_count() or 1, len(chunks)))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_worker, initargs=(language, is_dark, size, dpi)) as executor:
+            chunk_results = list(executor.map(_render_chunk, chunks, [out_dir] * len(chunks),
+                                              [fmt] * len(chunks)))
+
+    results = [result for chunk in chunk_results for result in chunk]
+    exported = sum(1 for _, filename, _ in results if filename)
+    return {'total': len(rows), 'exported': exported, 'failed': len(results) - exported,
+            'index': write_index(out_dir, results, language)}
@@ -0,0 +1,69 @@
+"""
+Reducción de series temporales para dibujar
+Agregación por nivel de detalle (día, semana, mes) y LTTB (Largest Triangle
+Three Buckets) para no enviar al gráfico más puntos que píxeles.
+"""
+
+from typing import Tuple
+import numpy as np
+
+LOD_LEVELS = ('day', 'week', 'month')
+
+
+def aggregate_last(dates, values, level: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Último valor de cada periodo (day/week/month). dates en datetime64[D] ordenadas"""
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    values = np.asarray(values, dtype=float)
+    if level == 'day' or dates.size == 0:
+        return dates, values
+    if level == 'week':
+        # Semanas ISO empezando en lunes (1970-01-01 fue jueves)
+        periods = (dates.astype('int64') + 3) // 7
+    elif level == 'month':
+        periods = dates.astype('datetime64[M]').astype('int64')
+    else:
+        raise ValueError(f"Nivel de detalle desconocido: {level}")
+    # Índice del último elemento de cada periodo
+    last = np.flatnonzero(np.append(periods[1:] != periods[:-1], True))
+    return dates[last], values[last]
+
+
+def lttb(x, y, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Reducir (x, y) a n_out puntos conservando la forma visual (LTTB)"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = x.size
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    # Cubetas interiores (el primer y último punto se conservan siempre)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    # Promedio de cada cubeta con sumas acumuladas (una sola pasada)
+    cx = np.concatenate(([0.0], np.cumsum(x)))
+    cy = np.concatenate(([0.0], np.cumsum(y)))
+    counts = np.maximum(edges[1:] - edges[:-1], 1)
+    avg_x = (cx[edges[1:]] - cx[edges[:-1]]) / counts
+    avg_y = (cy[edges[1:]] - cy[edges[:-1]]) / counts
+    avg_x = np.append(avg_x, x[-1])
+    avg_y = np.append(avg_y, y[-1])
+
+    selected = np.empty(n_out, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], max(edges[i + 1], edges[i] + 1)
+        bx, by = x[start:end], y[start:end]
+        # Área del triángulo (punto elegido anterior, candidato, promedio de la siguiente cubeta)
+        area = np.abs((x[prev] - avg_x[i + 1]) * (by - y[prev]) - (x[prev] - bx) * (avg_y[i + 1] - y[prev]))
+        prev = start + int(area.argmax())
+        selected[i + 1] = prev
+    return x[selected], y[selected]
+
+
+def choose_level(span_days: float, max_points: int) -> str:
+    """Nivel de detalle más fino cuya cantidad de puntos visibles cabe en max_points"""
+    if span_days <= max_points:
+        return 'day'
+    if span_days / 7.0 <= max_points:
+        return 'week'
+    return 'month'
@@ -15,6 +15,7 @@ from PyQt5.QtWidgets import QFileDialog, QMessageBox
 from PyQt5.QtCore import QObject, pyqtSignal
 import xlsxwriter
 from .i18n import tr
+from .metrics_format import risk_metric_rows
 
 
 class ExportManager(QObject):
@@ -295,6 +296,15 @@ class ExportManager(QObject):
                 summary_sheet.write(dr, 1, total, money_format)
                 dr += 1
 
+            # Métricas de riesgo del historial (columnas D-E)
+            risk_rows = risk_metric_rows(data.get('risk_metrics') or {})
+            if risk_rows:
+                summary_sheet.write(2, 3, tr('risk_metrics_title'), kpi_label)
+                for offset, (label, value) in enumerate(risk_rows, start=3):
+                    summary_sheet.write(offset, 3, label, border_format)
+                    summary_sheet.write(offset, 4, value, border_format)
+                summary_sheet.set_column(3, 4, 28)
+
             # Hoja de gráficos
             chart_sheet = workbook.add_worksheet('Gráficos' if tr('monday') == 'Lunes' else 'Charts')
             chart_sheet.write(0, 0, tr('day_column'), header_format)
@@ -390,6 +400,14 @@ class ExportManager(QObject):
                 f.write(f'Días Negativos,{data.get("negative_days", 0)}\n')
                 f.write(f'Total Retiros,{data.get("total_withdrawals", 0)}\n')
                 f.write(f'Total Reinvertido,{data.get("total_reinvestment", 0)}\n')
+
+                # Métricas de riesgo del historial
+                risk_rows = risk_metric_rows(data.get('risk_metrics') or {})
+                if risk_rows:
+                    f.write('\n')
+                    f.write('METRICAS DE RIESGO\n')
+                    for label, value in risk_rows:
+                        f.write(f'"{label}","{value}"\n')
             
             return True
             
@@ -201,7 +201,199 @@ TRANSLATIONS = {
         "confirm_delete_week_message": "¿Desea borrar la semana seleccionada?",
         "week_label": "Semana",
         "delete_success": "Semana borrada correctamente",
-        "delete_error": "Error al borrar la semana"
+        "delete_error": "Error al borrar la semana",
+        
+        # Proyección de capital
+        "weekly_chart_tab": "📊 Semana",
+        "projection_tab": "🔮 Proyección",
+        "projection_title": "Proyección de capital (Monte Carlo)",
+        "projection_weeks_label": "Semanas a proyectar:",
+        "projection_run": "Calcular proyección",
+        "projection_weeks_axis": "Semanas",
+        "projection_loss_probability": "Probabilidad de terminar por debajo del capital actual:",
+        
+        # Métricas de riesgo
+        "risk_metrics_title": "📉 Métricas de riesgo (historial)",
+        "risk_max_drawdown": "Drawdown máximo:",
+        "risk_current_drawdown": "Drawdown actual:",
+        "risk_drawdown_duration": "Duración máx. bajo el máximo:",
+        "risk_rolling_returns": "Rendimiento 4/13/52 sem.:",
+        "risk_volatility": "Volatilidad anualizada:",
+        "risk_sharpe": "Sharpe:",
+        "risk_sortino": "Sortino:",
+        "risk_win_rate": "Tasa de acierto diaria:",
+        "risk_profit_factor": "Profit factor:",
+        "risk_streak": "Racha actual:",
+        "risk_max_streaks": "Mejor / peor racha:",
+        "risk_weeks_unit": "sem.",
+        "risk_days_unit": "días",
+        "not_available": "n/d",
+        
+        # Detección de anomalías
+        "anomaly_warning": "Montos atípicos (¿error de captura?):",
+        "anomaly_tooltip": "Monto atípico para este día: {score:.1f} desviaciones de lo habitual",
+        
+        # Pronóstico
+        "forecast_title": "Pronóstico (rango 90%)",
+        "forecast_next_day": "Próximo día:",
+        "forecast_next_week": "Próximos 5 días:",
+        
+        # Regímenes semanales
+        "regime_current": "Tipo de semana: {regime} ({weeks} semanas similares)",
+        "regime_steady_gain": "ganancia estable",
+        "regime_volatile_gain": "ganancia volátil",
+        "regime_flat": "lateral",
+        "regime_volatile_loss": "pérdida volátil",
+        
+        # Análisis por lotes
+        "batch_analysis": "📚 Analizar todas las semanas",
+        "status_batch_analysis": "Analizar todas las semanas guardadas (solo las que cambiaron)",
+        "batch_analysis_running": "Analizando semanas guardadas...",
+        "batch_analysis_done": "Análisis por lotes completado",
+        "batch_analysis_result": "Semanas en la base de datos: {total}\nAnalizadas: {analyzed}\nSin cambios (omitidas): {skipped}",
+        
+        # Historial de saldo
+        "history_tab": "📈 Historial",
+        "history_title": "Saldo acumulado del historial",
+        "history_date_axis": "Fecha",
+        "history_lod_info": "Nivel de detalle: {level} · {points} de {total} puntos",
+        "history_empty": "No hay semanas guardadas",
+        "lod_day": "día",
+        "lod_week": "semana",
+        "lod_month": "mes",
+        
+        # Mapa de calor de calendario
+        "heatmap_tab": "🗓️ Calendario",
+        "heatmap_title": "Resultado diario por calendario",
+        "heatmap_years_label": "Años:",
+        "heatmap_no_data": "sin datos",
+        
+        # Caché de renderizado
+        "render_cache_status": "Caché de gráficos: {entries} imágenes, {used:.1f} de {limit:.0f} MB (aciertos {hit_rate:.0f}%)",
+        
+        # Backends de gráficos
+        "lod_auto": "automático",
+        
+        # Tooltip del gráfico semanal
+        "weekly_hover_tooltip": "{day}\nMonto: ${amount:.2f}\nDestino: {destination}\nAcumulado: ${running:.2f}",
+        
+        # Distribución de resultados diarios
+        "distribution_tab": "📊 Distribución",
+        "distribution_title": "Distribución de Resultados Diarios",
+        "distribution_window_label": "Ventana:",
+        "distribution_window_weeks": "Últimas {weeks} semanas",
+        "distribution_window_all": "Todo el historial",
+        "distribution_mode_amount": "Monto ($)",
+        "distribution_mode_percent": "% del capital inicial",
+        "distribution_kde": "Curva KDE",
+        "distribution_days_axis": "Días",
+        "distribution_percent_axis": "Resultado (% del capital inicial)",
+        "distribution_stats": "{count} días · media {mean} · σ {std} · positivos {positive:.0f}%",
+        
+        # Gráfico de drawdown
+        "drawdown_title": "Drawdown: actual {current:.1f}% · máximo {worst:.1f}% · racha más larga {weeks} semanas bajo el máximo",
+        "drawdown_axis": "Caída (%)",
+        
+        # Exportación de gráficos por lotes
+        "export_week_charts": "🖼️ Exportar gráficos de todas las semanas...",
+        "status_export_week_charts": "Guardar el gráfico de cada semana guardada como imagen (PNG/SVG) con un índice",
+        "chart_export_format_prompt": "Formato de imagen:",
+        "chart_export_range_prompt": "Semanas a exportar:",
+        "chart_export_range_all": "Todas las semanas guardadas",
+        "chart_export_range_year": "Año actual",
+        "chart_export_range_52": "Últimas 52 semanas",
+        "chart_export_running": "Exportando gráficos semanales...",
+        "chart_export_done_status": "Gráficos semanales exportados",
+        "chart_export_result": "{exported} de {total} gráficos exportados ({failed} con error).\nÍndice: {index}",
+        "chart_export_index_title": "Gráficos semanales",
+        "chart_export_week": "Semana",
+        "chart_export_failed": "Error al exportar",
+        
+        # Carga diferida de gráficos
+        "chart_loading": "Cargando gráfico...",
+        
+        # Selector de motor del gráfico de historial
+        "chart_backend_label": "Motor del gráfico:",
+        "chart_backend_auto": "Automático",
+        
+        # Análisis semanal (AIAnalyzer)
+        "analysis_summary_excellent": "🚀 ¡Excelente semana! Rendimiento superior al 20%.",
+        "analysis_summary_good": "📈 Buena semana con rendimiento positivo sólido.",
+        "analysis_summary_positive": "✅ Semana positiva con ganancias consistentes.",
+        "analysis_summary_neutral": "➖ Semana neutral sin ganancias ni pérdidas significativas.",
+        "analysis_summary_hard": "📉 Semana difícil con pérdidas significativas.",
+        "analysis_summary_moderate_loss": "⚠️ Semana con pérdidas moderadas.",
+        "analysis_consistency_great": "Gran consistencia con 4+ días positivos.",
+        "analysis_consistency_good": "Buena consistencia con mayoría de días positivos.",
+        "analysis_consistency_bad": "Varios días negativos - revisa tu estrategia.",
+        "analysis_reinvest_positive": "Tus días de reinversión están generando resultados positivos.",
+        "analysis_reinvest_negative": "Considera revisar tu estrategia de reinversión.",
+        "analysis_best_worst": "Mejor día: {best} (${best_amount:.2f}); peor día: {worst} (${worst_amount:.2f}).",
+        "analysis_concentration": "El {share:.0f}% de las ganancias vino de {day}: el resultado depende de un solo día.",
+        "analysis_vs_history_above": "Semana por encima de tu media histórica ({week:+.2f}% vs {mean:+.2f}% semanal).",
+        "analysis_vs_history_below": "Semana por debajo de tu media histórica ({week:+.2f}% vs {mean:+.2f}% semanal).",
+        "analysis_vs_history_unusual": "Resultado atípico: {z:.1f} desviaciones respecto a tu semana habitual.",
+        "analysis_streak_win": "Llevas una racha de {n} días positivos seguidos.",
+        "analysis_streak_loss": "Llevas una racha de {n} días negativos seguidos.",
+        "analysis_in_drawdown": "Tu capital está un {dd:.1f}% por debajo de su máximo histórico.",
+        "analysis_rec_reduce_size": "Considera reducir el tamaño de tus operaciones temporalmente.",
+        "analysis_rec_review": "Revisa y ajusta tu estrategia antes de continuar.",
+        "analysis_rec_volatility": "La variabilidad de esta semana es alta: reduce exposición hasta estabilizar.",
+        "analysis_rec_profit_factor": "Tu profit factor histórico es menor que 1: las pérdidas superan a las ganancias.",
+        "analysis_rec_keep": "Mantén tu estrategia actual - está funcionando bien.",
+        "analysis_rec_protect": "No te confíes demasiado tras semanas ganadoras: protege lo ganado.",
+        "analysis_rec_journal": "Asegúrate de mantener un diario de trading.",
+        "analysis_rec_drawdown": "Prioriza recuperar el máximo de capital antes de aumentar el riesgo.",
+        "analysis_weekday_worst": "Históricamente {day} es tu peor día: media ${mean:.2f}, acierto {hit:.0f}% en {n} operaciones.",
+        "analysis_weekday_best": "Históricamente {day} es tu mejor día: aporta el {share:.0f}% del resultado total.",
+        "analysis_rec_stop_day": "Considera dejar de operar los {day}: su media histórica es negativa.",
+        "analysis_risk_high": "Alto riesgo detectado - considera ajustar tu gestión de riesgo.",
+        "analysis_risk_moderate": "Riesgo moderado - monitorea de cerca tus operaciones.",
+        "analysis_risk_low": "Riesgo controlado - buena gestión de riesgo.",
+        
+        # Consejo del día (reglas) y resumen semanal
+        "advice_monday_1": "Arranca la semana con foco y energía 💪. Define 1-2 objetivos reales y planifica tus operaciones clave.",
+        "advice_monday_2": "• Revisa capital y riesgos antes de operar.",
+        "advice_monday_3": "• Calidad sobre cantidad: evita sobreoperar.",
+        "advice_monday_4": "• Buen inicio, disciplina y pasos firmes 🚀",
+        "advice_monday_5": "• Si el inicio es flojo, sé selectivo y reduce tamaño 🧠",
+        "advice_tuesday_1": "Consolida el momentum: busca confirmaciones, no persigas entradas tardías.",
+        "advice_tuesday_2": "• Ajusta stops a estructura real, no a números redondos.",
+        "advice_tuesday_3": "• Protege ganancias y cuida tu ventaja 🎯",
+        "advice_tuesday_4": "• Minimiza pérdidas y espera setups A+ 🧩",
+        "advice_wednesday_1": "Mitad de semana: evalúa progreso y ajusta el rumbo.",
+        "advice_wednesday_2": "• Vas bien: evita el exceso de confianza.",
+        "advice_wednesday_3": "• Vas por debajo: simplifica y baja exposición.",
+        "advice_wednesday_4": "• Hoy es día de reinversión: lo que ganes vuelve al capital.",
+        "advice_wednesday_5": "• Recuerda: consistencia > perfección ✅",
+        "advice_thursday_1": "Prepara el cierre semanal. Sé selectivo y evita forzar trades.",
+        "advice_thursday_2": "• Prioriza setups con confluencias claras.",
+        "advice_thursday_3": "• No persigas recuperaciones a última hora.",
+        "advice_thursday_4": "• Mantén la mente fría: el viernes debe encontrarte listo 🧊",
+        "advice_friday_1": "Cierra la semana con cabeza fría.",
+        "advice_friday_2": "• Documenta aprendizajes clave para el sábado.",
+        "advice_friday_3": "• No arriesgues ganancias consolidadas: ya llevas ${total:.2f}.",
+        "advice_friday_4": "• No intentes recuperar toda la semana en un día.",
+        "advice_friday_5": "• Termina fuerte y sin ansiedad 🏁",
+        "advice_saturday_1": "Día de promedio semanal y retiros.",
+        "advice_saturday_2": "• Resultado semanal: ${total:.2f}.",
+        "advice_saturday_3": "• Retiro recomendado: ${withdraw:.2f} ({rate_label} de las ganancias).",
+        "advice_saturday_4": "• Reinversión sugerida: ${reinvest:.2f}.",
+        "advice_saturday_5": "• ¡Semana ganadora! Felicitaciones 👏",
+        "advice_saturday_6": "• Semana en rojo: revisa, aprende y ajusta 📘",
+        "advice_saturday_7": "• Celebra el proceso: progreso sostenido > impulsos 🔁",
+        "advice_sunday_1": "Descansa y prepara la estrategia de la próxima semana.",
+        "advice_sunday_2": "• Revisa diarios y marcas clave.",
+        "advice_sunday_3": "• Planifica escenarios y tus límites.",
+        "advice_sunday_4": "• Recarga la mente: claridad trae oportunidades 🌤️",
+        "advice_weekday_1": "• Históricamente los {day} rindes en media ${day_mean:.2f} con un {day_hit:.0f}% de acierto.",
+        "advice_streak_win_1": "• Llevas {streak} días positivos seguidos: no subas el tamaño por euforia 🧘",
+        "advice_streak_loss_1": "• Llevas {streak} días negativos seguidos: haz una pausa y reduce tamaño ✋",
+        "advice_drawdown_deep_1": "• Tu capital está un {drawdown:.1f}% bajo su máximo: prioriza preservar capital 🛡️",
+        "advice_drawdown_mild_1": "• Estás un {drawdown:.1f}% bajo tu máximo: opera con disciplina para recuperarlo.",
+        "weekly_summary_headline_up": "¡Semana de ganancias! 🎉",
+        "weekly_summary_headline_down": "Semana desafiante 💡",
+        "weekly_summary_body": "{headline}\n\nCapital inicial: ${initial:.2f}\nBalance actual: ${balance:.2f}\nResultado semanal: ${total:.2f} ({percentage:.2f}%)\n\nRetiro recomendado ({rate_label}): ${withdraw:.2f}\nReinversión sugerida: ${reinvest:.2f}\n\nConsejo: documenta tus mejores y peores operaciones para aprender rápido."
     },
     "en": {
         # Window titles
@@ -400,7 +592,199 @@ TRANSLATIONS = {
         "confirm_delete_week_message": "Do you want to delete the selected week?",
         "week_label": "Week",
         "delete_success": "Week deleted successfully",
-        "delete_error": "Error deleting week"
+        "delete_error": "Error deleting week",
+        
+        # Capital projection
+        "weekly_chart_tab": "📊 Week",
+        "projection_tab": "🔮 Projection",
+        "projection_title": "Capital projection (Monte Carlo)",
+        "projection_weeks_label": "Weeks to project:",
+        "projection_run": "Run projection",
+        "projection_weeks_axis": "Weeks",
+        "projection_loss_probability": "Probability of ending below current capital:",
+        
+        # Risk metrics
+        "risk_metrics_title": "📉 Risk metrics (history)",
+        "risk_max_drawdown": "Max drawdown:",
+        "risk_current_drawdown": "Current drawdown:",
+        "risk_drawdown_duration": "Longest time under peak:",
+        "risk_rolling_returns": "4/13/52-week return:",
+        "risk_volatility": "Annualized volatility:",
+        "risk_sharpe": "Sharpe:",
+        "risk_sortino": "Sortino:",
+        "risk_win_rate": "Daily win rate:",
+        "risk_profit_factor": "Profit factor:",
+        "risk_streak": "Current streak:",
+        "risk_max_streaks": "Best / worst streak:",
+        "risk_weeks_unit": "wks",
+        "risk_days_unit": "days",
+        "not_available": "n/a",
+        
+        # Anomaly detection
+        "anomaly_warning": "Unusual amounts (typo?):",
+        "anomaly_tooltip": "Unusual amount for this day: {score:.1f} deviations from typical",
+        
+        # Forecast
+        "forecast_title": "Forecast (90% range)",
+        "forecast_next_day": "Next day:",
+        "forecast_next_week": "Next 5 days:",
+        
+        # Weekly regimes
+        "regime_current": "Week type: {regime} ({weeks} similar weeks)",
+        "regime_steady_gain": "steady gain",
+        "regime_volatile_gain": "volatile gain",
+        "regime_flat": "flat",
+        "regime_volatile_loss": "volatile loss",
+        
+        # Batch analysis
+        "batch_analysis": "📚 Analyze all weeks",
+        "status_batch_analysis": "Analyze every saved week (only the ones that changed)",
+        "batch_analysis_running": "Analyzing saved weeks...",
+        "batch_analysis_done": "Batch analysis completed",
+        "batch_analysis_result": "Weeks in database: {total}\nAnalyzed: {analyzed}\nUnchanged (skipped): {skipped}",
+        
+        # Balance history
+        "history_tab": "📈 History",
+        "history_title": "Cumulative balance history",
+        "history_date_axis": "Date",
+        "history_lod_info": "Level of detail: {level} · {points} of {total} points",
+        "history_empty": "No saved weeks",
+        "lod_day": "day",
+        "lod_week": "week",
+        "lod_month": "month",
+        
+        # Calendar heatmap
+        "heatmap_tab": "🗓️ Calendar",
+        "heatmap_title": "Daily result calendar",
+        "heatmap_years_label": "Years:",
+        "heatmap_no_data": "no data",
+        
+        # Render cache
+        "render_cache_status": "Chart cache: {entries} images, {used:.1f} of {limit:.0f} MB ({hit_rate:.0f}% hits)",
+        
+        # Chart backends
+        "lod_auto": "automatic",
+        
+        # Weekly chart tooltip
+        "weekly_hover_tooltip": "{day}\nAmount: ${amount:.2f}\nDestination: {destination}\nRunning total: ${running:.2f}",
+        
+        # Daily result distribution
+        "distribution_tab": "📊 Distribution",
+        "distribution_title": "Daily Result Distribution",
+        "distribution_window_label": "Window:",
+        "distribution_window_weeks": "Last {weeks} weeks",
+        "distribution_window_all": "Full history",
+        "distribution_mode_amount": "Amount ($)",
+        "distribution_mode_percent": "% of initial capital",
+        "distribution_kde": "KDE curve",
+        "distribution_days_axis": "Days",
+        "distribution_percent_axis": "Result (% of initial capital)",
+        "distribution_stats": "{count} days · mean {mean} · σ {std} · positive {positive:.0f}%",
+        
+        # Drawdown chart
+        "drawdown_title": "Drawdown: current {current:.1f}% · max {worst:.1f}% · longest {weeks} weeks below peak",
+        "drawdown_axis": "Decline (%)",
+        
+        # Batch chart export
+        "export_week_charts": "🖼️ Export charts of all weeks...",
+        "status_export_week_charts": "Save every stored week's chart as an image (PNG/SVG) with an index",
+        "chart_export_format_prompt": "Image format:",
+        "chart_export_range_prompt": "Weeks to export:",
+        "chart_export_range_all": "All stored weeks",
+        "chart_export_range_year": "Current year",
+        "chart_export_range_52": "Last 52 weeks",
+        "chart_export_running": "Exporting weekly charts...",
+        "chart_export_done_status": "Weekly charts exported",
+        "chart_export_result": "{exported} of {total} charts exported ({failed} failed).\nIndex: {index}",
+        "chart_export_index_title": "Weekly charts",
+        "chart_export_week": "Week",
+        "chart_export_failed": "Export failed",
+        
+        # Lazy chart loading
+        "chart_loading": "Loading chart...",
+        
+        # History chart backend selector
+        "chart_backend_label": "Chart engine:",
+        "chart_backend_auto": "Automatic",
+        
+        # Weekly analysis (AIAnalyzer)
+        "analysis_summary_excellent": "🚀 Excellent week! Performance above 20%.",
+        "analysis_summary_good": "📈 Good week with solid positive performance.",
+        "analysis_summary_positive": "✅ Positive week with consistent gains.",
+        "analysis_summary_neutral": "➖ Neutral week with no significant gains or losses.",
+        "analysis_summary_hard": "📉 Tough week with significant losses.",
+        "analysis_summary_moderate_loss": "⚠️ Week with moderate losses.",
+        "analysis_consistency_great": "Great consistency with 4+ positive days.",
+        "analysis_consistency_good": "Good consistency with most days positive.",
+        "analysis_consistency_bad": "Several negative days - review your strategy.",
+        "analysis_reinvest_positive": "Your reinvestment days are producing positive results.",
+        "analysis_reinvest_negative": "Consider reviewing your reinvestment strategy.",
+        "analysis_best_worst": "Best day: {best} (${best_amount:.2f}); worst day: {worst} (${worst_amount:.2f}).",
+        "analysis_concentration": "{share:.0f}% of gains came from {day}: the result depends on a single day.",
+        "analysis_vs_history_above": "Week above your historical average ({week:+.2f}% vs {mean:+.2f}% weekly).",
+        "analysis_vs_history_below": "Week below your historical average ({week:+.2f}% vs {mean:+.2f}% weekly).",
+        "analysis_vs_history_unusual": "Unusual result: {z:.1f} standard deviations from your typical week.",
+        "analysis_streak_win": "You are on a streak of {n} positive days in a row.",
+        "analysis_streak_loss": "You are on a streak of {n} negative days in a row.",
+        "analysis_in_drawdown": "Your capital is {dd:.1f}% below its historical peak.",
+        "analysis_rec_reduce_size": "Consider reducing your position size temporarily.",
+        "analysis_rec_review": "Review and adjust your strategy before continuing.",
+        "analysis_rec_volatility": "This week's variability is high: cut exposure until it stabilizes.",
+        "analysis_rec_profit_factor": "Your historical profit factor is below 1: losses outweigh gains.",
+        "analysis_rec_keep": "Keep your current strategy - it is working well.",
+        "analysis_rec_protect": "Don't get overconfident after winning weeks: protect your gains.",
+        "analysis_rec_journal": "Make sure you keep a trading journal.",
+        "analysis_rec_drawdown": "Prioritize recovering your capital peak before increasing risk.",
+        "analysis_weekday_worst": "Historically {day} is your worst day: mean ${mean:.2f}, {hit:.0f}% hit rate over {n} trades.",
+        "analysis_weekday_best": "Historically {day} is your best day: it contributes {share:.0f}% of the total result.",
+        "analysis_rec_stop_day": "Consider not trading on {day}: its historical mean is negative.",
+        "analysis_risk_high": "High risk detected - consider adjusting your risk management.",
+        "analysis_risk_moderate": "Moderate risk - monitor your trades closely.",
+        "analysis_risk_low": "Controlled risk - good risk management.",
+        
+        # Daily advice (rules) and weekly summary
+        "advice_monday_1": "Kick off the week with focus and energy 💪. Set 1–2 realistic goals and plan core trades.",
+        "advice_monday_2": "• Review capital and risks before trading.",
+        "advice_monday_3": "• Quality over quantity: avoid overtrading.",
+        "advice_monday_4": "• Strong start—discipline and steady steps 🚀",
+        "advice_monday_5": "• If the start is weak, be selective and cut size 🧠",
+        "advice_tuesday_1": "Consolidate momentum: seek confirmations, avoid chasing late entries.",
+        "advice_tuesday_2": "• Set stops to real structure, not round numbers.",
+        "advice_tuesday_3": "• Protect gains and guard your edge 🎯",
+        "advice_tuesday_4": "• Minimize losses and wait for A+ setups 🧩",
+        "advice_wednesday_1": "Midweek: assess progress and adjust course.",
+        "advice_wednesday_2": "• You’re doing well: avoid overconfidence.",
+        "advice_wednesday_3": "• You’re behind: simplify and reduce exposure.",
+        "advice_wednesday_4": "• Today is a reinvestment day: what you earn goes back into capital.",
+        "advice_wednesday_5": "• Remember: consistency > perfection ✅",
+        "advice_thursday_1": "Prepare the weekly close. Be selective and avoid forcing trades.",
+        "advice_thursday_2": "• Prioritize setups with clear confluences.",
+        "advice_thursday_3": "• Don’t chase last-minute recoveries.",
+        "advice_thursday_4": "• Keep a cool head: be ready for Friday 🧊",
+        "advice_friday_1": "Close the week with a cool head.",
+        "advice_friday_2": "• Document key learnings for Saturday.",
+        "advice_friday_3": "• Don’t risk consolidated gains: you are up ${total:.2f}.",
+        "advice_friday_4": "• Don’t try to recover the whole week in a single day.",
+        "advice_friday_5": "• Finish strong, without anxiety 🏁",
+        "advice_saturday_1": "Weekly average and withdrawals day.",
+        "advice_saturday_2": "• Weekly result: ${total:.2f}.",
+        "advice_saturday_3": "• Recommended withdrawal: ${withdraw:.2f} ({rate_label} of gains).",
+        "advice_saturday_4": "• Suggested reinvestment: ${reinvest:.2f}.",
+        "advice_saturday_5": "• Winning week! Congrats 👏",
+        "advice_saturday_6": "• Red week: review, learn, and adjust 📘",
+        "advice_saturday_7": "• Celebrate the process: sustained progress > impulses 🔁",
+        "advice_sunday_1": "Rest and prepare next week's strategy.",
+        "advice_sunday_2": "• Review journals and key levels.",
+        "advice_sunday_3": "• Plan scenarios and your limits.",
+        "advice_sunday_4": "• Reset your mind: clarity brings opportunities 🌤️",
+        "advice_weekday_1": "• Historically on {day} you average ${day_mean:.2f} with a {day_hit:.0f}% hit rate.",
+        "advice_streak_win_1": "• {streak} positive days in a row: don’t size up out of euphoria 🧘",
+        "advice_streak_loss_1": "• {streak} negative days in a row: take a pause and cut size ✋",
+        "advice_drawdown_deep_1": "• Your capital is {drawdown:.1f}% below its peak: prioritize preserving it 🛡️",
+        "advice_drawdown_mild_1": "• You are {drawdown:.1f}% below your peak: trade with discipline to recover it.",
+        "weekly_summary_headline_up": "Profitable week! 🎉",
+        "weekly_summary_headline_down": "Challenging week 💡",
+        "weekly_summary_body": "{headline}\n\nInitial capital: ${initial:.2f}\nCurrent balance: ${balance:.2f}\nWeekly result: ${total:.2f} ({percentage:.2f}%)\n\nRecommended withdrawal ({rate_label}): ${withdraw:.2f}\nSuggested reinvestment: ${reinvest:.2f}\n\nTip: document your best and worst trades to learn faster."
     }
 }
 
@@ -413,9 +797,9 @@ def set_language(lang):
     if lang in TRANSLATIONS:
         current_language = lang
 
-def tr(key, default=None):
-    """Obtener traducción para una clave"""
-    return TRANSLATIONS[current_language].get(key, default or key)
+def tr(key, default=None, language=None):
+    """Obtener traducción para una clave (en language si se indica, sin cambiar el idioma actual)"""
+    return TRANSLATIONS[language or current_language].get(key, default or key)
 
 def get_available_languages():
     """Obtener lista de idiomas disponibles"""
@@ -0,0 +1,56 @@
+"""
+Formato de métricas de riesgo para el panel de resumen y las exportaciones
+"""
+
+from typing import Dict, List, Tuple
+from .i18n import tr
+
+
+def _pct(value) -> str:
+    return tr('not_available') if value is None else f"{value * 100:.2f}%"
+
+
+def _num(value) -> str:
+    return tr('not_available') if value is None else f"{value:.2f}"
+
+
+def risk_metric_rows(metrics: Dict) -> List[Tuple[str, str]]:
+    """Filas (etiqueta traducida, valor formateado) con las métricas de riesgo"""
+    if not metrics:
+        return []
+    rolling = metrics.get('rolling_returns', {})
+    streak = metrics.get('current_streak', 0)
+    return [
+        (tr('risk_max_drawdown'), _pct(metrics.get('max_drawdown'))),
+        (tr('risk_current_drawdown'), _pct(metrics.get('current_drawdown'))),
+        (tr('risk_drawdown_duration'), f"{metrics.get('max_drawdown_duration', 0)} {tr('risk_weeks_unit')}"),
+        (tr('risk_rolling_returns'), " / ".join(_pct(rolling.get(w)) for w in (4, 13, 52))),
+        (tr('risk_volatility'), _pct(metrics.get('annualized_volatility'))),
+        (tr('risk_sharpe'), _num(metrics.get('sharpe'))),
+        (tr('risk_sortino'), _num(metrics.get('sortino'))),
+        (tr('risk_win_rate'), _pct(metrics.get('win_rate'))),
+        (tr('risk_profit_factor'), _num(metrics.get('profit_factor'))),
+        (tr('risk_streak'), f"{'+' if streak > 0 else ''}{streak} {tr('risk_days_unit')}"),
+        (tr('risk_max_streaks'), f"+{metrics.get('max_win_streak', 0)} / -{metrics.get('max_loss_streak', 0)}"),
+    ]
+
+
+def forecast_rows(forecast: Dict) -> List[Tuple[str, str]]:
+    """Filas (etiqueta traducida, rango) con el pronóstico del próximo día y semana"""
+    if not forecast or not forecast.get('observations'):
+        return []
+
+    def _range(values: Dict) -> str:
+        return f"${values['mean']:+.2f} ({values['low']:+.2f} … {values['high']:+.2f})"
+
+    return [
+        (tr('forecast_next_day'), _range(forecast['next_day'])),
+        (tr('forecast_next_week'), _range(forecast['next_week'])),
+    ]
+
+
+def regime_text(regime: Dict) -> str:
+    """Descripción traducida del régimen de la semana en curso"""
+    if not regime:
+        return ""
+    return tr('regime_current').format(regime=tr(regime['regime']), weeks=regime['weeks_in_regime'])
@@ -0,0 +1,64 @@
+"""
+Comprobación rápida de los backends de series temporales
+Crea cada backend disponible sin pantalla, carga una serie, simula el ratón
+sobre el punto central y comprueba que el hover devuelve esa fecha.
+
+Uso (desde la raíz del proyecto):
+    python tools/chart_backends_smoke.py
+"""
+
+import os
+import sys
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from PyQt5.QtCore import QPointF
+from PyQt5.QtWidgets import QApplication
+
+from src.ui.chart_backends import HAS_PYQTGRAPH, PyqtgraphSeriesBackend, create_series_backend
+
+
+def hover_point(backend, i: int):
+    """Simular el movimiento del ratón sobre el punto i de la serie"""
+    if isinstance(backend, PyqtgraphSeriesBackend):
+        position = backend.plot.getViewBox().mapViewToScene(QPointF(backend.x[i], backend.values[i]))
+        backend._on_mouse_moved((position,))
+        return
+    from matplotlib.backend_bases import MouseEvent
+    x = backend.levels['day'][0][i]
+    px, py = backend.ax.transData.transform((x, backend.values[i]))
+    backend._on_motion(MouseEvent('motion_notify_event', backend.canvas, px, py))
+
+
+def smoke_check(app: QApplication, name: str, n_points: int = 3000) -> bool:
+    """Crear el backend, cargar una serie y comprobar el hover sobre el punto central"""
+    hovered = []
+    backend = create_series_backend(name, on_hover=lambda date, value: hovered.append((date, value)))
+    dates = np.datetime64('2015-01-05') + np.arange(n_points)
+    values = np.cumsum(np.linspace(-1.0, 1.0, n_points))
+    backend.set_series(dates, values)
+    backend.apply_style('smoke', 'x', 'y', False)
+    widget = backend.widget()
+    widget.resize(800, 400)
+    widget.show()
+    app.processEvents()
+    i = n_points // 2
+    hover_point(backend, i)
+    widget.close()
+    ok = backend.dates.size == n_points and bool(hovered) and hovered[-1][0] == dates[i]
+    print(f"{name}: {'OK' if ok else 'ERROR'} ({n_points} puntos, hover={hovered[-1] if hovered else None})")
+    return ok
+
+
+def main() -> int:
+    app = QApplication.instance() or QApplication(sys.argv)
+    names = ['matplotlib'] + (['pyqtgraph'] if HAS_PYQTGRAPH else [])
+    if not HAS_PYQTGRAPH:
+        print("pyqtgraph no está instalado: se omite su comprobación")
+    return 0 if all([smoke_check(app, name) for name in names]) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())